@@ -2,6 +2,8 @@ from django.contrib.auth.models import User
 
 from rest_framework import serializers
 
+from kanban_app.timing import TimedSerializerMixin
+
 from .validators import validate_passwords, validate_unique_email
 from .services import create_new_user
 
@@ -9,7 +11,7 @@ from .services import create_new_user
 """
     This class defines a serializer for user registration with fields for fullname, email, password, and repeated password, along with validation and saving methods.
     """
-class UserRegistrationSerializer(serializers.ModelSerializer):
+class UserRegistrationSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     fullname = serializers.CharField(max_length=255)
     repeated_password = serializers.CharField(write_only=True)
     class Meta: 
@@ -34,6 +36,6 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 """
     The class `UserLoginSerializer` defines a serializer for user login data with fields for email and password.
     """
-class UserLoginSerializer(serializers.Serializer):
+class UserLoginSerializer(TimedSerializerMixin, serializers.Serializer):
     email = serializers.EmailField()
     password = serializers.CharField(write_only=True)
\ No newline at end of file
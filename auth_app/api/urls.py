@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import UserRegistrationView, UserLoginView
+from .views import UserRegistrationView, UserLoginView, TokenCacheStatsView
 
 urlpatterns = [
     path('registration/', UserRegistrationView.as_view(), name='user_registration'),
-    path('login/', UserLoginView.as_view(), name='user_login')
+    path('login/', UserLoginView.as_view(), name='user_login'),
+    path('token-cache/stats/', TokenCacheStatsView.as_view(), name='token_cache_stats'),
 ]
\ No newline at end of file
@@ -1,18 +1,21 @@
 from rest_framework import status
 from rest_framework.views import APIView
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
 from rest_framework.authtoken.views import ObtainAuthToken
 
+from kanban_app.timing import TimedViewMixin
+
 from .serializers import UserRegistrationSerializer, UserLoginSerializer
 from .services import authenticate_user_by_email
+from .authentication import token_cache
 
 
 """ 
 The `UserRegistrationView` class handles user registration requests by validating user input, creating a new user instance, generating an authentication token, and returning relevant user data or error messages.
 """
-class UserRegistrationView(APIView):
+class UserRegistrationView(TimedViewMixin, APIView):
     permission_classes = [AllowAny]
     def post(self, request):
         serializer = UserRegistrationSerializer(data=request.data)
@@ -29,7 +32,7 @@ class UserRegistrationView(APIView):
 """
 The `UserLoginView` class handles user authentication by validating login credentials and gets the generated a token for the authenticated user.
 """
-class UserLoginView(ObtainAuthToken): 
+class UserLoginView(TimedViewMixin, ObtainAuthToken): 
     permission_classes = [AllowAny]
     def post(self, request):
         serializer = UserLoginSerializer(data=request.data)
@@ -43,4 +46,12 @@ class UserLoginView(ObtainAuthToken):
         token, _ = Token.objects.get_or_create(user=user)
         data = {'token': token.key, 'fullname': user.username, 'email': user.email, 'user_id': user.id}
         return Response(data, status=status.HTTP_200_OK)
-        
\ No newline at end of file
+
+
+"""
+The `TokenCacheStatsView` class shows the size, hits, misses, evictions and hit rate of the token cache of this process to staff users, so the size and TTL of the cache can be tuned.
+"""
+class TokenCacheStatsView(TimedViewMixin, APIView):
+    permission_classes = [IsAdminUser]
+    def get(self, request):
+        return Response(token_cache.stats(), status=status.HTTP_200_OK)
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+"""
+The `EMAIL_INDEX` is the index on the email column of the user table. The user model belongs to `django.contrib.auth`, so the index cannot be declared in its Meta and is created by the schema editor, which writes the statements for every database (f.e. `DROP INDEX ... ON auth_user` on MySQL).
+"""
+EMAIL_INDEX = models.Index(fields=['email'], name='auth_user_email_idx')
+
+
+def add_email_index(apps, schema_editor):
+    schema_editor.add_index(apps.get_model('auth', 'User'), EMAIL_INDEX)
+
+
+def remove_email_index(apps, schema_editor):
+    schema_editor.remove_index(apps.get_model('auth', 'User'), EMAIL_INDEX)
+
+
+class Migration(migrations.Migration):
+    """
+    Users are looked up by their email address at the login, the registration and the email check, so the email column of the user table gets an index.
+    """
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_email_index, remove_email_index),
+    ]
@@ -0,0 +1,58 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_init, post_save
+
+from rest_framework.authtoken.models import Token
+
+from .api.authentication import token_cache
+
+
+"""
+The signal handler `invalidate_cached_token` removes a token from the `token_cache` when it was deleted or saved with a new key.
+"""
+def invalidate_cached_token(sender, instance, **kwargs):
+    token_cache.invalidate(instance.key)
+
+
+"""
+The `CREDENTIAL_FIELDS` are the fields of a user which decide whether the cached tokens of the user are still valid.
+"""
+CREDENTIAL_FIELDS = ('is_active', 'password')
+
+
+"""
+The signal handler `remember_loaded_credentials` stores the credential fields of a user when it is loaded, so `invalidate_cached_user` can tell whether they changed. Fields which were not loaded are stored as None and count as changed.
+"""
+def remember_loaded_credentials(sender, instance, **kwargs):
+    instance._loaded_credentials = tuple(instance.__dict__.get(field) for field in CREDENTIAL_FIELDS)
+
+
+"""
+The signal handler `invalidate_cached_user` removes all cached tokens of a user when the user was deleted or saved with a changed `is_active` or password. Other saves, f.e. of `last_login` on every login, keep the tokens.
+"""
+def invalidate_cached_user(sender, instance, created=False, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields is not None and not set(update_fields) & set(CREDENTIAL_FIELDS):
+        return
+    credentials = tuple(instance.__dict__.get(field) for field in CREDENTIAL_FIELDS)
+    if getattr(instance, '_loaded_credentials', None) != credentials:
+        token_cache.invalidate_user(instance.pk)
+    instance._loaded_credentials = credentials
+
+
+"""
+The signal handler `invalidate_deleted_user` removes all cached tokens of a deleted user.
+"""
+def invalidate_deleted_user(sender, instance, **kwargs):
+    token_cache.invalidate_user(instance.pk)
+
+
+"""
+The function `connect_token_cache_signals` connects all signal handlers for the token cache. It is called when the app is ready.
+"""
+def connect_token_cache_signals():
+    post_save.connect(invalidate_cached_token, sender=Token, dispatch_uid='token_cache_token_save')
+    post_delete.connect(invalidate_cached_token, sender=Token, dispatch_uid='token_cache_token_delete')
+    post_init.connect(remember_loaded_credentials, sender=User, dispatch_uid='token_cache_user_init')
+    post_save.connect(invalidate_cached_user, sender=User, dispatch_uid='token_cache_user_save')
+    post_delete.connect(invalidate_deleted_user, sender=User, dispatch_uid='token_cache_user_delete')
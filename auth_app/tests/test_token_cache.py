@@ -0,0 +1,98 @@
+from unittest import mock
+
+from django.contrib.auth.models import User, update_last_login
+from django.test import SimpleTestCase, TestCase
+
+from rest_framework.authtoken.models import Token
+
+from auth_app.api.authentication import CachedTokenAuthentication, TokenCache, token_cache
+
+
+"""
+The `TokenCacheTests` class checks the LRU bound, the TTL and the counters of the `TokenCache`.
+"""
+class TokenCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.users = [User(pk=pk, username=f'user-{pk}') for pk in range(1, 4)]
+
+    def test_least_recently_used_token_is_evicted(self):
+        cache = TokenCache(max_size=2, ttl=60)
+        cache.set('a', self.users[0], 'token-a')
+        cache.set('b', self.users[1], 'token-b')
+        cache.get('a')
+        cache.set('c', self.users[2], 'token-c')
+        self.assertEqual(list(cache.entries), ['a', 'c'])
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.keys_by_user, {1: {'a'}, 3: {'c'}})
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_token_expires_after_the_ttl(self):
+        cache = TokenCache(max_size=2, ttl=60)
+        with mock.patch('auth_app.api.authentication.time.monotonic', return_value=1000):
+            cache.set('a', self.users[0], 'token-a')
+        with mock.patch('auth_app.api.authentication.time.monotonic', return_value=1059):
+            self.assertEqual(cache.get('a'), (self.users[0], 'token-a'))
+        with mock.patch('auth_app.api.authentication.time.monotonic', return_value=1060):
+            self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.entries, {})
+        self.assertEqual(cache.keys_by_user, {})
+
+    def test_hits_and_misses_are_counted(self):
+        cache = TokenCache(max_size=2, ttl=60)
+        cache.get('a')
+        cache.set('a', self.users[0], 'token-a')
+        cache.get('a')
+        cache.get('a')
+        stats = cache.stats()
+        self.assertEqual((stats['size'], stats['hits'], stats['misses']), (1, 2, 1))
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+
+
+"""
+The `TokenCacheInvalidationTests` class checks that the signal handlers in `auth_app/signals.py` remove the cached tokens of a deleted token, a deactivated, deleted or changed password user, and keep them for other changes of the user like a login.
+"""
+class TokenCacheInvalidationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='user', email='user@example.com')
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.get(pk=self.user.pk)
+        CachedTokenAuthentication().authenticate_credentials(self.token.key)
+
+    def assertCached(self, cached):
+        self.assertEqual(self.token.key in token_cache.entries, cached)
+
+    def test_deleted_token_is_evicted(self):
+        self.token.delete()
+        self.assertCached(False)
+
+    def test_deactivated_user_is_evicted(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertCached(False)
+
+    def test_deactivated_user_with_update_fields_is_evicted(self):
+        self.user.is_active = False
+        self.user.save(update_fields=['is_active'])
+        self.assertCached(False)
+
+    def test_changed_password_is_evicted(self):
+        self.user.set_password('new-password')
+        self.user.save()
+        self.assertCached(False)
+
+    def test_deleted_user_is_evicted(self):
+        self.user.delete()
+        self.assertCached(False)
+
+    def test_login_keeps_the_token(self):
+        update_last_login(None, self.user)
+        self.assertCached(True)
+
+    def test_other_changes_keep_the_token(self):
+        self.user.first_name = 'Name'
+        self.user.save()
+        self.assertCached(True)
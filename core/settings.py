@@ -45,6 +45,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'kanban_app.timing.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -135,6 +136,81 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ], 
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.api.authentication.CachedTokenAuthentication',
     ]
 }
+
+# Page sizes of the paginated task and comment lists (see `kanban_app/api/pagination.py`)
+
+KANBAN_PAGE_SIZE = 50
+
+KANBAN_MAX_PAGE_SIZE = 200
+
+# In-process cache of the token authentication (see `auth_app/api/authentication.py`)
+
+AUTH_TOKEN_CACHE_SIZE = 10000
+
+AUTH_TOKEN_CACHE_TTL = 300
+
+# Seconds a bulk email lookup is cached, including email addresses without a user
+
+EMAIL_LOOKUP_CACHE_TTL = 60
+
+# Delta sync of the boards (see `/api/boards/{board_id}/changes/`): seconds a sync goes back before the cursor to
+# catch changes committed shortly after the last sync, and days the tombstones of deleted tasks and comments are kept
+
+KANBAN_SYNC_OVERLAP = 5
+
+KANBAN_SYNC_RETENTION_DAYS = 30
+
+# Event streams of the boards (see `kanban_app/events.py`): the broker which fans out the events, the events which are
+# kept for a slow subscriber, the seconds between two heartbeats of an idle stream and the seconds a stream ticket
+# (see `/api/boards/{board_id}/events/ticket/`) is valid
+
+KANBAN_EVENT_BROKER = 'kanban_app.events.InProcessEventBroker'
+
+KANBAN_EVENT_QUEUE_SIZE = 100
+
+KANBAN_EVENT_HEARTBEAT = 15
+
+KANBAN_EVENT_TICKET_MAX_AGE = 60
+
+# Caches of the application. The `responses` cache stores the serialized responses of the board detail and the
+# task lists (see `kanban_app/response_cache.py`); MAX_ENTRIES bounds its size, a third of the entries is evicted
+# when it is full. It works with every backend, f.e. 'django.core.cache.backends.filebased.FileBasedCache' with a
+# directory as LOCATION to share it between the processes of one server.
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'responses': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'kanmind-responses',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+            'CULL_FREQUENCY': 3,
+        },
+    },
+}
+
+# Number of rows per record batch of the Arrow, Parquet and Lance exports (see `kanban_app/export.py`)
+
+KANBAN_EXPORT_CHUNK_SIZE = 10000
+
+# Page sizes of the columnar task history of a board (see `kanban_app/history.py`)
+
+KANBAN_HISTORY_PAGE_SIZE = 10000
+
+KANBAN_HISTORY_MAX_PAGE_SIZE = 100000
+
+# Number of tasks in the boards of a user up to which the filtered task list is sorted instead of read in the order of an index (see `filter_tasks` in `kanban_app/api/services.py`)
+
+KANBAN_TASK_LIST_SORT_LIMIT = 5000
+
+# A query shape which runs more often in one request is logged as warning by the `RequestTimingMiddleware` (see `kanban_app/timing.py`), or raises `RepeatedQueryError` in the strict mode for tests
+
+KANBAN_QUERY_REPEAT_LIMIT = 10
+
+KANBAN_QUERY_REPEAT_STRICT = False
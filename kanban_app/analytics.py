@@ -0,0 +1,99 @@
+import numpy as np
+from django.contrib.auth.models import User
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast, Coalesce
+
+from kanban_app.models import BoardTask, PRIORITY_CHOICES, STATUS_CHOICES
+
+
+"""
+    The function `load_task_columns` loads the columns of the tasks of a board with one query and returns them as NumPy arrays: the status, the priority, the due date, the day of the creation in UTC and the ids of the assignee and the reviewer. The dates are read as text and parsed by NumPy, and the missing values are replaced in the query (-1 for missing users, NaT for missing due dates), because converting every row to Python dates and datetimes takes most of the time on large boards.
+    """
+def load_task_columns(board_id):
+    rows = BoardTask.objects.filter(board_id=board_id).values_list(
+        'status',
+        'priority',
+        Coalesce(Cast('due_date', CharField()), Value('NaT')),
+        Cast('created_at', CharField()),
+        Coalesce('assignee_id', Value(-1)),
+        Coalesce('reviewer_id', Value(-1)),
+    )
+    statuses, priorities, due_dates, created_at, assignees, reviewers = list(zip(*rows)) or ([],) * 6
+    return {
+        'status': np.array(statuses, dtype=str),
+        'priority': np.array(priorities, dtype=str),
+        'due_date': np.array(due_dates, dtype='U10').astype('datetime64[D]'),
+        'created_on': np.array(created_at, dtype='U10').astype('datetime64[D]'),
+        'assignee': np.array(assignees, dtype=np.int64),
+        'reviewer': np.array(reviewers, dtype=np.int64),
+    }
+
+
+"""
+    The function `count_values` counts the values of a column. All choices are contained, values outside of the choices as well.
+    """
+def count_values(values, choices):
+    counts = {choice: 0 for choice, label in choices}
+    keys, key_counts = np.unique(values, return_counts=True)
+    counts.update({str(key): int(count) for key, count in zip(keys, key_counts)})
+    return counts
+
+
+"""
+    The function `count_per_week` counts the days per week, from the week of the first to the week of the last day. The weeks start on monday and are returned with the date of the monday.
+    """
+def count_per_week(days):
+    if not len(days):
+        return []
+    mondays = days - (days.astype(np.int64) + 3) % 7
+    first = mondays.min()
+    counts = np.bincount((mondays - first).astype(np.int64) // 7)
+    weeks = first + np.arange(len(counts)) * 7
+    return [{'week': str(week), 'count': int(count)} for week, count in zip(weeks, counts)]
+
+
+"""
+    The function `count_per_user` counts all, the open and the overdue tasks per assignee or reviewer. The tasks without user are not counted.
+    """
+def count_per_user(users, open_tasks, overdue_tasks):
+    assigned = users >= 0
+    ids, inverse = np.unique(users[assigned], return_inverse=True)
+    total = np.bincount(inverse, minlength=len(ids))
+    open_count = np.bincount(inverse, weights=open_tasks[assigned], minlength=len(ids))
+    overdue = np.bincount(inverse, weights=overdue_tasks[assigned], minlength=len(ids))
+    return [
+        {'user_id': int(pk), 'tasks': int(tasks), 'open': int(opened), 'overdue': int(late)}
+        for pk, tasks, opened, late in zip(ids, total, open_count, overdue)
+    ]
+
+
+"""
+    The function `compute_board_analytics` computes the metrics of a board from the columns of its tasks: the counts by status and priority, the open tasks which are overdue on the given day, the created tasks per week and the workload of the assignees and reviewers. The users of the workload are returned once in the lookup table `users`.
+    :param today: the date from which open tasks with an earlier due date are overdue
+    """
+def compute_board_analytics(board_id, today):
+    columns = load_task_columns(board_id)
+    open_tasks = columns['status'] != 'done'
+    overdue_tasks = open_tasks & (columns['due_date'] < np.datetime64(today, 'D'))
+    workload = {
+        'assignees': count_per_user(columns['assignee'], open_tasks, overdue_tasks),
+        'reviewers': count_per_user(columns['reviewer'], open_tasks, overdue_tasks),
+    }
+    user_ids = {entry['user_id'] for entries in workload.values() for entry in entries}
+    users = User.objects.filter(pk__in=user_ids).only('id', 'email', 'username') if user_ids else []
+    return {
+        'board': board_id,
+        'date': today.isoformat(),
+        'tasks': len(columns['status']),
+        'open': int(open_tasks.sum()),
+        'by_status': count_values(columns['status'], STATUS_CHOICES),
+        'by_priority': count_values(columns['priority'], PRIORITY_CHOICES),
+        'overdue': {
+            'tasks': int(overdue_tasks.sum()),
+            'by_priority': count_values(columns['priority'][overdue_tasks], PRIORITY_CHOICES),
+        },
+        'without_due_date': int(np.isnat(columns['due_date']).sum()),
+        'created_per_week': count_per_week(columns['created_on']),
+        'workload': workload,
+        'users': {user.id: {'email': user.email, 'fullname': user.username} for user in users},
+    }
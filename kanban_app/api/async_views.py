@@ -0,0 +1,146 @@
+from functools import wraps
+
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+
+from rest_framework import exceptions, status
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from auth_app.api.authentication import CachedTokenAuthentication
+from kanban_app.models import Board, BoardTask, TaskComment
+from kanban_app.response_cache import aget_task_list_version, response_cache
+from kanban_app.timing import timed
+from .conditional import etag_matches, make_etag
+from .pagination import KeysetPagination
+from .response_cache import get_board_detail_cache_key, get_task_list_cache_key
+from .read_serializers import BoardListRowSerializer, TaskListRowSerializer, serialize_board_detail, serialize_normalized_board_detail
+from .renderers import NormalizedJSONRenderer, get_board_detail_layout
+from .serializers import TaskCommentSerializer
+from .services import annotate_board_access, board_list_values, get_boards_of_user, task_list_values
+
+
+"""
+    The function `render` returns the data as JSON like the `JSONRenderer` of the sync views, or with the given renderer.
+    """
+@timed('serialize')
+def render(data, status_code=status.HTTP_200_OK, headers=None, renderer=None):
+    renderer = renderer or JSONRenderer()
+    return HttpResponse(renderer.render(data), status=status_code, content_type=renderer.media_type, headers=headers)
+
+
+"""
+    The decorator `async_api_view` turns an async function into a view for the async read path: the read-heavy GET endpoints of `views.py` are answered with the async ORM under `/api/async/`, so a request does not block a worker thread while it waits for the database under an ASGI server. The decorator authenticates the user with the DRF token like `IsAuthenticated`, only allows GET requests and converts the exceptions of the REST framework into their responses.
+    """
+def async_api_view(view):
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        authentication = CachedTokenAuthentication()
+        try:
+            if request.method != 'GET':
+                raise exceptions.MethodNotAllowed(request.method)
+            result = await authentication.aauthenticate(request)
+            if result is None:
+                raise exceptions.NotAuthenticated()
+            request.user = result[0]
+            return await view(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            headers = {'WWW-Authenticate': authentication.authenticate_header(request)} if exc.status_code == status.HTTP_401_UNAUTHORIZED else None
+            return render({'detail': exc.detail}, exc.status_code, headers)
+    return wrapper
+
+
+"""
+    The function `paginate` loads one page of the queryset with the `KeysetPagination` and returns the serialized page, or the whole list with `?paginate=false`.
+    """
+async def paginate(request, queryset, serializer_class):
+    drf_request = Request(request)
+    context = {'request': drf_request}
+    paginator = KeysetPagination()
+    page_queryset = paginator.get_page_queryset(queryset, drf_request)
+    if page_queryset is None:
+        return serializer_class([row async for row in queryset], many=True, context=context).data
+    page = paginator.set_page([row async for row in page_queryset])
+    return paginator.get_paginated_response(serializer_class(page, many=True, context=context).data).data
+
+
+"""
+The view `board_list` is the async version of the GET request of `BoardsView`.
+"""
+@async_api_view
+async def board_list(request):
+    rows = [row async for row in board_list_values(get_boards_of_user(request.user))]
+    return render(BoardListRowSerializer(rows, many=True).data)
+
+
+"""
+The view `board_detail` is the async version of the GET request of `BoardDetailView`. The version and the access of the user are checked with one query, the board is only loaded when the response is neither unchanged nor cached. The normalized board details are chosen like in the sync view.
+"""
+@async_api_view
+async def board_detail(request, pk):
+    renderer, _ = DefaultContentNegotiation().select_renderer(Request(request), [JSONRenderer(), NormalizedJSONRenderer()])
+    layout = get_board_detail_layout(renderer)
+    kind = 'board' if layout == 'nested' else 'board-normalized'
+    vary = {'Vary': 'Accept'}
+    access = await annotate_board_access(Board.objects.filter(pk=pk), request.user).values('version', 'owner_id', 'is_member').afirst()
+    if access is None:
+        raise exceptions.NotFound('No Board matches the given query.')
+    if not (access['owner_id'] == request.user.id or access['is_member']):
+        raise exceptions.PermissionDenied()
+    etag = make_etag(kind, pk, access['version'])
+    if etag_matches(request, etag):
+        return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag, **vary})
+    key = get_board_detail_cache_key(pk, access['version'], layout)
+    data = await response_cache.aget(key)
+    if data is None:
+        board = await Board.objects.only('id', 'title', 'owner_id', 'version').filter(pk=pk).afirst()
+        if board is None:
+            raise exceptions.NotFound('No Board matches the given query.')
+        members = [user async for user in User.objects.filter(boards__id=pk).only('id', 'username', 'email')]
+        tasks = [row async for row in task_list_values(BoardTask.objects.filter(board_id=pk).order_by('id'))]
+        serialize = serialize_board_detail if layout == 'nested' else serialize_normalized_board_detail
+        data = serialize(board, members, tasks)
+        await response_cache.aset(key, data)
+        etag = make_etag(kind, pk, board.version)
+    return render(data, headers={'ETag': etag, **vary}, renderer=renderer)
+
+
+"""
+    The function `task_list_response` returns the cached or loaded task list of the given kind for the async versions of `AssignedTaskListView` and `TaskReviewingListView`.
+    """
+async def task_list_response(request, kind, queryset):
+    user_id = request.user.id
+    key = get_task_list_cache_key(kind, user_id, await aget_task_list_version(user_id), request)
+    data = await response_cache.aget(key)
+    if data is None:
+        data = await paginate(request, task_list_values(queryset), TaskListRowSerializer)
+        await response_cache.aset(key, data)
+    return render(data)
+
+
+@async_api_view
+async def assigned_tasks(request):
+    return await task_list_response(request, 'assigned', BoardTask.objects.filter(assignee=request.user))
+
+
+@async_api_view
+async def reviewing_tasks(request):
+    return await task_list_response(request, 'reviewing', BoardTask.objects.filter(reviewer=request.user))
+
+
+"""
+The view `task_comment_list` is the async version of the GET request of `TaskCommentListView`. Like `IsBoardOfTaskMember` only the members of the board of the task get the comments.
+"""
+@async_api_view
+async def task_comment_list(request, task_id):
+    task = await BoardTask.objects.select_related('board').filter(pk=task_id).afirst()
+    if task is None:
+        raise exceptions.NotFound('No BoardTask matches the given query.')
+    if not await Board.members.through.objects.filter(board_id=task.board_id, user_id=request.user.id).aexists():
+        raise exceptions.PermissionDenied()
+    etag = make_etag('comments', task.pk, task.board.version)
+    if etag_matches(request, etag):
+        return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    data = await paginate(request, TaskComment.objects.filter(task=task).select_related('author'), TaskCommentSerializer)
+    return render(data, headers={'ETag': etag})
@@ -0,0 +1,54 @@
+from django.utils.http import parse_etags
+
+from rest_framework import status
+from rest_framework.response import Response
+
+
+"""
+The `BoardVersionETagMixin` class adds a strong ETag with the version of the board to the GET responses of a view. A request with a matching `If-None-Match` header gets a 304 response without loading or serializing the data. 
+The views provide the version with `get_board_version`, which returns a tuple of the kind of the resource, its id and the version of its board, or None when the resource does not exist or the user has no access. In this case the view answers as usual. The ETag of a full response is taken from `get_loaded_board_version`, which can read the version from the data the view has already loaded.
+"""
+class BoardVersionETagMixin:
+    def get_board_version(self):
+        raise NotImplementedError('`get_board_version()` must be implemented.')
+
+    def get_loaded_board_version(self):
+        return self.get_current_board_version()
+
+    """
+    The function `get_current_board_version` calls `get_board_version` only once per request.
+    """
+    def get_current_board_version(self):
+        if not hasattr(self, 'board_version'):
+            self.board_version = self.get_board_version()
+        return self.board_version
+
+    def get(self, request, *args, **kwargs):
+        if request.headers.get('If-None-Match'):
+            version = self.get_current_board_version()
+            if version is not None and etag_matches(request, make_etag(*version)):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': make_etag(*version)})
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            version = self.get_loaded_board_version()
+            if version is not None:
+                response['ETag'] = make_etag(*version)
+        return response
+
+
+"""
+    The function `make_etag` returns the strong ETag of a resource from the kind of the resource, its id and the version of its board.
+    """
+def make_etag(kind, pk, version):
+    return f'"{kind}-{pk}-v{version}"'
+
+
+"""
+    The function `etag_matches` checks if the `If-None-Match` header of the request contains the given ETag.
+    """
+def etag_matches(request, etag):
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return '*' in etags or etag in etags or f'W/{etag}' in etags
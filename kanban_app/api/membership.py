@@ -0,0 +1,77 @@
+from django.contrib.auth.models import User
+
+from kanban_app.models import Board
+
+
+"""
+The `BoardMembershipResolver` class loads the boards and the members of a board at most once per request. The permissions, validators and serializer fields of a request share one resolver, so a write checks the membership of all involved users with one query.
+"""
+class BoardMembershipResolver:
+    def __init__(self):
+        self.boards = {}
+        self.members = {}
+
+    """
+    The function `get_board` returns the board with the given id or None if it does not exist.
+    """
+    def get_board(self, board_id):
+        board_id = to_id(board_id)
+        if board_id is None:
+            return None
+        if board_id not in self.boards:
+            self.boards[board_id] = Board.objects.filter(pk=board_id).first()
+        return self.boards[board_id]
+
+    """
+    The function `remember_board` stores a board which was already loaded by the view, including its members if they were prefetched.
+    """
+    def remember_board(self, board):
+        self.boards[board.pk] = board
+        prefetched = getattr(board, '_prefetched_objects_cache', {})
+        if 'members' in prefetched:
+            self.members[board.pk] = {user.id: user for user in prefetched['members']}
+
+    """
+    The function `get_members` returns the members of a board as a dict from the user id to the user. The members are loaded with one query and only the fields which are shown in the responses.
+    """
+    def get_members(self, board_id):
+        board_id = to_id(board_id)
+        if board_id is None:
+            return {}
+        if board_id not in self.members:
+            users = User.objects.filter(boards__id=board_id).only('id', 'username', 'email')
+            self.members[board_id] = {user.id: user for user in users}
+        return self.members[board_id]
+
+    def is_member(self, board_id, user_id):
+        return to_id(user_id) in self.get_members(board_id)
+
+    def get_member(self, board_id, user_id):
+        return self.get_members(board_id).get(to_id(user_id))
+
+    """
+    The function `forget_members` removes the members of a board from the resolver after they were changed.
+    """
+    def forget_members(self, board_id):
+        self.members.pop(to_id(board_id), None)
+
+
+"""
+    The function `get_membership_resolver` returns the `BoardMembershipResolver` of the request and creates it for the first call.
+    :param request: the request of the view, the permission or the serializer context
+    """
+def get_membership_resolver(request):
+    resolver = getattr(request, '_board_membership_resolver', None)
+    if resolver is None:
+        resolver = BoardMembershipResolver()
+        request._board_membership_resolver = resolver
+    return resolver
+
+
+def to_id(value):
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
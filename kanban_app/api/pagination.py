@@ -0,0 +1,137 @@
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+"""
+The `KeysetPagination` class pages through a list ordered by `created_at` and `id`. The cursor contains the key of the last row of a page and the next page is filtered with `(created_at, id)` greater than this key, so deep pages cost the same as the first page, unlike an OFFSET. 
+A view can order by another field with its attribute `ordering`, f.e. `-due_date`, which then replaces `created_at` in the key. Empty values come before all other values.
+The page size can be changed with the query param `page_size` up to `max_page_size`. With `?paginate=false` the whole list is returned without pagination, as before.
+"""
+class KeysetPagination(BasePagination):
+    page_size = getattr(settings, 'KANBAN_PAGE_SIZE', 50)
+    max_page_size = getattr(settings, 'KANBAN_MAX_PAGE_SIZE', 200)
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    unpaginated_query_param = 'paginate'
+    invalid_cursor_message = 'Invalid cursor'
+    default_ordering = 'created_at'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request, getattr(view, 'ordering', None))
+        if queryset is None:
+            return None
+        return self.set_page(list(queryset))
+
+    """
+    The functions `get_page_queryset` and `set_page` split `paginate_queryset` into building the query of the page and handling its rows, so the async views can load the rows with the async ORM. `get_page_queryset` returns None without pagination.
+    """
+    def get_page_queryset(self, queryset, request, ordering=None):
+        if request.query_params.get(self.unpaginated_query_param, '').lower() in ('false', '0'):
+            return None
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        ordering = ordering or self.default_ordering
+        self.field = ordering.lstrip('-')
+        cursor = self.decode_cursor(request, queryset.model._meta.get_field(self.field))
+        self.has_cursor = cursor is not None
+        self.reverse = bool(cursor and cursor[2])
+        descending = ordering.startswith('-') != self.reverse
+        if cursor:
+            queryset = self.filter_after(queryset, cursor[0], cursor[1], descending)
+        return queryset.order_by(*self.get_order_by(descending))[:self.page_size + 1]
+
+    def set_page(self, results):
+        self.has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if self.reverse:
+            self.page.reverse()
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'previous': self.get_previous_link(), 'results': data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    """
+    The function `get_order_by` returns the order of the key in the given direction, with the empty values first in ascending order and last in descending order on every database.
+    """
+    def get_order_by(self, descending):
+        if descending:
+            return [F(self.field).desc(nulls_last=True), '-id']
+        return [F(self.field).asc(nulls_first=True), 'id']
+
+    """
+    The function `filter_after` returns the rows which come after the key in the given direction.
+    """
+    def filter_after(self, queryset, value, pk, descending):
+        field = self.field
+        if value is None:
+            if descending:
+                return queryset.filter(**{f'{field}__isnull': True, 'id__lt': pk})
+            return queryset.filter(Q(**{f'{field}__isnull': True, 'id__gt': pk}) | Q(**{f'{field}__isnull': False}))
+        if descending:
+            return queryset.filter(Q(**{f'{field}__lt': value}) | Q(**{field: value, 'id__lt': pk}) | Q(**{f'{field}__isnull': True}))
+        return queryset.filter(Q(**{f'{field}__gt': value}) | Q(**{field: value, 'id__gt': pk}))
+
+    def get_next_link(self):
+        if not self.page or (not self.reverse and not self.has_more):
+            return None
+        return self.encode_cursor(self.page[-1], False)
+
+    def get_previous_link(self):
+        if not self.page or not self.has_cursor or (self.reverse and not self.has_more):
+            return None
+        return self.encode_cursor(self.page[0], True)
+
+    """
+    The functions `encode_cursor` and `decode_cursor` convert the key of a row into an opaque cursor and back. An empty value is encoded as empty text.
+    """
+    def encode_cursor(self, row, reverse):
+        key = row[self.field] if isinstance(row, dict) else getattr(row, self.field)
+        pk = row['id'] if isinstance(row, dict) else row.pk
+        value = f'{"" if key is None else key.isoformat()}|{pk}|{int(reverse)}'
+        cursor = b64encode(value.encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request, field):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            key, pk, reverse = b64decode(encoded.encode('ascii')).decode('ascii').split('|')
+            key = field.to_python(key) if key else None
+            pk = int(pk)
+            reverse = bool(int(reverse))
+        except (TypeError, ValueError, UnicodeError, BinasciiError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        if key is None and not field.null:
+            raise NotFound(self.invalid_cursor_message)
+        return key, pk, reverse
@@ -1,7 +1,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 from rest_framework.exceptions import PermissionDenied
 
-from kanban_app.models import Board
+from .membership import get_membership_resolver
 
 
 """ This permission provides retrieving and updating rights for board members and the board owner and deleting rights for the board owner.
@@ -14,9 +14,13 @@ class IsBoardOwnerOrMember(BasePermission):
     def has_object_permission(self, request, view, obj):
         user = request.user
         if request.method in SAFE_METHODS or request.method == 'PATCH':
-            return obj.owner == user or user in obj.members.all()
+            if obj.owner_id == user.id:
+                return True
+            resolver = get_membership_resolver(request)
+            resolver.remember_board(obj)
+            return resolver.is_member(obj.pk, user.id)
         elif request.method == 'DELETE':
-            return obj.owner == user
+            return obj.owner_id == user.id
         else:
             return False
 
@@ -29,17 +33,15 @@ class IsBoardMember(BasePermission):
         if request.method in ('POST', 'PATCH', 'DELETE', 'GET'):
             board_id = request.data.get('board')
             if board_id: 
-                try:
-                    board = Board.objects.get(pk=board_id)
-                except Board.DoesNotExist:
+                resolver = get_membership_resolver(request)
+                if resolver.get_board(board_id) is None:
                     return True
-                if not board.members.filter(id=request.user.id).exists():
+                if not resolver.is_member(board_id, request.user.id):
                     raise PermissionDenied('You are not a member of this board!')
         return True
     
     def has_object_permission(self, request, view, obj):
-        board = obj.board
-        return board.members.filter(id=request.user.id).exists()
+        return get_membership_resolver(request).is_member(obj.board_id, request.user.id)
 
 
 """
@@ -51,14 +53,14 @@ class IsBoardOfTaskMember(BasePermission):
         if not task:
             return False
         if request.method in SAFE_METHODS or request.method == 'POST':
-            return task.board.members.filter(id=request.user.id).exists()
+            return get_membership_resolver(request).is_member(task.board_id, request.user.id)
         return request.method == 'DELETE'
 
     def has_object_permission(self, request, view, obj):
         if request.method == "DELETE":
             return obj.author_id == request.user.id
         if request.method in SAFE_METHODS:
-            return obj.task.board.members.filter(id=request.user.id).exists()
+            return get_membership_resolver(request).is_member(obj.task.board_id, request.user.id)
         return False
 
 
@@ -68,7 +70,7 @@ Permission to retrieve tasks when user is assignee of the task.
 class IsAssignee(BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method == 'GET':
-            return bool(request.user == obj.assignee)
+            return bool(request.user.id == obj.assignee_id)
         return True
 
 
@@ -78,7 +80,7 @@ Permission to retrieve tasks when user is reviewer of the task.
 class IsReviewer(BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method == 'GET':
-            return bool(request.user == obj.reviewer)
+            return bool(request.user.id == obj.reviewer_id)
         return True
 
 
@@ -91,8 +93,11 @@ class IsAllowedToUpdateOrDelete(BasePermission):
         if request.method in SAFE_METHODS:
             return True
         elif request.method == 'PATCH':
-            return obj.board.members.filter(id=user.id).exists()
+            return get_membership_resolver(request).is_member(obj.board_id, user.id)
         elif request.method == 'DELETE':
-            return (obj.creator == user) or (obj.board.owner == user)
+            if obj.creator_id == user.id:
+                return True
+            board = get_membership_resolver(request).get_board(obj.board_id)
+            return board is not None and board.owner_id == user.id
         else:
-            return False
\ No newline at end of file
+            return False
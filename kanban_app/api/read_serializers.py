@@ -0,0 +1,127 @@
+from kanban_app.timing import timed
+
+
+"""
+The `NORMALIZED_TASK_FIELDS` are the columns of the tasks in the normalized board details.
+"""
+NORMALIZED_TASK_FIELDS = ['id', 'title', 'description', 'status', 'priority', 'assignee', 'reviewer', 'due_date', 'comments_count']
+
+
+"""
+    The function `serialize_user` returns the data of the `UserNestedSerializer` for the columns of a user, or None if there is no user.
+    """
+def serialize_user(pk, email, username):
+    if pk is None:
+        return None
+    return {'id': pk, 'email': email, 'fullname': username}
+
+
+"""
+    The function `serialize_task_row` returns the data of the `TaskListSerializer` for one row of `task_list_values`.
+    """
+def serialize_task_row(row):
+    due_date = row['due_date']
+    return {
+        'id': row['id'],
+        'board': row['board_id'],
+        'title': row['title'],
+        'description': row['description'],
+        'status': row['status'],
+        'priority': row['priority'],
+        'assignee': serialize_user(row['assignee__id'], row['assignee__email'], row['assignee__username']),
+        'reviewer': serialize_user(row['reviewer__id'], row['reviewer__email'], row['reviewer__username']),
+        'due_date': None if due_date is None else due_date.isoformat(),
+        'comments_count': row['comments_count'],
+    }
+
+
+"""
+    The function `serialize_board_row` returns the data of the `BoardListSerializer` for one row of `board_list_values`.
+    """
+def serialize_board_row(row):
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'member_count': row['member_count'],
+        'ticket_count': row['ticket_count'],
+        'tasks_to_do_count': row['tasks_to_do_count'],
+        'tasks_high_prio_count': row['tasks_high_prio_count'],
+        'owner_id': row['owner_id'],
+    }
+
+
+"""
+    The function `serialize_board_detail` returns the data of the `BoardDetailSerializer` for a board, its members and the rows of its tasks.
+    :param board: the board, only `id`, `title` and `owner_id` are read
+    :param members: the members of the board as users, f.e. from the `BoardMembershipResolver`
+    :param task_rows: the rows of `task_list_values` for the tasks of the board, ordered by id
+    """
+@timed('serialize')
+def serialize_board_detail(board, members, task_rows):
+    return {
+        'id': board.id,
+        'title': board.title,
+        'owner_id': board.owner_id,
+        'members': [serialize_user(user.id, user.email, user.username) for user in members],
+        'tasks': [serialize_task_row(row) for row in task_rows],
+    }
+
+
+"""
+    The function `serialize_normalized_board_detail` returns the normalized board details: every user is sent once in the lookup table `users` from the user id to the email and the full name, the members, assignees and reviewers only contain the user ids and the tasks are sent column by column, so the field names are not repeated for every task either.
+    :param board: the board, only `id`, `title` and `owner_id` are read
+    :param members: the members of the board as users, f.e. from the `BoardMembershipResolver`
+    :param task_rows: the rows of `task_list_values` for the tasks of the board, ordered by id
+    """
+@timed('serialize')
+def serialize_normalized_board_detail(board, members, task_rows):
+    users = {user.id: {'email': user.email, 'fullname': user.username} for user in members}
+    tasks = {field: [] for field in NORMALIZED_TASK_FIELDS}
+    for row in task_rows:
+        for field in ('assignee', 'reviewer'):
+            if row[f'{field}__id'] is not None:
+                users.setdefault(row[f'{field}__id'], {'email': row[f'{field}__email'], 'fullname': row[f'{field}__username']})
+        tasks['id'].append(row['id'])
+        tasks['title'].append(row['title'])
+        tasks['description'].append(row['description'])
+        tasks['status'].append(row['status'])
+        tasks['priority'].append(row['priority'])
+        tasks['assignee'].append(row['assignee__id'])
+        tasks['reviewer'].append(row['reviewer__id'])
+        tasks['due_date'].append(None if row['due_date'] is None else row['due_date'].isoformat())
+        tasks['comments_count'].append(row['comments_count'])
+    return {
+        'id': board.id,
+        'title': board.title,
+        'owner_id': board.owner_id,
+        'users': users,
+        'members': [user.id for user in members],
+        'tasks': tasks,
+    }
+
+
+"""
+The `RowSerializer` class lets the generic views of the REST framework use a row function like a serializer class, f.e. `TaskListRowSerializer(page, many=True).data`. The row functions build the responses of the task lists, the board list and the board details directly from the rows of `task_list_values` and `board_list_values` in `services.py`, without model instances and without the field machinery of the REST framework. They return exactly the same data as `TaskListSerializer`, `BoardListSerializer`, `BoardDetailSerializer` and `UserNestedSerializer`, which is checked by `kanban_app/tests/test_read_serializers.py`. They only read, every write still goes through the serializers in `serializers.py`.
+"""
+class RowSerializer:
+    serialize_row = None
+
+    def __init__(self, instance=None, many=False, **kwargs):
+        self.instance = instance
+        self.many = many
+
+    @property
+    @timed('serialize')
+    def data(self):
+        serialize_row = type(self).serialize_row
+        if self.many:
+            return [serialize_row(row) for row in self.instance]
+        return serialize_row(self.instance)
+
+
+class TaskListRowSerializer(RowSerializer):
+    serialize_row = staticmethod(serialize_task_row)
+
+
+class BoardListRowSerializer(RowSerializer):
+    serialize_row = staticmethod(serialize_board_row)
@@ -0,0 +1,17 @@
+from rest_framework.renderers import JSONRenderer
+
+
+"""
+The `NormalizedJSONRenderer` class renders the normalized board details. It is selected by the content negotiation of the REST framework with `?format=normalized` or with the header `Accept: application/vnd.kanmind.normalized+json`, every other request gets the nested board details of the `JSONRenderer`.
+"""
+class NormalizedJSONRenderer(JSONRenderer):
+    media_type = 'application/vnd.kanmind.normalized+json'
+    format = 'normalized'
+
+
+"""
+    The function `get_board_detail_layout` returns the layout of the board details for the renderer which was selected for the request.
+    :return: 'normalized' or 'nested'
+    """
+def get_board_detail_layout(renderer):
+    return 'normalized' if renderer.format == NormalizedJSONRenderer.format else 'nested'
@@ -0,0 +1,54 @@
+import hashlib
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from kanban_app.response_cache import response_cache
+
+
+"""
+The `CachedResponseMixin` class answers GET requests from the `response_cache`. The views provide the key with `get_response_cache_key`, which has to contain the version of the data, or None when the response should not be cached. Only successful responses are stored.
+"""
+class CachedResponseMixin:
+    def get_response_cache_key(self):
+        raise NotImplementedError('`get_response_cache_key()` must be implemented.')
+
+    def get(self, request, *args, **kwargs):
+        key = self.get_response_cache_key()
+        if key is None:
+            return super().get(request, *args, **kwargs)
+        data = response_cache.get(key)
+        if data is not None:
+            return Response(data)
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response_cache.set(key, response.data)
+        return response
+
+
+"""
+    The function `get_query_hash` returns a short hash of the host and the query params of a request, so every page of a list is cached separately and the links to the next and previous pages stay correct.
+    """
+def get_query_hash(request):
+    query = f"{request.get_host()}?{request.META.get('QUERY_STRING', '')}"
+    return hashlib.sha1(query.encode('utf-8')).hexdigest()[:16]
+
+
+"""
+    The functions `get_board_detail_cache_key` and `get_task_list_cache_key` return the keys of the cached board details and task lists, which are shared by the sync and the async views.
+    :param layout: 'nested' or 'normalized'
+    :param kind: 'assigned' or 'reviewing'
+    """
+def get_board_detail_cache_key(board_id, version, layout='nested'):
+    return f'board-detail:{board_id}:v{version}:{layout}'
+
+
+"""
+    The function `get_board_analytics_cache_key` returns the key of the analytics of a board, which depend on the version of the board and on the day of the overdue tasks.
+    """
+def get_board_analytics_cache_key(board_id, version, today):
+    return f'board-analytics:{board_id}:v{version}:{today.isoformat()}'
+
+
+def get_task_list_cache_key(kind, user_id, version, request):
+    return f'tasks-{kind}:{user_id}:v{version}:{get_query_hash(request)}'
@@ -1,16 +1,49 @@
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db import transaction
 
 from rest_framework import serializers
 
-from kanban_app.models import Board, BoardTask, TaskComment
-from .validators import validate_board_member, validate_board_user_relation
+from kanban_app.models import Board, BoardTask, TaskComment, STATUS_CHOICES, PRIORITY_CHOICES
+from kanban_app.timing import TimedSerializerMixin
+from .membership import get_membership_resolver
+from .services import TASK_LIST_ORDERINGS
+from .validators import validate_board_member, validate_board_user_relation, validate_user_in_board
+
+
+"""
+The `CommaSeparatedListField` class reads a list from a query param, given as comma separated values (`?status=to-do,review`), as repeated param (`?status=to-do&status=review`) or both.
+"""
+class CommaSeparatedListField(serializers.ListField):
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = [data]
+        values = [value.strip() for item in data for value in str(item).split(',')]
+        return super().to_internal_value([value for value in values if value])
+
+
+"""
+The `TaskListFilterSerializer` class validates the filters and the order of the task list. The ids of boards, assignees and reviewers and the values of status and priority can be given as lists, the due date range includes both dates.
+"""
+class TaskListFilterSerializer(TimedSerializerMixin, serializers.Serializer):
+    board = CommaSeparatedListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=100)
+    status = CommaSeparatedListField(child=serializers.ChoiceField(choices=STATUS_CHOICES), required=False, allow_empty=False)
+    priority = CommaSeparatedListField(child=serializers.ChoiceField(choices=PRIORITY_CHOICES), required=False, allow_empty=False)
+    assignee = CommaSeparatedListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=100)
+    reviewer = CommaSeparatedListField(child=serializers.IntegerField(min_value=1), required=False, allow_empty=False, max_length=100)
+    due_date_after = serializers.DateField(required=False)
+    due_date_before = serializers.DateField(required=False)
+    ordering = serializers.ChoiceField(choices=TASK_LIST_ORDERINGS, default='created_at')
+
+    def validate(self, data):
+        if 'due_date_after' in data and 'due_date_before' in data and data['due_date_after'] > data['due_date_before']:
+            raise serializers.ValidationError({'due_date_before': 'The end of the range has to be after its start.'})
+        return data
 
 
 """
 This class is a nested serializer for the User model in Django, including a custom method to retrieve the user's full name.
 """
-class UserNestedSerializer(serializers.ModelSerializer):
+class UserNestedSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     fullname = serializers.SerializerMethodField()
     class Meta: 
         model = User
@@ -20,10 +53,17 @@ class UserNestedSerializer(serializers.ModelSerializer):
         return obj.username
 
 
+"""
+The `BulkEmailCheckSerializer` class validates the list of email addresses of a bulk email check.
+"""
+class BulkEmailCheckSerializer(TimedSerializerMixin, serializers.Serializer):
+    emails = serializers.ListField(child=serializers.EmailField(), allow_empty=False, max_length=100)
+
+
 """
 This class is a nested serializer for the User model that includes a SerializerMethodField for the fullname field to show only the full name of a user in the comment.
 """
-class AuthorNestedSerializer(serializers.ModelSerializer):
+class AuthorNestedSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     fullname = serializers.SerializerMethodField()
     class Meta: 
         model = User
@@ -36,7 +76,7 @@ class AuthorNestedSerializer(serializers.ModelSerializer):
 """
 The `TaskCommentSerializer` class defines a serializer for task comments with fields for id, creation date, author, and content, along with validation for the content field that must not be empty.
 """
-class TaskCommentSerializer(serializers.ModelSerializer):
+class TaskCommentSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     author = author = serializers.CharField(source='author.username', read_only=True)
     class Meta:
         model = TaskComment
@@ -49,12 +89,50 @@ class TaskCommentSerializer(serializers.ModelSerializer):
         return value
 
 
+"""
+The `TaskCommentChangeSerializer` class shows a comment in the delta sync of a board together with the id of its task and the time of its last change.
+"""
+class TaskCommentChangeSerializer(TaskCommentSerializer):
+    task_id = serializers.IntegerField(read_only=True)
+    class Meta(TaskCommentSerializer.Meta):
+        fields = ['id', 'task_id', 'created_at', 'updated_at', 'author', 'content']
+        read_only_fields = fields
+
+
+"""
+The `BoardField` class resolves the board of a task with the `BoardMembershipResolver` of the request, so the board which was already loaded by the permission check is not loaded again.
+"""
+class BoardField(serializers.PrimaryKeyRelatedField):
+    def to_internal_value(self, data):
+        board = get_membership_resolver(self.context['request']).get_board(data)
+        if board is None:
+            return super().to_internal_value(data)
+        return board
+
+
+"""
+The `BoardMemberField` class resolves the assignee or reviewer of a task from the members of the board of the task, which are loaded once per request by the `BoardMembershipResolver`. Only users who are not members of the board are loaded separately, so the validators can report them.
+"""
+class BoardMemberField(serializers.PrimaryKeyRelatedField):
+    def to_internal_value(self, data):
+        member = get_membership_resolver(self.context['request']).get_member(self.get_board_id(), data)
+        if member is None:
+            return super().to_internal_value(data)
+        return member
+
+    def get_board_id(self):
+        if self.parent.instance is not None:
+            return self.parent.instance.board_id
+        return self.parent.initial_data.get('board')
+
+
 """
 The `TaskListSerializer` class serializes task data including assignee, reviewer, and comments count, with validation for board members and users.
 """
-class TaskListSerializer(serializers.ModelSerializer):
-    assignee_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), source='assignee', write_only=True, required=False, allow_null=True)
-    reviewer_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), source='reviewer', write_only=True, required=False, allow_null=True)
+class TaskListSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    board = BoardField(queryset=Board.objects.all())
+    assignee_id = BoardMemberField(queryset=User.objects.all(), source='assignee', write_only=True, required=False, allow_null=True)
+    reviewer_id = BoardMemberField(queryset=User.objects.all(), source='reviewer', write_only=True, required=False, allow_null=True)
     assignee = UserNestedSerializer(read_only=True)
     reviewer = UserNestedSerializer(read_only=True)
     comments_count = serializers.SerializerMethodField()
@@ -67,20 +145,26 @@ class TaskListSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         assignee = data.get('assignee')
         reviewer = data.get('reviewer')
-        validate_board_member(board, user)
-        validate_board_user_relation(board, assignee, reviewer)
+        resolver = get_membership_resolver(self.context['request'])
+        validate_board_member(resolver, board, user)
+        validate_board_user_relation(resolver, board, assignee, reviewer)
         return data
     
+    """
+    The comments count is read from the annotation of `with_task_list_relations` if the task was loaded with it, otherwise the comments are counted.
+    """
     def get_comments_count(self, obj):
+        if hasattr(obj, 'comments_count'):
+            return obj.comments_count
         return obj.comments.count()
 
 
 """
 The `TaskDetailSerializer` class provides `BoardTask` objects with fields for task details and related users such as assignee and reviewer.
 """
-class TaskDetailSerializer(serializers.ModelSerializer):
-    assignee_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), source='assignee', write_only=True, required=False, allow_null=True)
-    reviewer_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), source='reviewer', write_only=True, required=False, allow_null=True)
+class TaskDetailSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    assignee_id = BoardMemberField(queryset=User.objects.all(), source='assignee', write_only=True, required=False, allow_null=True)
+    reviewer_id = BoardMemberField(queryset=User.objects.all(), source='reviewer', write_only=True, required=False, allow_null=True)
     assignee = UserNestedSerializer(read_only=True)
     reviewer = UserNestedSerializer(read_only=True)
 
@@ -90,38 +174,68 @@ class TaskDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ['creator', 'board']
 
 
+"""
+The `TaskBatchUpdateSerializer` class validates one update of a task batch. Only the given fields are changed, the assignee and reviewer have to be members of the board of the batch.
+"""
+class TaskBatchUpdateSerializer(TimedSerializerMixin, serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=STATUS_CHOICES, required=False)
+    priority = serializers.ChoiceField(choices=PRIORITY_CHOICES, required=False)
+    assignee_id = serializers.IntegerField(required=False, allow_null=True)
+    reviewer_id = serializers.IntegerField(required=False, allow_null=True)
+    due_date = serializers.DateField(required=False, allow_null=True)
+
+    def validate(self, data):
+        resolver = get_membership_resolver(self.context['request'])
+        board = self.context['board']
+        validate_user_in_board(resolver, board, data.get('assignee_id'), 'Assignee')
+        validate_user_in_board(resolver, board, data.get('reviewer_id'), 'Reviewer')
+        return data
+
+
+"""
+The `TaskBatchSerializer` class validates a batch of task creates, updates and deletes for one board. The creates are validated like single tasks by the `TaskListSerializer`.
+"""
+class TaskBatchSerializer(TimedSerializerMixin, serializers.Serializer):
+    board = BoardField(queryset=Board.objects.all())
+    create = serializers.ListField(child=serializers.DictField(), required=False, max_length=500)
+    update = serializers.ListField(child=serializers.DictField(), required=False, max_length=500)
+    delete = serializers.ListField(child=serializers.IntegerField(), required=False, max_length=500)
+
+    def validate(self, data):
+        context = {**self.context, 'board': data['board']}
+        data['create'] = self.validate_items(TaskListSerializer, [{**item, 'board': data['board'].pk} for item in data.get('create', [])], context, 'create')
+        data['update'] = self.validate_items(TaskBatchUpdateSerializer, data.get('update', []), context, 'update')
+        data['delete'] = list(dict.fromkeys(data.get('delete', [])))
+        return data
+
+    """
+    The function `validate_items` validates every item with the given serializer and raises the errors of all items together, in the order of the items.
+    """
+    def validate_items(self, serializer_class, items, context, field_name):
+        item_serializers = [serializer_class(data=item, context=context) for item in items]
+        valid = [serializer.is_valid() for serializer in item_serializers]
+        if not all(valid):
+            raise serializers.ValidationError({field_name: [serializer.errors for serializer in item_serializers]})
+        return [serializer.validated_data for serializer in item_serializers]
+
+
 # The `BoardListSerializer` class provides a list of Board objects with additional fields for member count,ticket count, tasks to do count, and high priority tasks count.
-class BoardListSerializer(serializers.ModelSerializer):
+class BoardListSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     members = serializers.ListField(child=serializers.IntegerField(), write_only=True, required=False)
-    member_count = serializers.SerializerMethodField()
-    ticket_count = serializers.SerializerMethodField()
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
+    """
+    The counts of the members, all tickets of the board, all tasks with the status `to do` and all tasks with high priority are stored on the board and kept up to date by the signal handlers in `kanban_app/signals.py`.
+    """
     class Meta: 
         model= Board
         fields = ['id', 'title', 'member_count', 'ticket_count', 'tasks_to_do_count', 'tasks_high_prio_count', 'owner_id', 'members']
-    """
-    These functions calculate the count of the members, all tickets of the board, all tasks with the status `to do` or task with high priority
-    """
-    def get_member_count(self, obj):
-        return obj.members.count()
-    
-    def get_ticket_count(self, obj):
-        return obj.tasks.count()
-
-    def get_tasks_to_do_count(self, obj):
-        to_do_tasks = obj.tasks.filter(Q(status='to-do'))
-        return to_do_tasks.count()
-
-    def get_tasks_high_prio_count(self, obj):
-        high_prio_tasks = obj.tasks.filter(Q(priority='high'))
-        return high_prio_tasks.count()
+        read_only_fields = ['member_count', 'ticket_count', 'tasks_to_do_count', 'tasks_high_prio_count']
 
 
 """
 The `BoardDetailSerializer` class provides board details including specific details about members and tasks.
 """
-class BoardDetailSerializer(serializers.ModelSerializer):
+class BoardDetailSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     members = UserNestedSerializer(many=True, read_only=True)
     tasks = TaskListSerializer(many=True, read_only=True)
     class Meta:
@@ -132,8 +246,8 @@ class BoardDetailSerializer(serializers.ModelSerializer):
 """
 The `BoardDetailUpdateSerializer` class is only to provide a specific response for PATCH-requests. The responses are different to the `BoardDetailSerializer`
 """
-class BoardDetailUpdateSerializer(serializers.ModelSerializer):
-    members = serializers.PrimaryKeyRelatedField(many=True, queryset=User.objects.all(), write_only=True, required=False)
+class BoardDetailUpdateSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    members = serializers.ListField(child=serializers.IntegerField(), write_only=True, required=False)
     owner_data = UserNestedSerializer(source="owner", read_only=True)
     members_data = UserNestedSerializer(source="members", many=True, read_only=True)
 
@@ -141,9 +255,45 @@ class BoardDetailUpdateSerializer(serializers.ModelSerializer):
         model = Board
         fields = ["id", "title", "owner_data", "members", "members_data"]
 
+    """
+    All new members are loaded with one query instead of one query per member.
+    """
+    def validate_members(self, value):
+        users = {user.id: user for user in User.objects.filter(pk__in=value)}
+        for pk in value:
+            if pk not in users:
+                raise serializers.ValidationError(f'Invalid pk "{pk}" - object does not exist.')
+        return [users[pk] for pk in dict.fromkeys(value)]
+
+    """
+    The title and the members are updated in one transaction together with the member count of the board.
+    """
     def update(self, instance, validated_data):
         members = validated_data.pop('members', None)
-        instance = super().update(instance, validated_data)
-        if members is not None:
-            instance.members.set(members)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if members is not None:
+                instance.members.set(members)
+                get_membership_resolver(self.context['request']).forget_members(instance.pk)
         return instance
+
+
+"""
+The `BoardChangesSerializer` class provides the response of the delta sync of a board. The title, owner and members of the board are only sent when they changed.
+"""
+class BoardChangesSerializer(TimedSerializerMixin, serializers.Serializer):
+    cursor = serializers.CharField()
+    version = serializers.IntegerField()
+    reset = serializers.BooleanField()
+    board = serializers.SerializerMethodField()
+    tasks = TaskListSerializer(many=True)
+    comments = TaskCommentChangeSerializer(many=True)
+    deleted_tasks = serializers.ListField(child=serializers.IntegerField())
+    deleted_comments = serializers.ListField(child=serializers.IntegerField())
+
+    def get_board(self, obj):
+        if not obj['board_changed']:
+            return None
+        board = obj['board']
+        members = sorted(get_membership_resolver(self.context['request']).get_members(board.pk).values(), key=lambda user: user.id)
+        return {'id': board.pk, 'title': board.title, 'owner_id': board.owner_id, 'members': UserNestedSerializer(members, many=True).data}
@@ -1,16 +1,254 @@
-from django.contrib.auth.models import User
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Exists, F, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+
+from kanban_app.response_cache import batched_task_list_invalidation, invalidate_task_lists
+from kanban_app.counters import apply_task_counter_change, batched_counter_updates
+from kanban_app.events import publish_board_event
+from kanban_app.history import batched_transitions, get_loaded_tracked_values, record_task_transitions
+from kanban_app.search import batched_search_updates, index_tasks
+from kanban_app.sync import batched_tombstones
+from kanban_app.models import Board, BoardTask, TaskComment, Tombstone
+
+"""
+    The function `get_boards_of_user` returns all boards where the user is owner or member. The counters of the boards are stored on the rows, so the board list is loaded in one single query.
+    :param user: the user whose boards should be returned
+    """
+def get_boards_of_user(user):
+    member_boards = Board.members.through.objects.filter(user_id=user.id).values('board_id')
+    return Board.objects.filter(Q(owner_id=user.id) | Q(id__in=member_boards)).order_by('id')
+
+
+"""
+    The function `annotate_board_access` adds `is_member` to the boards of the queryset, so the access of a user to a board is checked in the same query which loads the board.
+    """
+def annotate_board_access(queryset, user):
+    is_member = Board.members.through.objects.filter(board_id=OuterRef('pk'), user_id=user.id)
+    return queryset.annotate(is_member=Exists(is_member))
+
+
+"""
+    The function `with_task_list_relations` loads everything which is shown by the `TaskListSerializer` together with the tasks: the assignee and reviewer are joined and the comments are counted in a subquery of the same query. The subquery avoids a GROUP BY, so the tasks can still be read in the order of an index.
+    :param queryset: the task queryset which should be extended
+    """
+def with_task_list_relations(queryset):
+    return queryset.select_related('assignee', 'reviewer').annotate(comments_count=get_comments_count())
+
+
+"""
+    The function `get_comments_count` returns the subquery which counts the comments of a task.
+    """
+def get_comments_count():
+    comments_count = TaskComment.objects.filter(task_id=OuterRef('pk')).order_by().values('task_id').annotate(count=Count('id')).values('count')
+    return Coalesce(Subquery(comments_count, output_field=IntegerField()), 0)
+
+
+"""
+The `TASK_LIST_VALUES` and `BOARD_LIST_VALUES` define the columns which are loaded for the read serializers in `read_serializers.py`. The task list also loads `created_at` for the cursor of the pagination.
+"""
+TASK_LIST_VALUES = ['id', 'board_id', 'title', 'description', 'status', 'priority', 'due_date', 'created_at', 'comments_count', 'assignee__id', 'assignee__email', 'assignee__username', 'reviewer__id', 'reviewer__email', 'reviewer__username']
+
+BOARD_LIST_VALUES = ['id', 'title', 'member_count', 'ticket_count', 'tasks_to_do_count', 'tasks_high_prio_count', 'owner_id']
+
+
+"""
+    The function `task_list_values` loads the tasks of the queryset as dicts with everything which is shown by the task lists, in one query and without model instances.
+    """
+def task_list_values(queryset):
+    return queryset.annotate(comments_count=get_comments_count()).values(*TASK_LIST_VALUES)
+
+
+def board_list_values(queryset):
+    return queryset.values(*BOARD_LIST_VALUES)
 
-from rest_framework.response import Response
-from rest_framework import status
 
 """
-    The function `get_user_by_email` retrieves a user object based on the provided email address.
-    :param email: it takes an email as a parameter and attempts to retrieve a User object from the database based on the provided email address. If the user with the given email is found, it returns the User object. If the user does not exist, it returns a 404 error or a 500 error.
+The `TASK_LIST_ORDERINGS` defines the orders of the task list which can be chosen with `?ordering=`. Each of them is paginated by its field and the id.
+"""
+TASK_LIST_ORDERINGS = ['created_at', '-created_at', 'due_date', '-due_date']
+
+"""
+The `TASK_LIST_FILTERS` maps the filters of the task list to the lookups of the tasks.
+"""
+TASK_LIST_FILTERS = {
+    'status': 'status__in',
+    'priority': 'priority__in',
+    'assignee': 'assignee_id__in',
+    'reviewer': 'reviewer_id__in',
+    'due_date_after': 'due_date__gte',
+    'due_date_before': 'due_date__lte',
+}
+
+
+"""
+    The function `filter_tasks` limits the tasks to the boards where the user is owner or member and applies the validated filters of the `TaskListFilterSerializer`.
+    The boards are loaded first with their stored `ticket_count`. When they contain only a few tasks, the tasks are found with the indexes of the boards and sorted. When they contain many tasks, the board is compared as `board_id + 0`, which no index can answer, so the database reads the tasks in the order of the index of the ordering and stops after the page instead of sorting all tasks of the boards. A due date range ordered by the creation is still read with the indexes of the boards and the due date, because the range limits the tasks which are sorted.
+    :param filters: the validated filters, only the given filters are applied
+    :return: the tasks in the order of `filters['ordering']` and then of the id
+    """
+def filter_tasks(queryset, user, filters):
+    boards = get_boards_of_user(user).order_by()
+    if 'board' in filters:
+        boards = boards.filter(id__in=filters['board'])
+    ticket_counts = dict(boards.values_list('id', 'ticket_count'))
+    if not ticket_counts:
+        return queryset.none()
+    ordering = filters.get('ordering', 'created_at')
+    many_tasks = len(ticket_counts) > 1 and sum(ticket_counts.values()) > getattr(settings, 'KANBAN_TASK_LIST_SORT_LIMIT', 5000)
+    due_range = 'due_date_after' in filters or 'due_date_before' in filters
+    if many_tasks and (ordering.lstrip('-') == 'due_date' or not due_range):
+        # `+ 0` hides the board from the indexes, so the index of the ordering is read instead (see test_query_plans.py)
+        queryset = queryset.alias(list_board_id=F('board_id') + 0).filter(list_board_id__in=list(ticket_counts))
+    else:
+        queryset = queryset.filter(board_id__in=list(ticket_counts))
+    lookups = {lookup: filters[name] for name, lookup in TASK_LIST_FILTERS.items() if name in filters}
+    return queryset.filter(**lookups).order_by(ordering, '-id' if ordering.startswith('-') else 'id')
+
+
+"""
+    The function `apply_task_batch` creates, updates and deletes many tasks of one board in one transaction. The tasks are written with one bulk insert, one bulk update and one delete, the board counters are updated with one query and the tombstones of the deleted tasks are written with one bulk insert at the end. The cached task lists of all affected assignees and reviewers are invalidated with one upsert and the events of the tasks are published after the commit.
+    :param board: the board of all tasks
+    :param user: the user who sends the batch and becomes the creator of the new tasks
+    :param resolver: the `BoardMembershipResolver` of the request which provides the assignees and reviewers
+    :param creates: the validated data of the new tasks
+    :param updates: the validated changes of the existing tasks, each with the id of the task
+    :param delete_ids: the ids of the tasks which should be deleted
+    :return: a tuple with the created tasks, the updated tasks and the ids of the deleted tasks, each in the order of the batch
+    """
+def apply_task_batch(board, user, resolver, creates, updates, delete_ids):
+    task_ids = [item['id'] for item in updates] + delete_ids
+    tasks = {task.pk: task for task in with_task_list_relations(BoardTask.objects.filter(board=board, pk__in=task_ids))} if task_ids else {}
+    validate_task_batch(board, user, tasks, updates, delete_ids)
+    with transaction.atomic(), batched_counter_updates(), batched_tombstones(), batched_transitions(), batched_search_updates(), batched_task_list_invalidation():
+        created = BoardTask.objects.bulk_create([BoardTask(**{**data, 'board': board, 'creator': user}) for data in creates])
+        user_ids = set()
+        for task in created:
+            task.comments_count = 0
+            apply_task_counter_change(None, task.get_counter_values())
+            record_task_transitions(task, None)
+            user_ids.update(task.get_user_ids())
+        updated, fields = [], set()
+        for item in updates:
+            task = tasks[item['id']]
+            previous = task.get_counter_values()
+            user_ids.update(task.get_user_ids())
+            for field, value in item.items():
+                if field in ('assignee_id', 'reviewer_id'):
+                    field = field.removesuffix('_id')
+                    value = None if value is None else resolver.get_member(board.pk, value)
+                if field != 'id':
+                    setattr(task, field, value)
+                    fields.add(field)
+            apply_task_counter_change(previous, task.get_counter_values())
+            record_task_transitions(task, get_loaded_tracked_values(task))
+            user_ids.update(task.get_user_ids())
+            updated.append(task)
+        if updated and fields:
+            now = timezone.now()
+            for task in updated:
+                task.updated_at = now
+            BoardTask.objects.bulk_update(updated, [*fields, 'updated_at'])
+        invalidate_task_lists(user_ids)
+        index_tasks([task.pk for task in created])
+        for task in created:
+            publish_board_event(board.pk, 'task.created', task=task.pk)
+        for task in updated:
+            publish_board_event(board.pk, 'task.updated', task=task.pk)
+        if delete_ids:
+            BoardTask.objects.filter(pk__in=delete_ids).delete()
+    return created, updated, delete_ids
+
+
+"""
+    The function `validate_task_batch` checks that all updated and deleted tasks belong to the board, that no task is updated twice or updated and deleted, and that the user is allowed to delete the tasks (creator of the task or owner of the board). The errors of all items are raised together.
     """
-def get_user_by_email(email):
+def validate_task_batch(board, user, tasks, updates, delete_ids):
+    update_errors, seen = [], set()
+    for item in updates:
+        if item['id'] not in tasks:
+            update_errors.append({'id': ['Task not found on this board.']})
+        elif item['id'] in seen or item['id'] in delete_ids:
+            update_errors.append({'id': ['Task is changed more than once in this batch.']})
+        else:
+            update_errors.append({})
+        seen.add(item['id'])
+    delete_errors = []
+    for task_id in delete_ids:
+        task = tasks.get(task_id)
+        if task is None:
+            delete_errors.append(['Task not found on this board.'])
+        elif task.creator_id != user.id and board.owner_id != user.id:
+            delete_errors.append(['Only the creator of the task or the owner of the board can delete it.'])
+        else:
+            delete_errors.append([])
+    errors = {}
+    if any(update_errors):
+        errors['update'] = update_errors
+    if any(delete_errors):
+        errors['delete'] = delete_errors
+    if errors:
+        raise serializers.ValidationError(errors)
+
+
+"""
+    The function `get_board_changes` returns the tasks and comments of a board which were created or changed since the given time, the ids of the tasks and comments which were deleted since then and if the title, owner or members of the board changed. Without a time all tasks and comments of the board are returned.
+    :param board: the board whose changes should be returned
+    :param since: the time of the last sync of the client or None for a full sync
+    """
+def get_board_changes(board, since=None):
+    tasks = with_task_list_relations(BoardTask.objects.filter(board=board))
+    comments = TaskComment.objects.filter(task__board=board).select_related('author')
+    deleted = {'task': [], 'comment': []}
+    if since is not None:
+        tasks = tasks.filter(updated_at__gte=since)
+        comments = comments.filter(updated_at__gte=since)
+        for kind, object_id in Tombstone.objects.filter(board=board, deleted_at__gte=since).values_list('kind', 'object_id'):
+            deleted[kind].append(object_id)
+    return {
+        'board_changed': since is None or board.updated_at >= since,
+        'tasks': list(tasks.order_by('id')),
+        'comments': list(comments.order_by('id')),
+        'deleted_tasks': deleted['task'],
+        'deleted_comments': deleted['comment'],
+    }
+
+
+"""
+    The functions `encode_sync_cursor` and `decode_sync_cursor` convert the time and the board version of a delta sync into an opaque cursor and back.
+    """
+def encode_sync_cursor(synced_at, version):
+    return b64encode(f'{synced_at.isoformat()}|{version}'.encode('ascii')).decode('ascii')
+
+
+def decode_sync_cursor(cursor):
     try:
-        return User.objects.get(email=email)
-    except User.DoesNotExist:
-        return Response({'error': 'Email not found'}, status=status.HTTP_404_NOT_FOUND)
-    except Exception as e:
-        return Response({'error': f'Internal Error: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        synced_at, version = b64decode(cursor.encode('ascii')).decode('ascii').split('|')
+        synced_at = parse_datetime(synced_at)
+        version = int(version)
+    except (TypeError, ValueError, UnicodeError, BinasciiError):
+        raise NotFound('Invalid cursor')
+    if synced_at is None:
+        raise NotFound('Invalid cursor')
+    return synced_at, version
+
+
+"""
+    The function `get_sync_start` returns the time from which the changes of a board have to be sent for a cursor, or None when the client needs a full sync because it has no cursor or its cursor is older than the kept tombstones. The time goes back by `KANBAN_SYNC_OVERLAP` seconds, so changes which were committed shortly after the last sync are not missed.
+    """
+def get_sync_start(cursor, now):
+    if cursor is None:
+        return None
+    synced_at, version = cursor
+    if synced_at < now - timedelta(days=getattr(settings, 'KANBAN_SYNC_RETENTION_DAYS', 30)):
+        return None
+    return synced_at - timedelta(seconds=getattr(settings, 'KANBAN_SYNC_OVERLAP', 5))
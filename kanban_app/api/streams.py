@@ -0,0 +1,119 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from rest_framework import exceptions
+
+from auth_app.api.authentication import CachedTokenAuthentication
+from kanban_app.events import get_event_broker
+from kanban_app.models import Board
+from .services import annotate_board_access
+
+
+STREAM_TICKET_SALT = 'kanban_app.stream_ticket'
+
+
+"""
+    The function `create_stream_ticket` signs a ticket which lets the user open the event stream of one board for `KANBAN_EVENT_TICKET_MAX_AGE` seconds. The ticket is sent in the url instead of the DRF token, because the urls end up in the logs of servers and proxies and the token never expires.
+    """
+def create_stream_ticket(board_id, user_id):
+    return signing.dumps({'board': board_id, 'user': user_id}, salt=STREAM_TICKET_SALT)
+
+
+"""
+    The function `read_stream_ticket` checks the signature, the age and the board of a ticket of `create_stream_ticket`.
+    :return: the id of the user or None if the ticket is invalid, expired or belongs to another board
+    """
+def read_stream_ticket(ticket, board_id):
+    try:
+        data = signing.loads(ticket, salt=STREAM_TICKET_SALT, max_age=getattr(settings, 'KANBAN_EVENT_TICKET_MAX_AGE', 60))
+    except signing.BadSignature:
+        return None
+    return data['user'] if data.get('board') == board_id else None
+
+
+"""
+    The function `authenticate_stream_request` authenticates the request of an event stream with the DRF token of the user in the `Authorization: Token ...` header or, because the browser `EventSource` cannot send headers, with a stream ticket of the board in the query param `ticket`. The token itself is not accepted in the url.
+    :return: the user or None if no valid token or ticket was sent
+    """
+def authenticate_stream_request(request, board_id):
+    try:
+        result = CachedTokenAuthentication().authenticate(request)
+    except exceptions.AuthenticationFailed:
+        return None
+    if result is not None:
+        return result[0]
+    user_id = read_stream_ticket(request.GET['ticket'], board_id) if request.GET.get('ticket') else None
+    if user_id is None:
+        return None
+    return User.objects.filter(pk=user_id, is_active=True).first()
+
+
+"""
+    The function `has_board_access` checks with one query if the user is owner or member of the board.
+    :return: None if the board does not exist, otherwise if the user has access
+    """
+async def has_board_access(board_id, user):
+    board = await annotate_board_access(Board.objects.filter(pk=board_id), user).values('owner_id', 'is_member').afirst()
+    if board is None:
+        return None
+    return board['owner_id'] == user.id or board['is_member']
+
+
+"""
+    The function `format_event` formats an event as a server-sent event.
+    """
+def format_event(event):
+    return f'event: {event["type"]}\ndata: {json.dumps(event)}\n\n'
+
+
+"""
+    The function `stream_board_events` subscribes to the events of a board when the streaming starts and sends them until the client disconnects, the board is deleted or the user is no longer a member of the board. While no event arrives, a comment is sent every `KANBAN_EVENT_HEARTBEAT` seconds, so proxies do not close the connection.
+    """
+async def stream_board_events(board_id, user):
+    heartbeat = getattr(settings, 'KANBAN_EVENT_HEARTBEAT', 15)
+    subscription = get_event_broker().subscribe(board_id)
+    try:
+        yield format_event({'type': 'ready', 'board': board_id})
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield ': heartbeat\n\n'
+                continue
+            yield format_event(event)
+            if event['type'] == 'board.deleted':
+                break
+            if event['type'] == 'members.changed' and not await has_board_access(subscription.board_id, user):
+                yield format_event({'type': 'forbidden', 'board': subscription.board_id})
+                break
+    finally:
+        get_event_broker().unsubscribe(subscription)
+
+
+"""
+The view `board_event_stream` streams the task, comment and member events of a board as server-sent events to its owner and members. The events only contain ids: after the `ready` event and after every further event the client loads the changes with the delta sync of the board (`/api/boards/{board_id}/changes/`). The stream needs an ASGI server, because every open stream only waits in the event loop instead of blocking a worker.
+"""
+@require_GET
+async def board_event_stream(request, pk):
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({'detail': 'The event stream needs an ASGI server.'}, status=501)
+    user = await sync_to_async(authenticate_stream_request)(request, pk)
+    if user is None:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+    access = await has_board_access(pk, user)
+    if access is None:
+        return JsonResponse({'detail': 'No Board matches the given query.'}, status=404)
+    if not access:
+        return JsonResponse({'detail': 'You do not have permission to perform this action.'}, status=403)
+    response = StreamingHttpResponse(stream_board_events(pk, user), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
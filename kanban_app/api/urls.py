@@ -1,14 +1,32 @@
 from django.urls import path
-from .views import BoardsView, TaskListView, BoardDetailView, TaskReviewingListView, AssignedTaskListView, CheckEmailView, TaskDetailView, TaskCommentListView, TaskCommentDeleteView
+from .views import BoardsView, TaskListView, BoardDetailView, TaskReviewingListView, AssignedTaskListView, CheckEmailView, TaskDetailView, TaskCommentListView, TaskCommentDeleteView, BulkCheckEmailView, TaskBatchView, TaskSearchView, ResponseCacheStatsView, BoardAnalyticsView, BoardChangesView, BoardExportView, BoardHistoryView, EventBrokerStatsView, BoardEventTicketView
+from .streams import board_event_stream
+from . import async_views
 
 urlpatterns = [
     path('boards/', BoardsView.as_view(), name='boards_list'),
     path('boards/<int:pk>/', BoardDetailView.as_view(), name='board_detail'),
+    path('boards/<int:pk>/changes/', BoardChangesView.as_view(), name='board_changes'),
+    path('boards/<int:pk>/events/', board_event_stream, name='board_events'),
+    path('boards/<int:pk>/events/ticket/', BoardEventTicketView.as_view(), name='board_event_ticket'),
+    path('boards/<int:pk>/analytics/', BoardAnalyticsView.as_view(), name='board_analytics'),
+    path('boards/<int:pk>/history/', BoardHistoryView.as_view(), name='board_history'),
+    path('boards/<int:pk>/export/<str:table>.<str:export_format>', BoardExportView.as_view(), name='board_export'),
     path('tasks/', TaskListView.as_view(), name='task_list'),
+    path('tasks/batch/', TaskBatchView.as_view(), name='task_batch'),
+    path('tasks/search/', TaskSearchView.as_view(), name='task_search'),
     path('tasks/assigned-to-me/', AssignedTaskListView.as_view(), name='my_assigned_tasks'),
     path('tasks/reviewing/', TaskReviewingListView.as_view(), name='reviewing_tasks'),
     path('tasks/<int:pk>/', TaskDetailView.as_view(), name='task_detail'),
     path('tasks/<int:task_id>/comments/', TaskCommentListView.as_view(), name='task_comment_list'),
     path('tasks/<int:task_id>/comments/<int:comment_id>/', TaskCommentDeleteView.as_view(), name='task_comment_delete'),
     path('email-check/', CheckEmailView.as_view(), name='email-check'),
-]
\ No newline at end of file
+    path('email-check/bulk/', BulkCheckEmailView.as_view(), name='email-check-bulk'),
+    path('response-cache/stats/', ResponseCacheStatsView.as_view(), name='response_cache_stats'),
+    path('events/stats/', EventBrokerStatsView.as_view(), name='event_broker_stats'),
+    path('async/boards/', async_views.board_list, name='async_boards_list'),
+    path('async/boards/<int:pk>/', async_views.board_detail, name='async_board_detail'),
+    path('async/tasks/assigned-to-me/', async_views.assigned_tasks, name='async_my_assigned_tasks'),
+    path('async/tasks/reviewing/', async_views.reviewing_tasks, name='async_reviewing_tasks'),
+    path('async/tasks/<int:task_id>/comments/', async_views.task_comment_list, name='async_task_comment_list'),
+]
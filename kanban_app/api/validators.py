@@ -8,42 +8,45 @@ from rest_framework.response import Response
 
 """
     The function `validate_board_member` checks if a user is a member of a board.
+    :param resolver: the `BoardMembershipResolver` of the request which provides the members of the board
     :param board: provides the board object in which the user should be a member.
     :param user: the user who should be member of the board
     when the user does not exist in the provided board as a member a Validation Error is raised
     """
-def validate_board_member(board, user):
-    if not board.members.filter(id=user.id).exists():
+def validate_board_member(resolver, board, user):
+    if not resolver.is_member(board.pk, user.id):
         raise serializers.ValidationError({'error': 'User is not a member of the board'})
 
 
 """
     The function `validate_user in board` checks if a specific user is a member of a board.
+    :param resolver: the `BoardMembershipResolver` of the request which provides the members of the board
     :param board: provides the board object in which the user should be a member.
     :param user_id: the id of the user who should be member of the board
     :param field_name: the string which should be shown in the error message (f.e. the full name of the user)
     when the user does not exist in the provided board as a member a Validation Error is raised
     """
-def validate_user_in_board(board, user_id, field_name):
+def validate_user_in_board(resolver, board, user_id, field_name):
     if user_id is None:
         return
-    if not board.members.filter(id=user_id).exists():
+    if not resolver.is_member(board.pk, user_id):
         raise serializers.ValidationError({'error': f'{field_name} has to be a member of the board.'})
 
 
 """
     The function `validate_board_user_relation` checks if the assignee and reviewer are valid users in
     the given board.
+    :param resolver: the `BoardMembershipResolver` of the request which provides the members of the board
     :param board: The board object 
     :param assignee: The assigned user to the task
     :param reviewer: The user which is the reviewer of the task
     This function checks if the given users are members of the provided board.
     """
-def validate_board_user_relation(board, assignee, reviewer):
+def validate_board_user_relation(resolver, board, assignee, reviewer):
         if assignee:
-            validate_user_in_board(board, assignee.id, 'Assignee')
+            validate_user_in_board(resolver, board, assignee.id, 'Assignee')
         if reviewer:
-            validate_user_in_board(board, reviewer.id, 'Reviewer')
+            validate_user_in_board(resolver, board, reviewer.id, 'Reviewer')
 
 
 """
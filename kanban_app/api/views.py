@@ -1,39 +1,70 @@
+from django.db import transaction
 from django.db.models import Q
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
 
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import generics, status
-from rest_framework.permissions import IsAuthenticated
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
 
-from .serializers import BoardListSerializer, TaskListSerializer, BoardDetailSerializer, UserNestedSerializer, TaskDetailSerializer, TaskCommentSerializer, BoardDetailUpdateSerializer
-from kanban_app.models import Board, BoardTask, TaskComment
+from .serializers import BoardChangesSerializer, BulkEmailCheckSerializer, TaskBatchSerializer, TaskListFilterSerializer, BoardListSerializer, TaskListSerializer, BoardDetailSerializer, UserNestedSerializer, TaskDetailSerializer, TaskCommentSerializer, BoardDetailUpdateSerializer
+from kanban_app.counters import bump_board_version
+from kanban_app.email_lookups import get_user_by_email, get_users_by_emails
+from kanban_app.response_cache import get_task_list_version, invalidate_task_lists, response_cache
+from kanban_app.analytics import compute_board_analytics
+from kanban_app.events import get_event_broker, publish_board_event
+from kanban_app.history import get_board_history
+from kanban_app.export import EXPORT_CONTENT_TYPES, EXPORT_TABLES, astream_export, stream_export
+from kanban_app.search import index_comment, is_search_available, remove_comment, search_tasks
+from kanban_app.sync import record_tombstone, touch_task
+from kanban_app.timing import TimedViewMixin
+from kanban_app.models import Board, BoardTask, TaskComment, BOARD_COUNTER_FIELDS
 from .permissions import IsBoardOwnerOrMember, IsBoardMember, IsAllowedToUpdateOrDelete, IsAssignee, IsReviewer, IsBoardOfTaskMember
 from .validators import validate_email_address
-from .services import get_user_by_email
+from .conditional import BoardVersionETagMixin
+from .response_cache import CachedResponseMixin, get_board_analytics_cache_key, get_board_detail_cache_key, get_task_list_cache_key
+from .membership import get_membership_resolver
+from .pagination import KeysetPagination
+from .streams import create_stream_ticket
+from .read_serializers import BoardListRowSerializer, TaskListRowSerializer, serialize_board_detail, serialize_normalized_board_detail, serialize_task_row
+from .renderers import NormalizedJSONRenderer, get_board_detail_layout
+from .services import annotate_board_access, apply_task_batch, board_list_values, filter_tasks, task_list_values, decode_sync_cursor, encode_sync_cursor, get_board_changes, get_sync_start, get_boards_of_user
 
 
 """
 The `BoardsView` class defines a view for listing and creating Board objects, with permission checks for authenticated users who are either the owner or a member of a board.
 """
-class BoardsView(generics.ListCreateAPIView):
+class BoardsView(TimedViewMixin, generics.ListCreateAPIView):
     queryset = Board.objects.all()
     serializer_class = BoardListSerializer
     permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
 
     def get_queryset(self):
-        user = self.request.user
-        return Board.objects.filter(Q(owner=user) | Q(members=user)).distinct()
+        return board_list_values(get_boards_of_user(self.request.user))
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return BoardListRowSerializer
+        return BoardListSerializer
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
             members_ids = serializer.validated_data.pop("members", [])
             user = request.user
-            board = Board.objects.create(owner=user, title=serializer.validated_data["title"])
-            if members_ids:
-                board.members.add(*members_ids)
+            with transaction.atomic():
+                board = Board.objects.create(owner=user, title=serializer.validated_data["title"])
+                if members_ids:
+                    board.members.add(*members_ids)
+            board.refresh_from_db(fields=BOARD_COUNTER_FIELDS)
             read_serializer = self.get_serializer(board)
             return Response(read_serializer.data, status=status.HTTP_201_CREATED)
         else:
@@ -43,9 +74,62 @@ class BoardsView(generics.ListCreateAPIView):
 """
 This is a view for retrieving, updating, and deleting a Board object with different serializer classes based on the request method. For retrieving and updating are two different responses provided. These requests can only be performed if the user is the owner or one of the members of the board.
 """
-class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
+class BoardDetailView(TimedViewMixin, BoardVersionETagMixin, CachedResponseMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Board.objects.all()
     permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NormalizedJSONRenderer]
+
+    def get_layout(self):
+        return get_board_detail_layout(self.request.accepted_renderer)
+
+    def get_etag_kind(self):
+        return 'board' if self.get_layout() == 'nested' else 'board-normalized'
+
+    """
+    The version and the access of the user are checked with one query on the primary key.
+    """
+    def get_board_version(self):
+        user = self.request.user
+        board = annotate_board_access(Board.objects.filter(pk=self.kwargs['pk']), user).values('version', 'owner_id', 'is_member').first()
+        if board is None or not (board['owner_id'] == user.id or board['is_member']):
+            return None
+        return (self.get_etag_kind(), self.kwargs['pk'], board['version'])
+
+    def get_loaded_board_version(self):
+        if hasattr(self, 'board'):
+            return (self.get_etag_kind(), self.kwargs['pk'], self.board.version)
+        return self.get_current_board_version()
+
+    def get_response_cache_key(self):
+        version = self.get_current_board_version()
+        if version is None:
+            return None
+        return get_board_detail_cache_key(self.kwargs['pk'], version[2], self.get_layout())
+
+    def get_object(self):
+        self.board = super().get_object()
+        return self.board
+
+    def get_queryset(self):
+        if self.request.method == 'GET':
+            return Board.objects.only('id', 'title', 'owner_id', 'version')
+        return Board.objects.all()
+
+    """
+    The board details are built by the read serializers: the members are taken from the `BoardMembershipResolver`, which has already loaded them for the permission check of a member, and the tasks are loaded as rows with one query. With the `NormalizedJSONRenderer` the normalized board details are returned.
+    """
+    def retrieve(self, request, *args, **kwargs):
+        board = self.get_object()
+        members = get_membership_resolver(request).get_members(board.pk).values()
+        tasks = task_list_values(BoardTask.objects.filter(board=board).order_by('id'))
+        if self.get_layout() == 'normalized':
+            return Response(serialize_normalized_board_detail(board, members, tasks))
+        return Response(serialize_board_detail(board, members, tasks))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        patch_vary_headers(response, ['Accept'])
+        return response
 
     def get_serializer_class(self):
         if self.request.method == 'PATCH':
@@ -53,55 +137,235 @@ class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
         return BoardDetailSerializer
         
 
+"""
+The `BoardChangesView` class returns the changes of a board since the cursor of the last sync of the client: the created and changed tasks and comments, the ids of the deleted tasks and comments and the board itself when its title, owner or members changed. Without a cursor, or with a cursor which is older than the kept tombstones, all tasks and comments are returned with `reset` set to true. When the version of the board did not change since the cursor, nothing is loaded apart from the board.
+"""
+class BoardChangesView(TimedViewMixin, generics.GenericAPIView):
+    queryset = Board.objects.all()
+    serializer_class = BoardChangesSerializer
+    permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+
+    def get(self, request, pk):
+        encoded = request.query_params.get('cursor')
+        cursor = decode_sync_cursor(encoded) if encoded else None
+        now = timezone.now()
+        board = self.get_object()
+        if cursor and cursor[1] == board.version and get_sync_start(cursor, now) is not None:
+            changes = {'board_changed': False, 'tasks': [], 'comments': [], 'deleted_tasks': [], 'deleted_comments': []}
+            data = {**changes, 'cursor': encoded, 'version': board.version, 'reset': False, 'board': board}
+        else:
+            since = get_sync_start(cursor, now)
+            changes = get_board_changes(board, since)
+            data = {**changes, 'cursor': encode_sync_cursor(now, board.version), 'version': board.version, 'reset': since is None, 'board': board}
+        return Response(self.get_serializer(data).data, status=status.HTTP_200_OK)
+
+
+"""
+The `BoardHistoryView` class returns the recorded changes of the status, the assignee and the priority of the tasks of a board to its owner and members, column by column and in pages of up to `KANBAN_HISTORY_MAX_PAGE_SIZE` transitions. The query param `after` continues after the id in `next` of the previous page, `limit` changes the page size and `task` only returns the transitions of one task.
+"""
+class BoardHistoryView(TimedViewMixin, generics.GenericAPIView):
+    queryset = Board.objects.only('id', 'owner_id')
+    permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+
+    def get(self, request, pk):
+        board = self.get_object()
+        try:
+            after = int(request.query_params.get('after', 0))
+            task_id = int(request.query_params['task']) if 'task' in request.query_params else None
+        except ValueError:
+            raise NotFound('Invalid cursor')
+        data = get_board_history(board.pk, after, self.get_limit(), task_id)
+        return Response(data, status=status.HTTP_200_OK)
+
+    def get_limit(self):
+        page_size = getattr(settings, 'KANBAN_HISTORY_PAGE_SIZE', 10000)
+        try:
+            limit = int(self.request.query_params['limit'])
+        except (KeyError, ValueError):
+            return page_size
+        if limit <= 0:
+            return page_size
+        return min(limit, getattr(settings, 'KANBAN_HISTORY_MAX_PAGE_SIZE', 100000))
+
+
+"""
+The `BoardExportView` class streams the tasks or the comments of a board as Arrow IPC stream (`tasks.arrow`) or Parquet file (`tasks.parquet`) to its owner and members. The rows are read and written in record batches while the response is sent, so the memory stays flat regardless of the size of the board.
+"""
+class BoardExportView(TimedViewMixin, generics.GenericAPIView):
+    queryset = Board.objects.only('id', 'owner_id')
+    permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+
+    def get(self, request, pk, table, export_format):
+        if table not in EXPORT_TABLES or export_format not in EXPORT_CONTENT_TYPES:
+            raise Http404
+        board = self.get_object()
+        if isinstance(request._request, ASGIRequest):
+            content = astream_export(table, export_format, [board.pk])
+        else:
+            content = stream_export(table, export_format, [board.pk])
+        response = StreamingHttpResponse(content, content_type=EXPORT_CONTENT_TYPES[export_format])
+        response['Content-Disposition'] = f'attachment; filename="board-{board.pk}-{table}.{export_format}"'
+        return response
+
+
+"""
+The `BoardAnalyticsView` class returns the metrics of a board to its owner and members: the counts by status and priority, the overdue tasks, the created tasks per week and the workload of the assignees and reviewers. The metrics are computed with NumPy from the columns of all tasks of the board and cached under the version of the board, so they are only computed again after a change of the board or on the next day.
+"""
+class BoardAnalyticsView(TimedViewMixin, generics.GenericAPIView):
+    queryset = Board.objects.only('id', 'owner_id', 'version')
+    permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+
+    def get(self, request, pk):
+        board = self.get_object()
+        today = timezone.localdate()
+        key = get_board_analytics_cache_key(board.pk, board.version, today)
+        data = response_cache.get(key)
+        if data is None:
+            data = compute_board_analytics(board.pk, today)
+            response_cache.set(key, data)
+        return Response(data, status=status.HTTP_200_OK)
+
+
 """
 This class represents a view in a Django REST framework API for listing and creating BoardTask objects with authentication and permission checks.
+The list only contains the tasks of the boards where the user is owner or member. It can be filtered with the query params `board`, `status`, `priority`, `assignee`, `reviewer`, `due_date_after` and `due_date_before` and ordered with `ordering`, see `TaskListFilterSerializer`.
+The ids of a page are found first without the users and the comment counts, which are then only loaded for the tasks of the page in the same query, instead of for every task the database sorts.
 """
-class TaskListView(generics.ListCreateAPIView):
+class TaskListView(TimedViewMixin, generics.ListCreateAPIView):
     queryset = BoardTask.objects.all()
     serializer_class = TaskListSerializer
+    pagination_class = KeysetPagination
     permission_classes = [IsAuthenticated, IsBoardMember]
 
-    def get_queryset(self):
-        return BoardTask.objects.all()
+    def filter_queryset(self, queryset):
+        filters = TaskListFilterSerializer(data=self.request.query_params)
+        filters.is_valid(raise_exception=True)
+        self.ordering = filters.validated_data['ordering']
+        return filter_tasks(queryset, self.request.user, filters.validated_data)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page_queryset = self.paginator.get_page_queryset(queryset, request, self.ordering)
+        if page_queryset is None:
+            return Response(self.get_serializer(task_list_values(queryset), many=True).data)
+        rows = task_list_values(BoardTask.objects.filter(pk__in=page_queryset.values('pk'))).order_by(*page_queryset.query.order_by)
+        page = self.paginator.set_page(list(rows))
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return TaskListRowSerializer
+        return TaskListSerializer
     
     def post(self, request):
         serializer = self.get_serializer(data=request.data, context={"request": request})
-        board_id = self.request.data.get('board')
-        board = get_object_or_404(Board, pk=board_id)
+        board = get_membership_resolver(request).get_board(request.data.get('board'))
+        if board is None:
+            raise Http404
         serializer.is_valid(raise_exception=True)
         serializer.save(board=board, creator = request.user)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     
+"""
+This class represents a view for creating, updating and deleting many tasks of one board with one request. The membership is checked once for the whole batch and all tasks are written in one transaction. The response contains the created and updated tasks and the ids of the deleted tasks in the order of the batch.
+"""
+class TaskBatchView(TimedViewMixin, APIView):
+    permission_classes = [IsAuthenticated, IsBoardMember]
+
+    def post(self, request):
+        resolver = get_membership_resolver(request)
+        if resolver.get_board(request.data.get('board')) is None:
+            raise Http404
+        serializer = TaskBatchSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        created, updated, deleted = apply_task_batch(data['board'], request.user, resolver, data['create'], data['update'], data['delete'])
+        return Response({
+            'created': TaskListSerializer(created, many=True).data,
+            'updated': TaskListSerializer(updated, many=True).data,
+            'deleted': deleted,
+        }, status=status.HTTP_200_OK)
+
+
+"""
+The `TaskSearchView` class searches the titles, descriptions and comments of the tasks in the boards of the user with the full-text search (`?q=`), optionally only in one board (`?board=`). The results are ranked, paginated with `page` and `page_size` and contain the task like the task lists and a snippet of the best matching text. The search needs the FTS5 table of SQLite.
+"""
+class TaskSearchView(TimedViewMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if not is_search_available():
+            return Response({'detail': 'The full-text search needs SQLite.'}, status=status.HTTP_501_NOT_IMPLEMENTED)
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            return Response({'q': ['This field is required.']}, status=status.HTTP_400_BAD_REQUEST)
+        page, page_size = self.get_page(request)
+        try:
+            board_id = int(request.query_params['board']) if 'board' in request.query_params else None
+        except ValueError:
+            return Response({'board': ['A valid integer is required.']}, status=status.HTTP_400_BAD_REQUEST)
+        results, count = search_tasks(request.user, text, (page - 1) * page_size, page_size, board_id)
+        rows = {row['id']: row for row in task_list_values(BoardTask.objects.filter(pk__in=[result['task'] for result in results]))}
+        data = [{**serialize_task_row(rows[result['task']]), 'snippet': result['snippet']} for result in results if result['task'] in rows]
+        url = request.build_absolute_uri()
+        return Response({
+            'count': count,
+            'next': replace_query_param(url, 'page', page + 1) if page * page_size < count else None,
+            'previous': replace_query_param(url, 'page', page - 1) if page > 1 else None,
+            'results': data,
+        })
+
+    def get_page(self, request):
+        try:
+            page = max(int(request.query_params.get('page', 1)), 1)
+            page_size = int(request.query_params.get('page_size', KeysetPagination.page_size))
+        except ValueError:
+            return 1, KeysetPagination.page_size
+        if page_size <= 0:
+            page_size = KeysetPagination.page_size
+        return page, min(page_size, KeysetPagination.max_page_size)
+
+
 """
 This class represents a view for listing tasks that have the logged in user as the reviewer.
 """
-class TaskReviewingListView(generics.ListAPIView):
+class TaskReviewingListView(TimedViewMixin, CachedResponseMixin, generics.ListAPIView):
     queryset = BoardTask.objects.all()
-    serializer_class = TaskListSerializer
+    serializer_class = TaskListRowSerializer
+    pagination_class = KeysetPagination
     permission_classes = [IsAuthenticated, IsReviewer]
 
     def get_queryset(self):
         user = self.request.user
-        return BoardTask.objects.filter(Q(reviewer=user))
+        return task_list_values(BoardTask.objects.filter(Q(reviewer=user)))
+
+    def get_response_cache_key(self):
+        user_id = self.request.user.id
+        return get_task_list_cache_key('reviewing', user_id, get_task_list_version(user_id), self.request)
     
 
 """
 This class represents a view for listing tasks that have the logged in user as the assignee.
 """
-class AssignedTaskListView(generics.ListAPIView):
+class AssignedTaskListView(TimedViewMixin, CachedResponseMixin, generics.ListAPIView):
     queryset = BoardTask.objects.all()
-    serializer_class = TaskListSerializer
+    serializer_class = TaskListRowSerializer
+    pagination_class = KeysetPagination
     permission_classes = [IsAuthenticated, IsAssignee]
 
     def get_queryset(self):
         user = self.request.user
-        return BoardTask.objects.filter(Q(assignee=user))
+        return task_list_values(BoardTask.objects.filter(Q(assignee=user)))
+
+    def get_response_cache_key(self):
+        user_id = self.request.user.id
+        return get_task_list_cache_key('assigned', user_id, get_task_list_version(user_id), self.request)
     
     
 """
-A view to check if a specific mail address can be found in the user data to check if the user of this mail address can be added to a board as a member.
+A view to check if a specific mail address can be found in the user data to check if the user of this mail address can be added to a board as a member. The user is looked up like in the bulk check, from the same cache.
 """
-class CheckEmailView(APIView):
+class CheckEmailView(TimedViewMixin, APIView):
     permission_classes = [IsAuthenticated] 
 
     def get(self, request):
@@ -110,66 +374,152 @@ class CheckEmailView(APIView):
         if error_response:
             return error_response
         user = get_user_by_email(email)
-        if isinstance(user, Response):
-            return user
-        serializer = UserNestedSerializer(user)
-        return Response(serializer.data)
+        if user is None:
+            return Response({'error': 'Email not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(user)
+
+
+"""
+A view to check many mail addresses at once before adding their users to a board as members. It returns the found users and the mail addresses without a user.
+"""
+class BulkCheckEmailView(TimedViewMixin, APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = BulkEmailCheckSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        users, unknown_emails = get_users_by_emails(serializer.validated_data['emails'])
+        return Response({'users': users, 'unknown_emails': unknown_emails})
 
 
 """
 This is a view for retrieving, updating and deleting tasks of a specific board. The permissions requires the logged in user to be member of the board for updating the task and to be creator or board owner for deleting the task.
 """
-class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = BoardTask.objects.all()
+class TaskDetailView(TimedViewMixin, BoardVersionETagMixin, generics.RetrieveUpdateDestroyAPIView):
+    queryset = BoardTask.objects.select_related('board', 'assignee', 'reviewer')
     serializer_class = TaskDetailSerializer
     permission_classes = [IsAuthenticated, IsAllowedToUpdateOrDelete]
 
+    def get_board_version(self):
+        task = BoardTask.objects.filter(pk=self.kwargs['pk']).values('board__version').first()
+        if task is None:
+            return None
+        return ('task', self.kwargs['pk'], task['board__version'])
+
+    def get_loaded_board_version(self):
+        return ('task', self.kwargs['pk'], self.task.board.version)
+
+    def get_object(self):
+        self.task = super().get_object()
+        return self.task
+
 
 """
-The `TaskCommentMixin` class provides methods to retrieve a task and check if the current user is a member of the board associated with that task.
+The `TaskCommentMixin` class provides methods to retrieve a task and check if the current user is a member of the board associated with that task. The task is loaded together with its board only once per request, the members of the board are provided by the `BoardMembershipResolver` of the request.
 """
 class TaskCommentMixin:
     def get_task(self):
-        task_id = self.kwargs.get('task_id')
-        return get_object_or_404(BoardTask, pk=task_id)
+        if not hasattr(self, '_task'):
+            task_id = self.kwargs.get('task_id')
+            self._task = get_object_or_404(BoardTask.objects.select_related('board'), pk=task_id)
+            get_membership_resolver(self.request).remember_board(self._task.board)
+        return self._task
 
     def check_board_membership(self):
         task = self.get_task()
-        if not task.board.members.filter(id=self.request.user.id).exists():
+        if not get_membership_resolver(self.request).is_member(task.board_id, self.request.user.id):
             raise PermissionDenied('You have to be a member of the board.')
         
 
 """
 This class represents a view for listing and creating task comments with permissions for board members and a filter method to get the comments of a specific task.
 """
-class TaskCommentListView(TaskCommentMixin, generics.ListCreateAPIView):
+class TaskCommentListView(TimedViewMixin, BoardVersionETagMixin, TaskCommentMixin, generics.ListCreateAPIView):
     serializer_class = TaskCommentSerializer
+    pagination_class = KeysetPagination
     permission_classes = [IsAuthenticated, IsBoardOfTaskMember]
 
     def get_queryset(self):
-        return TaskComment.objects.filter(task=self.get_task())
+        return TaskComment.objects.filter(task=self.get_task()).select_related('author')
 
     def create(self, request, *args, **kwargs):
         if not request.data:
             return Response({'error': 'Body must not be empty'}, status=status.HTTP_400_BAD_REQUEST)
         return super().create(request, *args, **kwargs)
 
+    """
+    The task and its board are already loaded by the permission check, so the version is read without a query.
+    """
+    def get_board_version(self):
+        task = self.get_task()
+        return ('comments', task.pk, task.board.version)
+
     def perform_create(self, serializer):
-        serializer.save(task=self.get_task(), author=self.request.user)
+        task = self.get_task()
+        with transaction.atomic():
+            comment = serializer.save(task=task, author=self.request.user)
+            bump_board_version(task.board_id)
+            publish_board_event(task.board_id, 'comment.created', task=task.pk, comment=comment.pk)
+            touch_task(task.pk)
+            index_comment(task.pk, comment.content)
+            invalidate_task_lists([task.assignee_id, task.reviewer_id])
             
 
 
 """
 The class `TaskCommentDeleteView` allows users who are board members of a task to delete their own comments.
 """
-class TaskCommentDeleteView(TaskCommentMixin, generics.DestroyAPIView):
+class TaskCommentDeleteView(TimedViewMixin, TaskCommentMixin, generics.DestroyAPIView):
     serializer_class = TaskCommentSerializer
     permission_classes = [IsAuthenticated, IsBoardOfTaskMember]
 
     def get_object(self):
-        return get_object_or_404(TaskComment, pk=self.kwargs['comment_id'], task=self.get_task())
+        return get_object_or_404(self.get_task().comments, pk=self.kwargs['comment_id'])
 
     def perform_destroy(self, instance):
-        if instance.author != self.request.user:
+        if instance.author_id != self.request.user.id:
             raise PermissionDenied('Only the author of the comment can delete.')
-        instance.delete()
\ No newline at end of file
+        task = self.get_task()
+        with transaction.atomic():
+            comment_id = instance.pk
+            instance.delete()
+            record_tombstone(task.board_id, 'comment', comment_id)
+            publish_board_event(task.board_id, 'comment.deleted', task=task.pk, comment=comment_id)
+            bump_board_version(task.board_id)
+            touch_task(task.pk)
+            remove_comment(task.pk, instance.content)
+            invalidate_task_lists([task.assignee_id, task.reviewer_id])
+
+
+"""
+The `ResponseCacheStatsView` class shows the backend, hits, misses and hit rate of the response cache of this process to staff users, so the size and timeout of the `responses` cache can be tuned.
+"""
+class ResponseCacheStatsView(TimedViewMixin, APIView):
+    permission_classes = [IsAdminUser]
+    def get(self, request):
+        return Response(response_cache.stats(), status=status.HTTP_200_OK)
+
+
+"""
+The `EventBrokerStatsView` class shows the number of boards with subscribers, the number of subscribers and the published events of the event broker of this process to staff users.
+"""
+class EventBrokerStatsView(TimedViewMixin, APIView):
+    permission_classes = [IsAdminUser]
+    def get(self, request):
+        return Response(get_event_broker().stats(), status=status.HTTP_200_OK)
+
+"""
+The `BoardEventTicketView` class gives the owner and the members of a board a short-lived ticket for the event stream of the board, which the browser `EventSource` sends in the url instead of the DRF token.
+"""
+class BoardEventTicketView(TimedViewMixin, generics.GenericAPIView):
+    queryset = Board.objects.only('id', 'owner_id')
+    permission_classes = [IsAuthenticated, IsBoardOwnerOrMember]
+
+    def get(self, request, pk):
+        board = self.get_object()
+        response = Response({
+            'ticket': create_stream_ticket(board.pk, request.user.id),
+            'expires_in': getattr(settings, 'KANBAN_EVENT_TICKET_MAX_AGE', 60),
+        }, status=status.HTTP_200_OK)
+        response['Cache-Control'] = 'no-store'
+        return response
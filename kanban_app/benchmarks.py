@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils import timezone
+
+from kanban_app.api.services import encode_sync_cursor
+from kanban_app.email_lookups import get_email_lookup_key
+from kanban_app.models import Board, BoardTask, TaskComment
+
+
+"""
+The `QUERY_BUDGETS` pins the number of queries of every endpoint in `kanban_app/api/urls.py` for `kanban_app/tests/test_query_budgets.py`, the other query tests and the `benchmark_endpoints` command. Every entry contains the name of the check, the HTTP method, the url name, a function which returns the url kwargs and the request body for the seeded dataset, and the budget. The entries of one url name are requested in this order, so the writing requests come after the reading requests and the deleting requests at the end. The cached entries repeat the request before them, which is then answered from the response cache. The async views authenticate with the token, which is already in the token cache, like the forced authentication of the sync views.
+"""
+QUERY_BUDGETS = [
+    ('boards_list GET', 'get', 'boards_list', lambda data: ({}, None), 1),
+    ('board_detail GET', 'get', 'board_detail', lambda data: ({'pk': data['board'].pk}, None), 4),
+    ('board_detail GET cached', 'get', 'board_detail', lambda data: ({'pk': data['board'].pk}, None), 1),
+    ('board_detail GET normalized', 'get', 'board_detail', lambda data: ({'pk': data['board'].pk}, {'format': 'normalized'}), 4),
+    ('board_changes GET', 'get', 'board_changes', lambda data: ({'pk': data['board'].pk}, None), 4),
+    ('board_changes GET cursor', 'get', 'board_changes', lambda data: ({'pk': data['board'].pk}, {'cursor': encode_sync_cursor(timezone.now() - timedelta(minutes=1), 0)}), 5),
+    ('board_analytics GET', 'get', 'board_analytics', lambda data: ({'pk': data['board'].pk}, None), 3),
+    ('board_analytics GET cached', 'get', 'board_analytics', lambda data: ({'pk': data['board'].pk}, None), 1),
+    ('board_event_ticket GET', 'get', 'board_event_ticket', lambda data: ({'pk': data['board'].pk}, None), 1),
+    ('board_history GET', 'get', 'board_history', lambda data: ({'pk': data['board'].pk}, None), 2),
+    ('board_history GET task', 'get', 'board_history', lambda data: ({'pk': data['board'].pk}, {'task': data['task'].pk, 'limit': 100}), 2),
+    ('board_export GET', 'get', 'board_export', lambda data: ({'pk': data['board'].pk, 'table': 'tasks', 'export_format': 'parquet'}, None), 2),
+    ('task_search GET', 'get', 'task_search', lambda data: ({}, {'q': 'task comment', 'board': data['board'].pk}), 2),
+    ('task_search GET page', 'get', 'task_search', lambda data: ({}, {'q': 'Comm', 'page': 2, 'page_size': 1}), 3),
+    ('task_list GET', 'get', 'task_list', lambda data: ({}, None), 2),
+    ('task_list GET filtered', 'get', 'task_list', lambda data: ({}, {'board': data['board'].pk, 'status': 'to-do,review', 'priority': 'high', 'due_date_before': '2100-01-01', 'ordering': '-due_date'}), 2),
+    ('task_list GET assignee', 'get', 'task_list', lambda data: ({}, {'assignee': data['member'].pk, 'ordering': 'due_date'}), 2),
+    ('my_assigned_tasks GET', 'get', 'my_assigned_tasks', lambda data: ({}, None), 2),
+    ('my_assigned_tasks GET cached', 'get', 'my_assigned_tasks', lambda data: ({}, None), 1),
+    ('reviewing_tasks GET', 'get', 'reviewing_tasks', lambda data: ({}, None), 2),
+    ('reviewing_tasks GET cached', 'get', 'reviewing_tasks', lambda data: ({}, None), 1),
+    ('task_detail GET', 'get', 'task_detail', lambda data: ({'pk': data['task'].pk}, None), 1),
+    ('task_comment_list GET', 'get', 'task_comment_list', lambda data: ({'task_id': data['task'].pk}, None), 3),
+    ('email-check GET', 'get', 'email-check', lambda data: ({}, {'email': data['member'].email}), 1),
+    ('email-check-bulk POST', 'post', 'email-check-bulk', lambda data: ({}, {'emails': [data['user'].email, data['member'].email, 'unknown@example.com']}), 1),
+    ('response_cache_stats GET', 'get', 'response_cache_stats', lambda data: ({}, None), 0),
+    ('event_broker_stats GET', 'get', 'event_broker_stats', lambda data: ({}, None), 0),
+    ('async_boards_list GET', 'get', 'async_boards_list', lambda data: ({}, None), 1),
+    ('async_board_detail GET', 'get', 'async_board_detail', lambda data: ({'pk': data['board'].pk}, None), 4),
+    ('async_my_assigned_tasks GET', 'get', 'async_my_assigned_tasks', lambda data: ({}, None), 2),
+    ('async_reviewing_tasks GET', 'get', 'async_reviewing_tasks', lambda data: ({}, None), 2),
+    ('async_task_comment_list GET', 'get', 'async_task_comment_list', lambda data: ({'task_id': data['task'].pk}, None), 3),
+    ('boards_list POST', 'post', 'boards_list', lambda data: ({}, {'title': 'New Board', 'members': [data['member'].pk]}), 7),
+    ('board_detail PATCH', 'patch', 'board_detail', lambda data: ({'pk': data['board'].pk}, {'title': 'Renamed', 'members': [data['user'].pk, data['member'].pk]}), 11),
+    ('task_list POST', 'post', 'task_list', lambda data: ({}, {'board': data['board'].pk, 'title': 'New Task', 'status': 'to-do', 'priority': 'high', 'assignee_id': data['member'].pk, 'reviewer_id': data['user'].pk}), 8),
+    ('task_detail PATCH', 'patch', 'task_detail', lambda data: ({'pk': data['task'].pk}, {'status': 'done', 'priority': 'low'}), 7),
+    ('task_batch POST', 'post', 'task_batch', lambda data: ({}, {'board': data['board'].pk, 'create': [{'title': f'Batch Task {i}', 'status': 'to-do', 'priority': 'high', 'assignee_id': data['member'].pk} for i in range(5)], 'update': [{'id': data['task'].pk, 'status': 'review', 'reviewer_id': data['member'].pk}]}), 11),
+    ('task_comment_list POST', 'post', 'task_comment_list', lambda data: ({'task_id': data['task'].pk}, {'content': 'New Comment'}), 9),
+    ('task_comment_delete DELETE', 'delete', 'task_comment_delete', lambda data: ({'task_id': data['task'].pk, 'comment_id': data['comment'].pk}, None), 10),
+    ('task_detail DELETE', 'delete', 'task_detail', lambda data: ({'pk': data['task'].pk}, None), 7),
+    ('board_detail DELETE', 'delete', 'board_detail', lambda data: ({'pk': data['board'].pk}, None), 10),
+]
+
+
+"""
+    The function `seed_dataset` creates a user with the given number of boards. Every board gets the given number of members and tasks with different status and priority, and every task gets the given number of comments. The rows are bulk created, so the board counters and the search index are not updated for them.
+    :param size: the number of boards, and of members per board, tasks per board and comments per task unless they are given
+    :param prefix: the prefix of the usernames and email addresses, so more than one dataset fits into one database
+    :return: a dict with the user who is owner and member of all boards, another member, all other members, the first board, its first task and the first comment of the task
+    """
+def seed_dataset(size, members=None, tasks=None, comments=None, prefix='budget'):
+    members = size if members is None else members
+    tasks = size if tasks is None else tasks
+    comments = size if comments is None else comments
+    user = User.objects.create(username=f'{prefix}-owner', email=f'{prefix}-owner@example.com')
+    users = User.objects.bulk_create([User(username=f'{prefix}-member-{i}', email=f'{prefix}-member-{i}@example.com') for i in range(members)])
+    states = [('to-do', 'high'), ('in-progress', 'low'), ('review', 'medium'), ('done', 'high')]
+    for i in range(size):
+        board = Board.objects.create(title=f'Board {i}', owner=user)
+        board.members.add(user, *users)
+        board_tasks = BoardTask.objects.bulk_create([
+            BoardTask(board=board, title=f'Task {j}', status=states[j % 4][0], priority=states[j % 4][1], assignee=users[j % members], reviewer=user, creator=user)
+            for j in range(tasks)
+        ])
+        TaskComment.objects.bulk_create([TaskComment(task=task, author=users[k % members], content=f'Comment {k}') for task in board_tasks for k in range(comments)])
+    board = Board.objects.filter(owner=user).order_by('pk').first()
+    task = board.tasks.order_by('pk').first()
+    comment = task.comments.filter(author=user).first() or TaskComment.objects.create(task=task, author=user, content='Own Comment')
+    return {'user': user, 'member': users[0], 'members': users, 'board': board, 'task': task, 'comment': comment}
+
+
+"""
+    The function `forget_email_lookups` removes the cached email lookups of the users of a dataset, because the users are rolled back afterwards.
+    """
+def forget_email_lookups(data):
+    emails = [data['user'].email, 'unknown@example.com'] + [member.email for member in data['members']]
+    cache.delete_many([get_email_lookup_key(email) for email in emails])
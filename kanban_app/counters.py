@@ -0,0 +1,95 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from kanban_app.models import Board
+
+
+"""
+The `pending_counter_deltas` collects the counter changes inside of `batched_counter_updates`.
+"""
+pending_counter_deltas = ContextVar('pending_counter_deltas', default=None)
+
+
+"""
+    The function `get_task_counter_deltas` returns the changes of the board counters caused by one task.
+    :param values: the tuple of board id, status and priority of the task
+    :param sign: 1 when the task is added to the board, -1 when it is removed
+    """
+def get_task_counter_deltas(values, sign):
+    board_id, status, priority = values
+    return board_id, {
+        'ticket_count': sign,
+        'tasks_to_do_count': sign if status == 'to-do' else 0,
+        'tasks_high_prio_count': sign if priority == 'high' else 0,
+    }
+
+
+"""
+    The function `apply_counter_deltas` adds the given deltas to the counters of a board with one UPDATE query. Counters without a change are left out.
+    """
+def apply_counter_deltas(board_id, deltas):
+    pending = pending_counter_deltas.get()
+    if pending is not None:
+        board_deltas = pending.setdefault(board_id, {})
+        for field, delta in deltas.items():
+            board_deltas[field] = board_deltas.get(field, 0) + delta
+        return
+    changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if board_id is not None and changes:
+        Board.objects.filter(pk=board_id).update(**changes)
+
+
+"""
+    The function `apply_task_counter_change` updates the counters of the boards for one created, changed or deleted task and increases the version of every affected board.
+    :param previous: the tuple of board id, status and priority before the change or None for a created task
+    :param current: the tuple of board id, status and priority after the change or None for a deleted task
+    """
+def apply_task_counter_change(previous, current):
+    if current is None:
+        board_id, deltas = get_task_counter_deltas(previous, -1)
+        apply_counter_deltas(board_id, {**deltas, 'version': 1})
+        return
+    board_id, deltas = get_task_counter_deltas(current, 1)
+    if previous is not None:
+        previous_board_id, previous_deltas = get_task_counter_deltas(previous, -1)
+        if previous_board_id != board_id:
+            apply_counter_deltas(previous_board_id, {**previous_deltas, 'version': 1})
+        else:
+            deltas = {field: delta + previous_deltas[field] for field, delta in deltas.items()}
+    apply_counter_deltas(board_id, {**deltas, 'version': 1})
+
+
+"""
+    The function `bump_board_version` increases the version of a board after a change which does not touch its counters, f.e. a new comment.
+    """
+def bump_board_version(board_id):
+    apply_counter_deltas(board_id, {'version': 1})
+
+
+"""
+    The function `batched_counter_updates` is a context manager which collects all counter changes of the tasks inside of it and writes them with one UPDATE query per board at the end. It is used for bulk writes, which have to report their changes with `apply_task_counter_change` because they do not send signals.
+    """
+@contextmanager
+def batched_counter_updates():
+    pending = {}
+    token = pending_counter_deltas.set(pending)
+    try:
+        yield
+    finally:
+        pending_counter_deltas.reset(token)
+    for board_id, deltas in pending.items():
+        apply_counter_deltas(board_id, deltas)
+
+
+"""
+    The function `update_member_counts` counts the members of the given boards again and stores the result together with a new version and update timestamp of the boards with one UPDATE query.
+    """
+def update_member_counts(board_ids):
+    if not board_ids:
+        return
+    member_count = Board.members.through.objects.filter(board_id=OuterRef('pk')).order_by().values('board_id').annotate(count=Count('id')).values('count')
+    Board.objects.filter(pk__in=board_ids).update(member_count=Coalesce(Subquery(member_count, output_field=IntegerField()), 0), version=F('version') + 1, updated_at=timezone.now())
@@ -0,0 +1,44 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+
+
+"""
+    The function `get_email_lookup_key` returns the cache key of an email address for `get_users_by_emails`.
+    """
+def get_email_lookup_key(email):
+    return 'email-lookup:' + hashlib.sha1(email.encode('utf-8')).hexdigest()
+
+
+"""
+    The function `get_users_by_emails` looks up the users of many email addresses at once. Email addresses which were looked up recently are read from the cache, including the ones without a user. All others are loaded with one IN query on the indexed email column. When several users have the same email address, the newest user is found.
+    :param emails: the list of email addresses
+    :return: a tuple with the list of found users as dicts with `id`, `email` and `fullname` and the list of unknown email addresses, both in the order of the given emails
+    """
+def get_users_by_emails(emails):
+    emails = list(dict.fromkeys(emails))
+    keys = {email: get_email_lookup_key(email) for email in emails}
+    cached = cache.get_many(keys.values())
+    results = {email: cached[key] for email, key in keys.items() if key in cached}
+    missing = [email for email in emails if email not in results]
+    if missing:
+        loaded = {}
+        for user in User.objects.filter(email__in=missing).order_by('-id').only('id', 'email', 'username'):
+            loaded.setdefault(user.email, {'id': user.id, 'email': user.email, 'fullname': user.username})
+        for email in missing:
+            results[email] = loaded.get(email, {})
+        cache.set_many({keys[email]: results[email] for email in missing}, getattr(settings, 'EMAIL_LOOKUP_CACHE_TTL', 60))
+    users = [results[email] for email in emails if results[email]]
+    unknown = [email for email in emails if not results[email]]
+    return users, unknown
+
+
+"""
+    The function `get_user_by_email` looks up the user of one email address like `get_users_by_emails`.
+    :return: the user as dict with `id`, `email` and `fullname` or None if no user has the email address
+    """
+def get_user_by_email(email):
+    users, unknown = get_users_by_emails([email])
+    return users[0] if users else None
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+"""
+The `BaseEventBroker` class defines the interface of the brokers which fan out the events of a board to its subscribers. The class of the broker is set with `KANBAN_EVENT_BROKER` in `core/settings.py`, so a broker for more than one server process (f.e. on top of Redis) can replace the `InProcessEventBroker`.
+"""
+class BaseEventBroker:
+    def publish(self, board_id, event):
+        raise NotImplementedError('`publish()` must be implemented.')
+
+    def subscribe(self, board_id):
+        raise NotImplementedError('`subscribe()` must be implemented.')
+
+    def unsubscribe(self, subscription):
+        raise NotImplementedError('`unsubscribe()` must be implemented.')
+
+    def stats(self):
+        return {}
+
+
+"""
+The `Subscription` class is the queue of events of one subscriber. It belongs to the event loop of the subscriber, the events are handed over thread safe. When a subscriber does not read its events and the queue is full, the queue is cleared and a `resync` event is sent instead, so a slow client costs a bounded amount of memory and syncs the board again.
+"""
+class Subscription:
+    def __init__(self, board_id, max_size):
+        self.board_id = board_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_size)
+
+    def put(self, event):
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = {'type': 'resync', 'board': self.board_id}
+        self.queue.put_nowait(event)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+"""
+The `InProcessEventBroker` class fans out the events to the subscribers of the same server process. An idle subscriber is only an empty queue and a waiting coroutine, it does not run any query. It is meant for a single server process and for tests.
+"""
+class InProcessEventBroker(BaseEventBroker):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscriptions = {}
+        self.published = 0
+
+    def publish(self, board_id, event):
+        with self.lock:
+            subscriptions = list(self.subscriptions.get(board_id, ()))
+            self.published += 1
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+
+    """
+    The function `subscribe` has to be called inside of the event loop of the subscriber.
+    """
+    def subscribe(self, board_id):
+        subscription = Subscription(board_id, getattr(settings, 'KANBAN_EVENT_QUEUE_SIZE', 100))
+        with self.lock:
+            self.subscriptions.setdefault(board_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscriptions = self.subscriptions.get(subscription.board_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self.subscriptions[subscription.board_id]
+
+    def stats(self):
+        with self.lock:
+            return {
+                'boards': len(self.subscriptions),
+                'subscribers': sum(len(subscriptions) for subscriptions in self.subscriptions.values()),
+                'published': self.published,
+            }
+
+
+"""
+    The function `get_event_broker` returns the broker of `KANBAN_EVENT_BROKER`, which is created once per process.
+    """
+@lru_cache(maxsize=None)
+def get_event_broker():
+    return import_string(getattr(settings, 'KANBAN_EVENT_BROKER', 'kanban_app.events.InProcessEventBroker'))()
+
+
+"""
+    The function `publish_board_event` sends an event to the subscribers of a board when the current transaction is committed, so no subscriber loads the changes before they are visible. The events only contain ids, the clients load the changes with the delta sync of the board.
+    :param board_id: the id of the board, None is ignored
+    :param event_type: f.e. 'task.created', 'comment.deleted' or 'members.changed'
+    :param data: further ids of the event, f.e. the id of the task
+    """
+def publish_board_event(board_id, event_type, **data):
+    if board_id is None:
+        return
+    event = {'type': event_type, 'board': board_id, **data}
+    transaction.on_commit(lambda: get_event_broker().publish(board_id, event))
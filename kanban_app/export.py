@@ -0,0 +1,183 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from kanban_app.models import BoardTask, TaskComment
+
+
+"""
+The `EXPORT_TABLES` defines the tables of the export. Every table contains the model, the exported fields of `values_list` and the Arrow schema with one column per field. The users are exported by their ids only.
+"""
+EXPORT_TABLES = {
+    'tasks': (BoardTask, ['id', 'board_id', 'title', 'description', 'status', 'priority', 'assignee_id', 'reviewer_id', 'creator_id', 'due_date', 'created_at', 'updated_at'], pa.schema([
+        ('id', pa.int64()),
+        ('board_id', pa.int64()),
+        ('title', pa.string()),
+        ('description', pa.string()),
+        ('status', pa.string()),
+        ('priority', pa.string()),
+        ('assignee_id', pa.int64()),
+        ('reviewer_id', pa.int64()),
+        ('creator_id', pa.int64()),
+        ('due_date', pa.date32()),
+        ('created_at', pa.timestamp('us', tz='UTC')),
+        ('updated_at', pa.timestamp('us', tz='UTC')),
+    ])),
+    'comments': (TaskComment, ['id', 'task__board_id', 'task_id', 'author_id', 'content', 'created_at', 'updated_at'], pa.schema([
+        ('id', pa.int64()),
+        ('board_id', pa.int64()),
+        ('task_id', pa.int64()),
+        ('author_id', pa.int64()),
+        ('content', pa.string()),
+        ('created_at', pa.timestamp('us', tz='UTC')),
+        ('updated_at', pa.timestamp('us', tz='UTC')),
+    ])),
+}
+
+EXPORT_FORMATS = ['arrow', 'parquet', 'lance']
+
+EXPORT_CONTENT_TYPES = {
+    'arrow': 'application/vnd.apache.arrow.stream',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+
+"""
+    The function `get_export_queryset` returns the rows of a table for the given boards, or of all boards if no boards are given, ordered by id.
+    :param table: 'tasks' or 'comments'
+    :param board_ids: a list of board ids or None
+    """
+def get_export_queryset(table, board_ids=None):
+    model, fields, schema = EXPORT_TABLES[table]
+    queryset = model.objects.all()
+    if board_ids is not None:
+        queryset = queryset.filter(board_id__in=board_ids) if model is BoardTask else queryset.filter(task__board_id__in=board_ids)
+    return queryset.order_by('id').values_list(*fields)
+
+
+"""
+    The function `iter_record_batches` reads the rows of a table in chunks and yields them as Arrow record batches. The rows are read with `iterator`, which uses a server-side cursor on PostgreSQL and fetches the rows chunk by chunk on SQLite, so only one chunk of rows is in memory at a time.
+    :param chunk_size: the number of rows per record batch, `KANBAN_EXPORT_CHUNK_SIZE` by default
+    """
+def iter_record_batches(table, board_ids=None, chunk_size=None):
+    schema = EXPORT_TABLES[table][2]
+    chunk_size = chunk_size or getattr(settings, 'KANBAN_EXPORT_CHUNK_SIZE', 10000)
+    rows = []
+    for row in get_export_queryset(table, board_ids).iterator(chunk_size=chunk_size):
+        rows.append(row)
+        if len(rows) == chunk_size:
+            yield make_record_batch(rows, schema)
+            rows = []
+    if rows:
+        yield make_record_batch(rows, schema)
+
+
+"""
+    The function `make_record_batch` turns a chunk of rows into a record batch with one Arrow array per column of the schema.
+    """
+def make_record_batch(rows, schema):
+    return pa.RecordBatch.from_arrays([pa.array(column, type=field.type) for column, field in zip(zip(*rows), schema)], schema=schema)
+
+
+"""
+The `ChunkSink` class is a write-only file for the Arrow writers which keeps the written bytes until they are taken with `take`, so the written parts of a file can be streamed while the rest is still written.
+"""
+class ChunkSink:
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def writable(self):
+        return True
+
+    def take(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+"""
+    The function `open_writer` opens the Arrow IPC stream writer or the Parquet writer for the schema on a file or sink.
+    :param export_format: 'arrow' or 'parquet'
+    """
+def open_writer(export_format, sink, schema):
+    if export_format == 'arrow':
+        return pa.ipc.new_stream(sink, schema)
+    return pq.ParquetWriter(sink, schema, compression='zstd')
+
+
+"""
+    The function `encode_batches` writes the record batches as Arrow IPC stream or Parquet file and yields the written bytes after every record batch. The file is never complete in memory, only the current batch and its encoded bytes.
+    :param export_format: 'arrow' or 'parquet'
+    """
+def encode_batches(batches, export_format, schema):
+    sink = ChunkSink()
+    writer = open_writer(export_format, pa.PythonFile(sink, mode='w'), schema)
+    for batch in batches:
+        if export_format == 'parquet':
+            writer.write_batch(batch, row_group_size=batch.num_rows)
+        else:
+            writer.write_batch(batch)
+        data = sink.take()
+        if data:
+            yield data
+    writer.close()
+    yield sink.take()
+
+
+"""
+    The function `stream_export` yields the bytes of a table as Arrow IPC stream or Parquet file, read and written batch by batch.
+    """
+def stream_export(table, export_format, board_ids=None, chunk_size=None):
+    return encode_batches(iter_record_batches(table, board_ids, chunk_size), export_format, EXPORT_TABLES[table][2])
+
+
+"""
+    The function `astream_export` yields the chunks of `stream_export` for an ASGI server. Every chunk is written in the thread of the sync views, which owns the database connection of the request, so the rows are still read chunk by chunk instead of all at once.
+    """
+async def astream_export(table, export_format, board_ids=None, chunk_size=None):
+    chunks = stream_export(table, export_format, board_ids, chunk_size)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
+
+
+"""
+    The function `write_export` writes a table to a file or, for the format 'lance', to a Lance dataset in a directory, and returns the number of exported rows. Lance is only imported for its format, because it loads a large native library.
+    :param mode: 'create' or 'overwrite', only used for Lance datasets
+    """
+def write_export(table, export_format, path, board_ids=None, chunk_size=None, mode='create'):
+    schema = EXPORT_TABLES[table][2]
+    rows = 0
+
+    def batches():
+        nonlocal rows
+        for batch in iter_record_batches(table, board_ids, chunk_size):
+            rows += batch.num_rows
+            yield batch
+
+    if export_format == 'lance':
+        import lance
+        lance.write_dataset(pa.RecordBatchReader.from_batches(schema, batches()), path, schema=schema, mode=mode)
+        return rows
+    with open(path, 'wb') as file:
+        for chunk in encode_batches(batches(), export_format, schema):
+            file.write(chunk)
+    return rows
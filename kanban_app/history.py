@@ -0,0 +1,112 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from kanban_app.models import PRIORITY_CHOICES, STATUS_CHOICES, TRANSITION_FIELDS, TaskTransition
+
+
+"""
+The `TRANSITION_VALUE_CODES` maps the values of the status and the priority to their codes in the `TaskTransition` model. Values outside of the choices are stored as null.
+"""
+TRANSITION_VALUE_CODES = {
+    'status': {value: code for code, (value, label) in enumerate(STATUS_CHOICES)},
+    'priority': {value: code for code, (value, label) in enumerate(PRIORITY_CHOICES)},
+}
+
+TRANSITION_FIELD_CODES = {name: code for code, name in TRANSITION_FIELDS}
+
+
+"""
+The `pending_transitions` collects the transitions inside of `batched_transitions`.
+"""
+pending_transitions = ContextVar('pending_transitions', default=None)
+
+
+"""
+    The function `get_tracked_values` returns the status, the assignee and the priority of a task.
+    """
+def get_tracked_values(task):
+    return {'status': task.status, 'assignee': task.assignee_id, 'priority': task.priority}
+
+
+"""
+    The function `get_loaded_tracked_values` returns the status, the assignee and the priority of a task when it was loaded or saved the last time, or None if they are unknown, f.e. for a task which was loaded without these fields.
+    """
+def get_loaded_tracked_values(task):
+    counter_values = getattr(task, '_loaded_counter_values', None)
+    user_ids = getattr(task, '_loaded_user_ids', None)
+    if counter_values is None or user_ids is None:
+        return None
+    return {'status': counter_values[1], 'assignee': user_ids[0], 'priority': counter_values[2]}
+
+
+"""
+    The function `encode_value` returns the stored code of the value of a field.
+    """
+def encode_value(field, value):
+    if field == 'assignee':
+        return value
+    return TRANSITION_VALUE_CODES[field].get(value)
+
+
+"""
+    The function `record_task_transitions` records the changed status, assignee and priority of a task. The changes are found from the values of the task when it was loaded, so no query is needed for them, and all changes of the task are written with one insert. Inside of `batched_transitions` the transitions are only collected.
+    :param previous: the values of `get_loaded_tracked_values` before the change, or None for a created task
+    :param changed_at: the time of the change in milliseconds since the epoch, now by default
+    """
+def record_task_transitions(task, previous, changed_at=None):
+    changed_at = changed_at or time.time_ns() // 1_000_000
+    transitions = []
+    for field, value in get_tracked_values(task).items():
+        old_value = None if previous is None else previous[field]
+        if previous is not None and old_value == value:
+            continue
+        if previous is None and value is None:
+            continue
+        transitions.append(TaskTransition(
+            board_id=task.board_id, task_id=task.pk, field=TRANSITION_FIELD_CODES[field],
+            old_value=None if previous is None else encode_value(field, old_value), new_value=encode_value(field, value), changed_at=changed_at,
+        ))
+    pending = pending_transitions.get()
+    if pending is not None:
+        pending.extend(transitions)
+    elif transitions:
+        TaskTransition.objects.bulk_create(transitions)
+
+
+"""
+    The function `batched_transitions` is a context manager which collects all transitions of the changes inside of it and writes them with one bulk insert at the end, f.e. for the task batch endpoint.
+    """
+@contextmanager
+def batched_transitions():
+    pending = []
+    token = pending_transitions.set(pending)
+    try:
+        yield
+    finally:
+        pending_transitions.reset(token)
+    if pending:
+        TaskTransition.objects.bulk_create(pending)
+
+
+"""
+    The function `get_board_history` returns one page of the transitions of a board column by column, ordered by id. The next page starts after the id in `next`, which is None on the last page.
+    :param after: the id after which the page starts
+    :param limit: the maximum number of transitions of the page
+    :param task_id: only return the transitions of this task
+    """
+def get_board_history(board_id, after=0, limit=10000, task_id=None):
+    queryset = TaskTransition.objects.filter(board_id=board_id, id__gt=after)
+    if task_id is not None:
+        queryset = queryset.filter(task_id=task_id)
+    rows = list(queryset.order_by('id').values_list('id', 'task_id', 'field', 'old_value', 'new_value', 'changed_at')[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    columns = list(zip(*rows)) or [()] * 6
+    return {
+        'board': board_id,
+        'fields': {code: name for code, name in TRANSITION_FIELDS},
+        'values': {field: [value for value, label in choices] for field, choices in (('status', STATUS_CHOICES), ('priority', PRIORITY_CHOICES))},
+        'transitions': {name: list(column) for name, column in zip(['id', 'task', 'field', 'old', 'new', 'changed_at'], columns)},
+        'next': rows[-1][0] if has_more else None,
+    }
@@ -0,0 +1,141 @@
+import asyncio
+import statistics
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.core.asgi import get_asgi_application
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+
+from kanban_app.benchmarks import seed_dataset
+from kanban_app.models import Board
+
+
+"""
+The `READ_ENDPOINTS` lists the endpoints which are compared. Every entry contains the name, the url name of the sync view, the url name of the async view and a function which returns the url kwargs for the seeded dataset.
+"""
+READ_ENDPOINTS = [
+    ('boards_list', 'boards_list', 'async_boards_list', lambda data: {}),
+    ('board_detail', 'board_detail', 'async_board_detail', lambda data: {'pk': data['board'].pk}),
+    ('my_assigned_tasks', 'my_assigned_tasks', 'async_my_assigned_tasks', lambda data: {}),
+    ('reviewing_tasks', 'reviewing_tasks', 'async_reviewing_tasks', lambda data: {}),
+    ('task_comment_list', 'task_comment_list', 'async_task_comment_list', lambda data: {'task_id': data['task'].pk}),
+]
+
+
+"""
+The `Command` class sends the same number of concurrent requests to the sync and the async version of every read endpoint through the ASGI handler and reports the throughput and the latencies. The dataset is seeded into a test database, which is created and destroyed like by the test runner, and committed, because the requests run in other threads than the command. With `--force` it runs against the configured database instead and deletes the dataset afterwards board by board, because the seeded tasks are not part of the board counters. The response cache is disabled unless `--cached` is given, so the database path is measured.
+"""
+class Command(BaseCommand):
+    help = 'Compares the sync and the async read endpoints under concurrent requests through the ASGI handler.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Number of requests per endpoint and path')
+        parser.add_argument('--concurrency', type=int, default=50, help='Number of requests which are sent at the same time')
+        parser.add_argument('--size', type=int, default=10, help='Size of the seeded dataset (boards, members, tasks and comments)')
+        parser.add_argument('--cached', action='store_true', help='Keep the response cache enabled')
+        parser.add_argument('--force', action='store_true', help='Run against the configured database instead of a test database')
+
+    def handle(self, *args, **options):
+        if options['force']:
+            results = self.run_in_configured_database(options)
+        else:
+            runner = DiscoverRunner(verbosity=0, interactive=False)
+            old_config = runner.setup_databases()
+            try:
+                results = self.run_with_dataset(seed_dataset(options['size']), options)
+            finally:
+                runner.teardown_databases(old_config)
+        self.stdout.write(f'{"endpoint":<20} {"path":<6} {"req/s":>8} {"p50 ms":>8} {"p99 ms":>8}')
+        for name, path, throughput, p50, p99 in results:
+            self.stdout.write(f'{name:<20} {path:<6} {throughput:>8.1f} {p50:>8.2f} {p99:>8.2f}')
+
+    """
+    The function `run_in_configured_database` seeds the dataset into the configured database, runs the benchmark and deletes the dataset again.
+    """
+    def run_in_configured_database(self, options):
+        if User.objects.filter(username='budget-owner').exists():
+            raise CommandError('The benchmark user "budget-owner" already exists, delete it first.')
+        data = seed_dataset(options['size'])
+        try:
+            return self.run_with_dataset(data, options)
+        finally:
+            for board in Board.objects.filter(owner=data['user']):
+                board.delete()
+            User.objects.filter(pk__in=[data['user'].pk, *[member.pk for member in data['members']]]).delete()
+
+    def run_with_dataset(self, data, options):
+        token = Token.objects.create(user=data['user'])
+        caches = settings.CACHES if options['cached'] else {**settings.CACHES, 'responses': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+        with override_settings(CACHES=caches):
+            return asyncio.run(self.run_benchmark(data, token.key, options['requests'], options['concurrency']))
+
+    async def run_benchmark(self, data, token_key, requests, concurrency):
+        application = get_asgi_application()
+        headers = [(b'host', b'localhost'), (b'authorization', f'Token {token_key}'.encode('ascii'))]
+        results = []
+        for name, sync_url_name, async_url_name, get_kwargs in READ_ENDPOINTS:
+            for path, url_name in (('sync', sync_url_name), ('async', async_url_name)):
+                url = reverse(url_name, kwargs=get_kwargs(data))
+                await asgi_get(application, url, headers)
+                throughput, latencies = await self.measure(application, url, headers, requests, concurrency)
+                results.append((name, path, throughput, statistics.median(latencies), percentile(latencies, 99)))
+        return results
+
+    """
+    The function `measure` sends the requests with at most `concurrency` requests at the same time and returns the requests per second and the latency of every request in milliseconds.
+    """
+    async def measure(self, application, url, headers, requests, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def send():
+            async with semaphore:
+                started = time.perf_counter()
+                status_code = await asgi_get(application, url, headers)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if status_code != 200:
+                    raise CommandError(f'GET {url} failed with status {status_code}')
+
+        started = time.perf_counter()
+        await asyncio.gather(*(send() for _ in range(requests)))
+        return requests / (time.perf_counter() - started), latencies
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+"""
+    The function `asgi_get` sends a GET request directly to the ASGI application, like an ASGI server does, reads the whole response and returns its status code.
+    """
+async def asgi_get(application, path, headers):
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+        'path': path, 'raw_path': path.encode('ascii'), 'query_string': b'', 'root_path': '', 'headers': headers,
+        'client': ('127.0.0.1', 0), 'server': ('localhost', 80),
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+    messages = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await disconnected.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        messages.append(message)
+
+    await application(scope, receive, send)
+    disconnected.set()
+    return messages[0]['status']
@@ -0,0 +1,248 @@
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from contextlib import nullcontext
+from io import StringIO
+
+import django
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.api import urls as auth_urls
+from kanban_app.api import urls as kanban_urls
+from kanban_app.benchmarks import QUERY_BUDGETS, forget_email_lookups, seed_dataset
+from kanban_app.search import is_search_available, rebuild_search_index
+
+
+BENCHMARK_PASSWORD = 'benchmark-password'
+
+"""
+The `EXTRA_ENDPOINTS` are the endpoints of `auth_app/api/urls.py`, which are benchmarked but have no query budget, in the format of `QUERY_BUDGETS` without the budget: the stats of the token cache and the authentication.
+"""
+EXTRA_ENDPOINTS = [
+    ('token_cache_stats GET', 'get', 'token_cache_stats', lambda data: ({}, None)),
+    ('user_registration POST', 'post', 'user_registration', lambda data: ({}, {'fullname': 'Benchmark User', 'email': 'benchmark-new@example.com', 'password': BENCHMARK_PASSWORD, 'repeated_password': BENCHMARK_PASSWORD})),
+    ('user_login POST', 'post', 'user_login', lambda data: ({}, {'email': data['user'].email, 'password': BENCHMARK_PASSWORD})),
+]
+
+"""
+The `BENCHMARK_ENDPOINTS` are all requests of the benchmark: the requests of `QUERY_BUDGETS` without the cached repetitions, because every request is measured with an empty response cache, and the `EXTRA_ENDPOINTS`.
+"""
+BENCHMARK_ENDPOINTS = [entry[:4] for entry in QUERY_BUDGETS if not entry[0].endswith(' cached')] + EXTRA_ENDPOINTS
+
+"""
+The `SKIPPED_ENDPOINTS` are the url names which are not benchmarked, with the reason.
+"""
+SKIPPED_ENDPOINTS = {
+    'board_events': 'the event stream does not end',
+}
+
+"""
+The `LATENCY_METRICS` are the latencies which are compared with the baseline, the `QUERY_METRIC` may not grow at all.
+"""
+LATENCY_METRICS = ['p50_ms', 'p99_ms']
+QUERY_METRIC = 'queries'
+MEMORY_METRIC = 'peak_memory_kb'
+
+
+"""
+The `BenchmarkRollback` exception is raised at the end of the benchmark to roll back the seeded dataset.
+"""
+class BenchmarkRollback(Exception):
+    pass
+
+
+"""
+The `Command` class seeds a dataset of the given size inside a transaction and sends every request of `BENCHMARK_ENDPOINTS` repeatedly through the test client with token authentication. It reports the throughput, the latency percentiles, the number of queries and the peak memory of every endpoint, saves them as JSON and compares them with a saved baseline, so a release can be stopped when an endpoint got slower or needs more queries. Every request runs in a savepoint which is rolled back, so the writing and deleting requests find the same data every time, and the response cache is cleared before every request unless `--cached` is given. All seeded data is rolled back afterwards.
+"""
+class Command(BaseCommand):
+    help = 'Benchmarks every API endpoint with a seeded dataset and compares the results with a baseline.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--boards', type=int, default=10, help='Number of seeded boards')
+        parser.add_argument('--members', type=int, default=10, help='Number of members per board')
+        parser.add_argument('--tasks', type=int, default=50, help='Number of tasks per board')
+        parser.add_argument('--comments', type=int, default=5, help='Number of comments per task')
+        parser.add_argument('--requests', type=int, default=50, help='Number of measured requests per endpoint')
+        parser.add_argument('--warmup', type=int, default=3, help='Number of requests per endpoint before the measurement')
+        parser.add_argument('--endpoints', nargs='+', help='Only benchmark the endpoints with these url names')
+        parser.add_argument('--cached', action='store_true', help='Keep the response cache between the requests')
+        parser.add_argument('--output', help='Save the results as JSON to this file, f.e. as new baseline')
+        parser.add_argument('--baseline', help='Compare the results with the JSON results in this file')
+        parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed relative growth of the latencies and the peak memory')
+        parser.add_argument('--min-delta-ms', type=float, default=1.0, help='Latency growth in milliseconds which is always allowed, because of the noise of small values')
+        parser.add_argument('--min-delta-kb', type=float, default=64.0, help='Peak memory growth in KB which is always allowed')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 2:
+            raise CommandError('At least 2 requests per endpoint are needed for the percentiles.')
+        endpoints = self.get_endpoints(options['endpoints'])
+        dataset = {name: options[name] for name in ('boards', 'members', 'tasks', 'comments')}
+        if min(dataset.values()) < 1:
+            raise CommandError('The dataset needs at least one board, member, task and comment.')
+        try:
+            with transaction.atomic():
+                measured = self.run_benchmark(endpoints, dataset, options)
+                raise BenchmarkRollback()
+        except BenchmarkRollback:
+            pass
+        results = {
+            'created_at': timezone.now().isoformat(),
+            'environment': {'python': platform.python_version(), 'django': django.get_version(), 'database': connection.vendor},
+            'dataset': dataset,
+            'requests': options['requests'],
+            'cached': options['cached'],
+            'endpoints': measured,
+        }
+        self.write_table(measured)
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(results, file, indent=2)
+            self.stdout.write(f'Saved the results to {options["output"]}.')
+        if options['baseline']:
+            self.check_baseline(results, options)
+
+    """
+    The function `get_endpoints` returns the benchmarked requests. Without a selection every url name of the API has to be benchmarked or skipped, so a new endpoint cannot be forgotten.
+    :param url_names: only return the requests of these url names
+    """
+    def get_endpoints(self, url_names):
+        if url_names:
+            unknown = set(url_names) - {entry[2] for entry in BENCHMARK_ENDPOINTS}
+            if unknown:
+                raise CommandError(f'Unknown or skipped endpoints: {", ".join(sorted(unknown))}')
+            return [entry for entry in BENCHMARK_ENDPOINTS if entry[2] in url_names]
+        all_url_names = {pattern.name for pattern in kanban_urls.urlpatterns + auth_urls.urlpatterns}
+        missing = all_url_names - {entry[2] for entry in BENCHMARK_ENDPOINTS} - set(SKIPPED_ENDPOINTS)
+        if missing:
+            raise CommandError(f'Endpoints without benchmark: {", ".join(sorted(missing))}')
+        return BENCHMARK_ENDPOINTS
+
+    """
+    The function `run_benchmark` seeds the dataset and measures every endpoint. The seeded tasks are bulk created, so the board counters are reconciled and the search index is rebuilt for them. The user is staff, so the stats endpoints can be requested as well.
+    """
+    def run_benchmark(self, endpoints, dataset, options):
+        data = seed_dataset(dataset['boards'], dataset['members'], dataset['tasks'], dataset['comments'])
+        data['user'].set_password(BENCHMARK_PASSWORD)
+        data['user'].is_staff = True
+        data['user'].save(update_fields=['password', 'is_staff'])
+        call_command('reconcile_board_counters', stdout=StringIO())
+        if is_search_available():
+            rebuild_search_index()
+        token = Token.objects.create(user=data['user'])
+        client = APIClient(SERVER_NAME='localhost')
+        client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        caches['responses'].clear()
+        measured = {}
+        try:
+            for name, method, url_name, get_request in endpoints:
+                kwargs, body = get_request(data)
+                url = reverse(url_name, kwargs=kwargs)
+                self.stderr.write(f'Benchmarking {name} ...')
+                measured[name] = self.measure(client, method, url, body, options)
+        finally:
+            forget_email_lookups(data)
+            caches['responses'].clear()
+        return measured
+
+    """
+    The function `measure` sends the warmup and the measured requests of one endpoint one after another and returns the metrics of the endpoint. The garbage collector is paused during the measured requests like in `timeit`, so its pauses do not show up as outliers in the p99. The number of queries and the peak memory are measured with one more request, so the tracing does not slow down the measured requests.
+    """
+    def measure(self, client, method, url, body, options):
+        for _ in range(options['warmup']):
+            self.send(client, method, url, body, options['cached'])
+        gc.collect()
+        gc.disable()
+        try:
+            latencies = [self.send(client, method, url, body, options['cached']) for _ in range(options['requests'])]
+        finally:
+            gc.enable()
+        tracemalloc.start()
+        try:
+            context = CaptureQueriesContext(connection)
+            self.send(client, method, url, body, options['cached'], context)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+        return {
+            'method': method.upper(),
+            'url': url,
+            'throughput': round(len(latencies) / sum(latencies) * 1000, 1),
+            'p50_ms': round(percentiles[49], 3),
+            'p90_ms': round(percentiles[89], 3),
+            'p99_ms': round(percentiles[98], 3),
+            'max_ms': round(max(latencies), 3),
+            QUERY_METRIC: len(context.captured_queries),
+            MEMORY_METRIC: round(peak_memory / 1024, 1),
+        }
+
+    """
+    The function `send` sends one request inside of a savepoint which is rolled back afterwards and returns its latency in milliseconds, including the streamed content. Only the request is measured, not the savepoint.
+    :param context: a context manager around the request, f.e. to capture its queries
+    """
+    def send(self, client, method, url, body, cached, context=None):
+        if not cached:
+            caches['responses'].clear()
+        with transaction.atomic(), nullcontext() if context is None else context:
+            started = time.perf_counter()
+            response = getattr(client, method)(url, body, format='json') if method != 'get' else client.get(url, body)
+            if response.streaming:
+                b''.join(response.streaming_content)
+            latency = (time.perf_counter() - started) * 1000
+            transaction.set_rollback(True)
+        if response.status_code >= 400:
+            raise CommandError(f'{method.upper()} {url} failed with status {response.status_code}: {response.content[:200]}')
+        return latency
+
+    def write_table(self, measured):
+        self.stdout.write(f'{"endpoint":<32} {"req/s":>8} {"p50 ms":>8} {"p90 ms":>8} {"p99 ms":>8} {"queries":>7} {"peak KB":>9}')
+        for name, metrics in measured.items():
+            self.stdout.write(
+                f'{name:<32} {metrics["throughput"]:>8.1f} {metrics["p50_ms"]:>8.2f} {metrics["p90_ms"]:>8.2f} '
+                f'{metrics["p99_ms"]:>8.2f} {metrics[QUERY_METRIC]:>7} {metrics[MEMORY_METRIC]:>9.1f}'
+            )
+
+    """
+    The function `check_baseline` compares the results with the baseline and fails when an endpoint needs more queries, or when its latencies or its peak memory grew by more than the tolerance and the allowed delta. Endpoints which are not in the baseline are only reported.
+    """
+    def check_baseline(self, results, options):
+        with open(options['baseline']) as file:
+            baseline = json.load(file)
+        if baseline['dataset'] != results['dataset'] or baseline['cached'] != results['cached']:
+            raise CommandError(f'The baseline was measured with another dataset: {baseline["dataset"]}, cached: {baseline["cached"]}')
+        regressions = []
+        for name, metrics in results['endpoints'].items():
+            expected = baseline['endpoints'].get(name)
+            if expected is None:
+                self.stdout.write(f'{name}: not in the baseline')
+                continue
+            if metrics[QUERY_METRIC] > expected[QUERY_METRIC]:
+                regressions.append(f'{name} {QUERY_METRIC}: {expected[QUERY_METRIC]} -> {metrics[QUERY_METRIC]}')
+            limits = [(metric, options['min_delta_ms']) for metric in LATENCY_METRICS] + [(MEMORY_METRIC, options['min_delta_kb'])]
+            for metric, min_delta in limits:
+                if is_regression(expected[metric], metrics[metric], options['tolerance'], min_delta):
+                    regressions.append(f'{name} {metric}: {expected[metric]} -> {metrics[metric]}')
+        if regressions:
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(regression))
+            raise CommandError(f'{len(regressions)} metrics are worse than the baseline.')
+        self.stdout.write(self.style.SUCCESS('All endpoints are within the tolerance of the baseline.'))
+
+
+"""
+    The function `is_regression` checks if a value grew by more than the relative tolerance and by more than the absolute delta compared to the baseline.
+"""
+def is_regression(expected, actual, tolerance, min_delta):
+    return actual > expected * (1 + tolerance) and actual - expected > min_delta
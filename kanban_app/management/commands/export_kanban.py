@@ -0,0 +1,29 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from kanban_app.export import EXPORT_FORMATS, EXPORT_TABLES, write_export
+
+
+"""
+The `Command` class exports the tasks or the comments of all boards, or of the given boards, to an Arrow IPC stream file, a Parquet file or a Lance dataset for the data warehouse. The rows are read and written in record batches, so the memory stays flat regardless of the number of rows.
+"""
+class Command(BaseCommand):
+    help = 'Exports the tasks or the comments as Arrow IPC stream, Parquet file or Lance dataset.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('table', choices=list(EXPORT_TABLES), help='The exported table')
+        parser.add_argument('output', help='The path of the file, or of the directory of the Lance dataset')
+        parser.add_argument('--format', dest='export_format', choices=EXPORT_FORMATS, default='parquet', help='The format of the export')
+        parser.add_argument('--board', dest='board_ids', type=int, action='append', help='Only export this board, can be given more than once')
+        parser.add_argument('--chunk-size', type=int, default=getattr(settings, 'KANBAN_EXPORT_CHUNK_SIZE', 10000), help='Number of rows per record batch')
+        parser.add_argument('--overwrite', action='store_true', help='Replace an existing file or Lance dataset')
+
+    def handle(self, *args, **options):
+        output = options['output']
+        if os.path.exists(output) and not options['overwrite']:
+            raise CommandError(f'"{output}" already exists, use --overwrite to replace it.')
+        mode = 'overwrite' if options['overwrite'] else 'create'
+        rows = write_export(options['table'], options['export_format'], output, options['board_ids'], options['chunk_size'], mode)
+        self.stdout.write(self.style.SUCCESS(f'Exported {rows} {options["table"]} to {output} ({options["export_format"]}).'))
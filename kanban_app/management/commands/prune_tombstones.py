@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from kanban_app.models import Tombstone
+
+
+"""
+The `Command` class deletes the tombstones of deleted tasks and comments which are older than the retention of the delta sync. Clients with an older cursor get a full sync anyway, so these tombstones are not needed anymore.
+"""
+class Command(BaseCommand):
+    help = 'Deletes the tombstones which are older than the retention of the delta sync.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=getattr(settings, 'KANBAN_SYNC_RETENTION_DAYS', 30), help='Age in days from which the tombstones are deleted')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Number of tombstones which are deleted with one query')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        deleted = 0
+        while True:
+            ids = list(Tombstone.objects.filter(deleted_at__lt=cutoff).order_by('deleted_at').values_list('pk', flat=True)[:options['batch_size']])
+            if not ids:
+                break
+            deleted += Tombstone.objects.filter(pk__in=ids).delete()[0]
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} tombstones older than {options["days"]} days.'))
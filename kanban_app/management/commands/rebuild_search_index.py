@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from kanban_app.search import is_search_available, rebuild_search_index
+
+
+"""
+The `Command` class fills the search table of the full-text search again with all tasks and their comments in one transaction, f.e. after the tasks or comments were changed without the views, like with `bulk_create` or in the admin.
+"""
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text search index of the tasks and comments.'
+
+    def handle(self, *args, **options):
+        if not is_search_available():
+            raise CommandError('The full-text search needs SQLite.')
+        with transaction.atomic():
+            count = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} tasks.'))
@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+from kanban_app.models import Board, BOARD_COUNTER_FIELDS
+
+
+"""
+    The function `annotate_board_statistics` counts the members, tickets, tasks with the status `to do` and tasks with high priority of every board of the queryset.
+    :param queryset: the board queryset which should be annotated
+    :return: the queryset with the annotations `counted_member_count`, `counted_ticket_count`, `counted_tasks_to_do_count` and `counted_tasks_high_prio_count`. The task counts are grouped in one join on the tasks, the member count is a correlated subquery so that members and tasks are not multiplied with each other.
+    """
+def annotate_board_statistics(queryset):
+    member_count = Board.members.through.objects.filter(board_id=OuterRef('pk')).order_by().values('board_id').annotate(count=Count('id')).values('count')
+    return queryset.annotate(
+        counted_member_count=Coalesce(Subquery(member_count, output_field=IntegerField()), 0),
+        counted_ticket_count=Count('tasks'),
+        counted_tasks_to_do_count=Count('tasks', filter=Q(tasks__status='to-do')),
+        counted_tasks_high_prio_count=Count('tasks', filter=Q(tasks__priority='high')),
+    )
+
+
+"""
+The `Command` class counts the members and tasks of all boards in batches, compares them with the stored counters and fixes the boards whose counters have drifted.
+"""
+class Command(BaseCommand):
+    help = 'Finds and fixes differences between the stored board counters and the actual members and tasks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Number of boards which are checked in one query')
+        parser.add_argument('--dry-run', action='store_true', help='Only report the drifted boards without fixing them')
+
+    def handle(self, *args, **options):
+        last_id = 0
+        checked = fixed = 0
+        while True:
+            with transaction.atomic():
+                batch = self.get_batch(last_id, options['batch_size'])
+                if not batch:
+                    break
+                drifted = [board for board in batch if self.apply_counted_values(board)]
+                if drifted and not options['dry_run']:
+                    Board.objects.bulk_update(drifted, BOARD_COUNTER_FIELDS)
+            for board in drifted:
+                self.stdout.write(f'Board {board.pk}: counters drifted')
+            checked += len(batch)
+            fixed += len(drifted)
+            last_id = batch[-1].pk
+        action = 'found' if options['dry_run'] else 'fixed'
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} boards, {action} {fixed} boards with drifted counters.'))
+
+    """
+    The function `get_batch` loads the next boards after the given id together with their counted values. The rows are locked until the batch is fixed, so no write can get lost in between.
+    """
+    def get_batch(self, last_id, batch_size):
+        board_ids = list(Board.objects.filter(pk__gt=last_id).order_by('pk').select_for_update().values_list('pk', flat=True)[:batch_size])
+        boards = Board.objects.filter(pk__in=board_ids).order_by('pk').only('pk', *BOARD_COUNTER_FIELDS)
+        return list(annotate_board_statistics(boards))
+
+    """
+    The function `apply_counted_values` copies the counted values to the stored counters of the board and returns if any of them was different.
+    """
+    def apply_counted_values(self, board):
+        drifted = False
+        for field in BOARD_COUNTER_FIELDS:
+            counted = getattr(board, f'counted_{field}')
+            if getattr(board, field) != counted:
+                setattr(board, field, counted)
+                drifted = True
+        return drifted
@@ -0,0 +1,264 @@
+import random
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+
+from kanban_app.models import Board, BoardTask, PRIORITY_CHOICES, STATUS_CHOICES, TaskComment
+from kanban_app.search import is_search_available, rebuild_search_index
+
+
+"""
+The `WORDS` are the words of the generated titles, descriptions and comments, so the full-text search finds realistic numbers of results.
+"""
+WORDS = [
+    'api', 'backend', 'board', 'bug', 'cache', 'client', 'comment', 'deploy', 'design', 'docs', 'email', 'error', 'export',
+    'feature', 'fix', 'frontend', 'index', 'login', 'migration', 'mobile', 'page', 'query', 'release', 'review', 'search',
+    'server', 'sync', 'task', 'test', 'token', 'update', 'user', 'view', 'layout', 'report', 'filter', 'upload', 'timeout',
+]
+
+"""
+The `TEXT_LENGTHS` are the minimum and maximum number of words of the generated texts. Every kind of text is drawn from a pool of `TEXT_POOL_SIZE` texts, which are generated once, because joining random words for every row takes a large part of the time.
+"""
+TEXT_LENGTHS = {'title': (2, 4), 'description': (0, 20), 'comment': (3, 15)}
+TEXT_POOL_SIZE = 1000
+
+
+"""
+    The function `parse_mix` returns a parser of the argument of a distribution like `to-do=40,done=60`, which returns the weight of every choice. Choices which are not given get the weight 0.
+    :param choices: the choices of the model field, f.e. `STATUS_CHOICES`
+    """
+def parse_mix(choices):
+    values = [value for value, label in choices]
+
+    def parse(text):
+        weights = dict.fromkeys(values, 0.0)
+        for part in text.split(','):
+            value, separator, weight = part.partition('=')
+            if value.strip() not in weights or not separator:
+                raise ValueError(f'{part!r} is not one of {", ".join(values)} with a weight')
+            weights[value.strip()] = float(weight)
+        if sum(weights.values()) <= 0 or min(weights.values()) < 0:
+            raise ValueError('the weights have to be positive')
+        return weights
+
+    parse.__name__ = 'distribution'
+    return parse
+
+
+"""
+    The function `split_by_weights` splits a total into integer parts which are proportional to the weights and add up to the total. The rest of the rounding goes to the parts with the largest remainders.
+    """
+def split_by_weights(total, weights):
+    weight_sum = sum(weights)
+    exact = [total * weight / weight_sum for weight in weights]
+    parts = [int(value) for value in exact]
+    by_remainder = sorted(range(len(weights)), key=lambda index: parts[index] - exact[index])
+    for index in by_remainder[:total - sum(parts)]:
+        parts[index] += 1
+    return parts
+
+
+"""
+The `RowWriter` class inserts the rows of one table in chunks with one `executemany` per chunk, which is much faster than creating model instances. The rows have to be given with the values of the database, f.e. adapted datetimes. The rows of the parent tables are written first, so the foreign keys are valid on every database.
+"""
+class RowWriter:
+    def __init__(self, model, columns, chunk_size, parents=()):
+        quote = connection.ops.quote_name
+        self.sql = (
+            f'INSERT INTO {quote(model._meta.db_table)} ({", ".join(quote(column) for column in columns)}) '
+            f'VALUES ({", ".join(["%s"] * len(columns))})'
+        )
+        self.chunk_size = chunk_size
+        self.parents = parents
+        self.rows = []
+        self.count = 0
+
+    def add(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        for parent in self.parents:
+            parent.flush()
+        if not self.rows:
+            return
+        with connection.cursor() as cursor:
+            cursor.executemany(self.sql, self.rows)
+        self.count += len(self.rows)
+        self.rows = []
+
+
+"""
+The `Command` class generates users, boards, board members, tasks and comments at production scale. The rows are written in chunks with one `executemany` per chunk and explicit ids, the members directly into the through table of `Board.members`, so neither model instances are created nor any signal handler runs. Instead the counters of every board are computed while its tasks are generated, and the search index is rebuilt at the end; no history, tombstones or events are written. The boards are written in transactions of about `--transaction-size` rows. The sizes of the boards follow a Zipf distribution with the exponent `--board-skew` and the status and priority of the tasks follow the given mixes. The same `--seed` with the same options generates the same rows with the same ids in an empty database, so benchmark results of different runs can be compared.
+"""
+class Command(BaseCommand):
+    help = 'Generates a large deterministic dataset of users, boards, members, tasks and comments.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=10000, help='Number of users')
+        parser.add_argument('--boards', type=int, default=1000, help='Number of boards')
+        parser.add_argument('--members', type=int, default=8, help='Average number of members per board, including the owner')
+        parser.add_argument('--tasks', type=int, default=100000, help='Total number of tasks')
+        parser.add_argument('--comments', type=float, default=3, help='Average number of comments per task')
+        parser.add_argument('--board-skew', type=float, default=1.0, help='Exponent of the Zipf distribution of the board sizes, 0 gives boards of equal size')
+        parser.add_argument('--status-mix', type=parse_mix(STATUS_CHOICES), default='to-do=30,in-progress=20,review=10,done=40', help='Weights of the task status')
+        parser.add_argument('--priority-mix', type=parse_mix(PRIORITY_CHOICES), default='low=30,medium=50,high=20', help='Weights of the task priority')
+        parser.add_argument('--assigned-ratio', type=float, default=0.8, help='Share of the tasks with an assignee')
+        parser.add_argument('--reviewed-ratio', type=float, default=0.5, help='Share of the tasks with a reviewer')
+        parser.add_argument('--due-date-ratio', type=float, default=0.6, help='Share of the tasks with a due date')
+        parser.add_argument('--start', type=date.fromisoformat, default=date(2025, 1, 1), help='Date of the first created board (YYYY-MM-DD)')
+        parser.add_argument('--days', type=int, default=365, help='Number of days over which the rows are created')
+        parser.add_argument('--seed', type=int, default=42, help='Seed of the random generator')
+        parser.add_argument('--prefix', default='seed', help='Prefix of the usernames and email addresses')
+        parser.add_argument('--password', help='Password of all users, by default they cannot log in')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Number of rows per insert')
+        parser.add_argument('--transaction-size', type=int, default=500000, help='Number of rows after which the transaction is committed')
+        parser.add_argument('--skip-search-index', action='store_true', help='Do not rebuild the search index')
+
+    def handle(self, *args, **options):
+        if options['users'] < 1 or options['boards'] < 1 or min(options['tasks'], options['members'], options['comments'], options['days']) < 0:
+            raise CommandError('At least one user and one board are needed and no number may be negative.')
+        if User.objects.filter(username__startswith=f'{options["prefix"]}-user-').exists():
+            raise CommandError(f'Users with the prefix "{options["prefix"]}" already exist, choose another --prefix.')
+        self.rng = random.Random(options['seed'])
+        self.options = options
+        self.start = datetime.combine(options['start'], datetime.min.time(), tzinfo=dt_timezone.utc).timestamp()
+        self.duration = options['days'] * 86400
+        self.adapt_datetimefield_value = connection.ops.adapt_datetimefield_value
+        self.adapt_datefield_value = connection.ops.adapt_datefield_value
+        self.texts = {
+            kind: [' '.join(self.rng.choices(WORDS, k=self.rng.randint(*lengths))) for _ in range(TEXT_POOL_SIZE)]
+            for kind, lengths in TEXT_LENGTHS.items()
+        }
+        self.next_ids = {model: (model.objects.aggregate(last=Max('pk'))['last'] or 0) + 1 for model in (User, Board, BoardTask, TaskComment)}
+        started = time.perf_counter()
+        chunk_size = options['chunk_size']
+        self.users = RowWriter(User, ['id', 'password', 'is_superuser', 'username', 'first_name', 'last_name', 'email', 'is_staff', 'is_active', 'date_joined'], chunk_size)
+        self.boards = RowWriter(Board, ['id', 'title', 'owner_id', 'created_at', 'member_count', 'ticket_count', 'tasks_to_do_count', 'tasks_high_prio_count', 'version', 'updated_at'], chunk_size)
+        self.members = RowWriter(Board.members.through, ['board_id', 'user_id'], chunk_size, [self.boards])
+        self.tasks = RowWriter(BoardTask, ['id', 'board_id', 'title', 'description', 'status', 'priority', 'due_date', 'assignee_id', 'reviewer_id', 'creator_id', 'created_at', 'updated_at'], chunk_size, [self.boards])
+        self.comments = RowWriter(TaskComment, ['id', 'task_id', 'author_id', 'content', 'created_at', 'updated_at'], chunk_size, [self.tasks])
+        with transaction.atomic():
+            self.write_users()
+        for boards in self.get_transaction_groups():
+            with transaction.atomic():
+                for board in boards:
+                    self.write_board(*board)
+                self.comments.flush()
+                self.members.flush()
+            self.stdout.write(f'Committed {self.boards.count} boards, {self.tasks.count} tasks and {self.comments.count} comments')
+        self.reset_sequences()
+        indexed = None
+        if is_search_available() and not options['skip_search_index']:
+            indexed = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(
+            f'Created {self.users.count} users, {self.boards.count} boards, {self.members.count} members, {self.tasks.count} tasks '
+            f'and {self.comments.count} comments in {time.perf_counter() - started:.1f} s'
+            + (f', indexed {indexed} tasks for the search.' if indexed is not None else '.')
+        ))
+
+    def get_ids(self, model, count):
+        first = self.next_ids[model]
+        self.next_ids[model] += count
+        return range(first, first + count)
+
+    def get_timestamp(self, after=None):
+        after = self.start if after is None else after
+        return after + self.rng.random() * max(self.start + self.duration - after, 0)
+
+    def adapt_datetime(self, timestamp):
+        return self.adapt_datetimefield_value(datetime.fromtimestamp(int(timestamp), dt_timezone.utc))
+
+    def get_text(self, kind):
+        return self.rng.choice(self.texts[kind])
+
+    """
+    The function `write_users` writes all users. They all get the same password hash, which is computed once with a salt of the seed, so the hashes are deterministic as well.
+    """
+    def write_users(self):
+        password = self.options['password']
+        password_hash = make_password(password, salt=f'seed{self.options["seed"]}') if password else UNUSABLE_PASSWORD_PREFIX
+        joined = self.adapt_datetime(self.start)
+        prefix = self.options['prefix']
+        self.user_ids = list(self.get_ids(User, self.options['users']))
+        for number, pk in enumerate(self.user_ids):
+            username = f'{prefix}-user-{number}'
+            self.users.add((pk, password_hash, False, username, '', '', f'{username}@example.com', False, True, joined))
+        self.users.flush()
+
+    """
+    The function `get_transaction_groups` draws the number of members and tasks of every board and groups the boards, so every group writes about `--transaction-size` rows. The sizes follow the Zipf weights of the board skew in a random order of the boards, the number of members is at most the number of users.
+    """
+    def get_transaction_groups(self):
+        options = self.options
+        weights = [(rank + 1) ** -options['board_skew'] for rank in range(options['boards'])]
+        self.rng.shuffle(weights)
+        task_counts = split_by_weights(options['tasks'], weights)
+        member_counts = [min(max(count, 1), len(self.user_ids)) for count in split_by_weights(options['members'] * options['boards'], weights)]
+        groups, group, rows = [], [], 0
+        for member_count, task_count in zip(member_counts, task_counts):
+            group.append((member_count, task_count))
+            rows += 1 + member_count + task_count * (1 + options['comments'])
+            if rows >= options['transaction_size']:
+                groups.append(group)
+                group, rows = [], 0
+        return groups + [group] if group else groups
+
+    """
+    The function `write_board` writes one board with its members, tasks and comments. The owner is the first member. The status and priority of all tasks are drawn first, so the counters are already correct in the row of the board.
+    """
+    def write_board(self, member_count, task_count):
+        options = self.options
+        rng = self.rng
+        board_id = self.get_ids(Board, 1)[0]
+        members = rng.sample(self.user_ids, member_count)
+        statuses = rng.choices(list(options['status_mix']), weights=list(options['status_mix'].values()), k=task_count)
+        priorities = rng.choices(list(options['priority_mix']), weights=list(options['priority_mix'].values()), k=task_count)
+        created_at = self.get_timestamp()
+        adapted_created_at = self.adapt_datetime(created_at)
+        self.boards.add((
+            board_id, f'Board {board_id} {self.get_text("title")}', members[0], adapted_created_at, member_count, task_count,
+            statuses.count('to-do'), priorities.count('high'), 1, adapted_created_at,
+        ))
+        for member in members:
+            self.members.add((board_id, member))
+        for task_id, status, priority in zip(self.get_ids(BoardTask, task_count), statuses, priorities):
+            task_created_at = self.get_timestamp(created_at)
+            due_date = None
+            if rng.random() < options['due_date_ratio']:
+                due_date = self.adapt_datefield_value(datetime.fromtimestamp(task_created_at, dt_timezone.utc).date() + timedelta(days=rng.randint(1, 60)))
+            assignee = rng.choice(members) if rng.random() < options['assigned_ratio'] else None
+            reviewer = rng.choice(members) if rng.random() < options['reviewed_ratio'] else None
+            adapted_task_created_at = self.adapt_datetime(task_created_at)
+            self.tasks.add((
+                task_id, board_id, f'{self.get_text("title").capitalize()} {task_id}', self.get_text('description') or None, status, priority,
+                due_date, assignee, reviewer, rng.choice(members), adapted_task_created_at, adapted_task_created_at,
+            ))
+            self.write_comments(task_id, task_created_at, members)
+
+    """
+    The function `write_comments` writes the comments of one task. Their number is drawn evenly between 0 and twice the average.
+    """
+    def write_comments(self, task_id, task_created_at, members):
+        rng = self.rng
+        count = rng.randint(0, int(2 * self.options['comments'] + rng.random()))
+        for comment_id in self.get_ids(TaskComment, count):
+            adapted_created_at = self.adapt_datetime(self.get_timestamp(task_created_at))
+            self.comments.add((comment_id, task_id, rng.choice(members), self.get_text('comment'), adapted_created_at, adapted_created_at))
+
+    """
+    The function `reset_sequences` moves the sequences of the primary keys behind the written ids, on databases which have sequences.
+    """
+    def reset_sequences(self):
+        statements = connection.ops.sequence_reset_sql(no_style(), [User, Board, BoardTask, TaskComment, Board.members.through])
+        if statements:
+            with connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
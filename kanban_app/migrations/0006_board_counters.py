@@ -0,0 +1,52 @@
+# Generated by Django 5.2.4 on 2026-10-18 09:12
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_board_counters(apps, schema_editor):
+    Board = apps.get_model('kanban_app', 'Board')
+    BoardTask = apps.get_model('kanban_app', 'BoardTask')
+    Membership = Board.members.through
+
+    def count(queryset):
+        return Coalesce(Subquery(queryset.filter(board_id=OuterRef('pk')).order_by().values('board_id').annotate(count=Count('id')).values('count'), output_field=IntegerField()), 0)
+
+    Board.objects.update(
+        member_count=count(Membership.objects.all()),
+        ticket_count=count(BoardTask.objects.all()),
+        tasks_to_do_count=count(BoardTask.objects.filter(Q(status='to-do'))),
+        tasks_high_prio_count=count(BoardTask.objects.filter(Q(priority='high'))),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0005_remove_board_creator'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='ticket_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_to_do_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_high_prio_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_board_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0006_board_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='boardtask',
+            index=models.Index(fields=['board', 'status'], name='task_board_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardtask',
+            index=models.Index(fields=['board', 'priority'], name='task_board_priority_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardtask',
+            index=models.Index(fields=['assignee', 'created_at', 'id'], name='task_assignee_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardtask',
+            index=models.Index(fields=['reviewer', 'created_at', 'id'], name='task_reviewer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardtask',
+            index=models.Index(fields=['created_at', 'id'], name='task_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='taskcomment',
+            index=models.Index(fields=['task', 'created_at', 'id'], name='comment_task_created_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-18 16:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0009_sync_tracking'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_id', models.PositiveBigIntegerField()),
+                ('field', models.PositiveSmallIntegerField(choices=[(1, 'status'), (2, 'assignee'), (3, 'priority')])),
+                ('old_value', models.BigIntegerField(null=True)),
+                ('new_value', models.BigIntegerField(null=True)),
+                ('changed_at', models.BigIntegerField()),
+                ('board', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='transitions', to='kanban_app.board')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['board', 'id'], name='transition_board_idx')],
+            },
+        ),
+    ]
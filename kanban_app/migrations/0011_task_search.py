@@ -0,0 +1,38 @@
+from django.db import migrations
+
+
+"""
+    The function `create_search_index` creates the FTS5 table of the full-text search and indexes the existing tasks. Other databases than SQLite do not get the table, the search is not available there.
+    """
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS kanban_task_search USING fts5("
+            "title, description, comments, board_id UNINDEXED, tokenize='unicode61 remove_diacritics 2')"
+        )
+        cursor.execute(
+            "INSERT OR REPLACE INTO kanban_task_search (rowid, title, description, comments, board_id) "
+            "SELECT t.id, t.title, COALESCE(t.description, ''), "
+            "COALESCE((SELECT group_concat(c.content, ' ') FROM kanban_app_taskcomment c WHERE c.task_id = t.id), ''), t.board_id "
+            "FROM kanban_app_boardtask t"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('DROP TABLE IF EXISTS kanban_task_search')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0010_task_transitions'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0011_task_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='boardtask',
+            index=models.Index(fields=['board', 'created_at', 'id'], name='task_board_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardtask',
+            index=models.Index(fields=['board', 'due_date', 'id'], name='task_board_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardtask',
+            index=models.Index(fields=['due_date', 'id'], name='task_due_idx'),
+        ),
+    ]
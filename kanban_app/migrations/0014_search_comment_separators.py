@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+"""
+    The function `get_index_sql` returns the statement which writes the rows of all tasks into the search table, with the comments joined by the given SQL expression.
+    """
+def get_index_sql(comments):
+    return (
+        "INSERT OR REPLACE INTO kanban_task_search (rowid, title, description, comments, board_id) "
+        f"SELECT t.id, t.title, COALESCE(t.description, ''), {comments}, t.board_id "
+        "FROM kanban_app_boardtask t"
+    )
+
+
+"""
+    The function `separate_comments` writes the comments of every task into the search table again, each enclosed in the separator char(30), so a single comment can be appended or removed.
+    """
+def separate_comments(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(get_index_sql(
+            "char(30) || COALESCE((SELECT group_concat(replace(c.content, char(30), ' ') || char(30), '') FROM kanban_app_taskcomment c WHERE c.task_id = t.id), '')"
+        ))
+
+
+def join_comments(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(get_index_sql(
+            "COALESCE((SELECT group_concat(c.content, ' ') FROM kanban_app_taskcomment c WHERE c.task_id = t.id), '')"
+        ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0013_task_list_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(separate_comments, join_comments),
+    ]
@@ -1,4 +1,5 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
 from django.contrib.auth.models import User
 
 """
@@ -23,17 +24,42 @@ PRIORITY_CHOICES = [
 
 
 """
-The `Board` class represents a model with a title, owner, members, and creation timestamp.
+The `BOARD_COUNTER_FIELDS` defines the stored counters of the `Board` model which are kept up to date by the signal handlers in `kanban_app/signals.py`.
+"""
+BOARD_COUNTER_FIELDS = ['member_count', 'ticket_count', 'tasks_to_do_count', 'tasks_high_prio_count']
+
+
+"""
+The `Board` class represents a model with a title, owner, members, and creation timestamp. It also stores the counts of its members, tasks, tasks to do and tasks with high priority, so the board list does not have to count them, and a version which increases with every change of the board, its tasks, comments and members. The `updated_at` changes with the title, the owner and the members of the board.
 """
 class Board(models.Model):
     title = models.CharField(max_length=255)
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='owned_boards')
     members = models.ManyToManyField(User, related_name='boards')
     created_at = models.DateTimeField(auto_now_add=True)
+    member_count = models.PositiveIntegerField(default=0)
+    ticket_count = models.PositiveIntegerField(default=0)
+    tasks_to_do_count = models.PositiveIntegerField(default=0)
+    tasks_high_prio_count = models.PositiveIntegerField(default=0)
+    version = models.PositiveBigIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    """
+    An existing board only saves its own fields, the counters and the version are only changed with F() expressions, so concurrent changes do not get lost. The version is increased in the same transaction.
+    """
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        if not adding and kwargs.get('update_fields') is None:
+            skipped = set(BOARD_COUNTER_FIELDS) | {'version'} | self.get_deferred_fields()
+            kwargs['update_fields'] = [field.name for field in self._meta.concrete_fields if not field.primary_key and field.name not in skipped]
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            if not adding:
+                Board.objects.filter(pk=self.pk).update(version=F('version') + 1)
 
 
 """
-The `BoardTask` class defines a model with fields for managing tasks associated with a board, including title, description, status, priority, due date, assignee, reviewer, creator, and creation timestamps.
+The `BoardTask` class defines a model with fields for managing tasks associated with a board, including title, description, status, priority, due date, assignee, reviewer, creator, and creation and update timestamps.
 """
 class BoardTask(models.Model):
     board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='tasks')
@@ -46,13 +72,131 @@ class BoardTask(models.Model):
     reviewer = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="review_tasks")
     creator = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name="created_tasks")
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    """
+    The indexes cover the most frequent queries: the tasks of a board filtered by status or priority, the tasks of an assignee or reviewer and the task list, each in the order of the pagination, and the changed tasks of a board. The filtered task list reads the tasks of one board or of all boards in the order of the creation or of the due date.
+    """
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'status'], name='task_board_status_idx'),
+            models.Index(fields=['board', 'updated_at'], name='task_board_updated_idx'),
+            models.Index(fields=['board', 'priority'], name='task_board_priority_idx'),
+            models.Index(fields=['assignee', 'created_at', 'id'], name='task_assignee_created_idx'),
+            models.Index(fields=['reviewer', 'created_at', 'id'], name='task_reviewer_created_idx'),
+            models.Index(fields=['created_at', 'id'], name='task_created_idx'),
+            models.Index(fields=['board', 'created_at', 'id'], name='task_board_created_idx'),
+            models.Index(fields=['board', 'due_date', 'id'], name='task_board_due_idx'),
+            models.Index(fields=['due_date', 'id'], name='task_due_idx'),
+        ]
+
+    """
+    The values of `board`, `status` and `priority` are remembered when the task is loaded, so the counters of the board can be updated without loading the task again. The assignee and reviewer are remembered for the invalidation of their cached task lists.
+    """
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        deferred = instance.get_deferred_fields()
+        if not deferred & {'board', 'status', 'priority'}:
+            instance._loaded_counter_values = instance.get_counter_values()
+        if not deferred & {'assignee', 'reviewer'}:
+            instance._loaded_user_ids = instance.get_user_ids()
+        return instance
+
+    def get_counter_values(self):
+        return (self.board_id, self.status, self.priority)
+
+    def get_user_ids(self):
+        return (self.assignee_id, self.reviewer_id)
+
+    """
+    The task is saved in the same transaction as the update of the board counters by the `post_save` signal. Afterwards the saved values are remembered for the next change.
+    """
+    def save(self, *args, **kwargs):
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            self._loaded_counter_values = self.get_counter_values()
+            self._loaded_user_ids = self.get_user_ids()
 
 
 """
-This class represents a TaskComment model with fields for task, author, content, and created_at timestamp.
+This class represents a TaskComment model with fields for task, author, content, and created_at and updated_at timestamps.
 """
 class TaskComment(models.Model):
     task = models.ForeignKey(BoardTask, on_delete=models.CASCADE, related_name='comments')
     author = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='created_comments')
     content = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    """
+    The indexes cover the comments of a task in the order of the pagination and the recently changed comments.
+    """
+    class Meta:
+        indexes = [
+            models.Index(fields=['task', 'created_at', 'id'], name='comment_task_created_idx'),
+            models.Index(fields=['updated_at'], name='comment_updated_idx'),
+        ]
+
+
+"""
+The `TOMBSTONE_KINDS` defines the possible choices for the `kind` field in the `Tombstone` model.
+"""
+TOMBSTONE_KINDS = [
+        ('task', 'Task'),
+        ('comment', 'Comment'),
+    ]
+
+
+"""
+The `Tombstone` class records the deletion of a task or a comment of a board, so the clients which sync the changes of the board can remove it as well. The tombstones are deleted with the board or by the `prune_tombstones` command.
+"""
+class Tombstone(models.Model):
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='tombstones')
+    kind = models.CharField(max_length=20, choices=TOMBSTONE_KINDS)
+    object_id = models.PositiveBigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'deleted_at'], name='tombstone_board_deleted_idx'),
+            models.Index(fields=['deleted_at'], name='tombstone_deleted_idx'),
+        ]
+
+
+"""
+The `TRANSITION_FIELDS` defines the codes of the fields whose changes are recorded in the `TaskTransition` model.
+"""
+TRANSITION_FIELDS = [
+        (1, 'status'),
+        (2, 'assignee'),
+        (3, 'priority'),
+    ]
+
+
+"""
+The `TaskTransition` class records one change of the status, the assignee or the priority of a task, so the history of a board can be reconstructed, f.e. for cycle times and cumulative flow. The rows are only appended and kept small: the status and the priority are stored as their index in `STATUS_CHOICES` and `PRIORITY_CHOICES`, the assignee as user id and the time of the change in milliseconds since the epoch. The old value of a created task is null. The task is only referenced by its id, so the history of a deleted task is kept until its board is deleted.
+"""
+class TaskTransition(models.Model):
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='transitions', db_index=False)
+    task_id = models.PositiveBigIntegerField()
+    field = models.PositiveSmallIntegerField(choices=TRANSITION_FIELDS)
+    old_value = models.BigIntegerField(null=True)
+    new_value = models.BigIntegerField(null=True)
+    changed_at = models.BigIntegerField()
+
+    """
+    The only index covers the history of a board in the order of the ids, so every new row only updates one index.
+    """
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', 'id'], name='transition_board_idx'),
+        ]
+
+
+"""
+The `TaskListVersion` class stores the version of the cached assigned and reviewing task lists of a user (see `kanban_app/response_cache.py`), like the version of a board, so every server process sees the same version. The user is only referenced by its id, because the version can change inside of the deletion of the user.
+"""
+class TaskListVersion(models.Model):
+    user_id = models.PositiveBigIntegerField(primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
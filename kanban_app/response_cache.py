@@ -0,0 +1,122 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.cache import caches
+
+from kanban_app.models import TaskListVersion
+
+
+"""
+The `ResponseCache` class stores the serialized data of responses in the `responses` cache of `CACHES` in `core/settings.py`. The size of the cache is bounded by the `MAX_ENTRIES` of the backend, which evicts entries when it is full. The keys contain a version, so entries are never deleted on a write: the write increases the version and the old entries are not requested anymore until they are evicted or expire.
+"""
+class ResponseCache:
+    def __init__(self, alias='responses'):
+        self.alias = alias
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get(self, key):
+        return self.count(self.cache.get(key))
+
+    def set(self, key, data):
+        self.cache.set(key, data)
+
+    """
+    The functions `aget` and `aset` are the versions of `get` and `set` for the async views.
+    """
+    async def aget(self, key):
+        return self.count(await self.cache.aget(key))
+
+    async def aset(self, key, data):
+        await self.cache.aset(key, data)
+
+    def count(self, data):
+        with self.lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return data
+
+    def stats(self):
+        with self.lock:
+            requests = self.hits + self.misses
+            return {
+                'backend': self.cache.__class__.__name__,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / requests if requests else 0.0,
+            }
+
+
+response_cache = ResponseCache()
+
+
+"""
+The `pending_task_list_user_ids` collects the users whose task lists are invalidated inside of `batched_task_list_invalidation`.
+"""
+pending_task_list_user_ids = ContextVar('pending_task_list_user_ids', default=None)
+
+
+"""
+    The function `get_task_list_version` returns the version of the assigned and reviewing task lists of a user from the `TaskListVersion` table, so all processes use the same version, 0 when the lists of the user were never changed.
+    """
+def get_task_list_version(user_id):
+    return TaskListVersion.objects.filter(user_id=user_id).values_list('version', flat=True).first() or 0
+
+
+"""
+    The function `aget_task_list_version` is the version of `get_task_list_version` for the async views.
+    """
+async def aget_task_list_version(user_id):
+    return await TaskListVersion.objects.filter(user_id=user_id).values_list('version', flat=True).afirst() or 0
+
+
+"""
+    The function `bump_task_list_versions` sets the versions of the task lists of the given users to the current time with one upsert, so a version is never used twice.
+    """
+def bump_task_list_versions(user_ids):
+    version = time.time_ns()
+    TaskListVersion.objects.bulk_create(
+        [TaskListVersion(user_id=user_id, version=version) for user_id in sorted(user_ids)],
+        update_conflicts=True,
+        unique_fields=['user_id'],
+        update_fields=['version'],
+    )
+
+
+"""
+    The function `invalidate_task_lists` changes the versions of the assigned and reviewing task lists of the given users in the current transaction, so the new version is visible together with the changed tasks. Inside of `batched_task_list_invalidation` the users are only collected.
+    :param user_ids: the ids of the assignees and reviewers of the changed tasks, None values are ignored
+    """
+def invalidate_task_lists(user_ids):
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return
+    pending = pending_task_list_user_ids.get()
+    if pending is not None:
+        pending.update(user_ids)
+        return
+    bump_task_list_versions(user_ids)
+
+
+"""
+    The function `batched_task_list_invalidation` is a context manager which collects the users of all task list invalidations inside of it and changes their versions with one upsert at the end, f.e. for a batch of many tasks.
+    """
+@contextmanager
+def batched_task_list_invalidation():
+    pending = set()
+    token = pending_task_list_user_ids.set(pending)
+    try:
+        yield
+    finally:
+        pending_task_list_user_ids.reset(token)
+    if pending:
+        bump_task_list_versions(pending)
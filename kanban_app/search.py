@@ -0,0 +1,199 @@
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connection
+
+from kanban_app.models import Board, BoardTask, TaskComment
+
+
+"""
+The `SEARCH_TABLE` is the SQLite FTS5 table of the full-text search. It contains one row per task with the id of the task as rowid, its title, its description and the content of all its comments. The id of the board is stored to scope the results, but not indexed.
+"""
+SEARCH_TABLE = 'kanban_task_search'
+
+"""
+The `COMMENT_SEPARATOR` encloses every comment in the comments column of the search table, f.e. '\x1eFirst\x1eSecond\x1e', so a comment can be appended or removed without reading the other comments of the task. It is removed from the content of the comments and is no part of a word for the tokenizer.
+"""
+COMMENT_SEPARATOR = '\x1e'
+
+"""
+The `SEARCH_WEIGHTS` are the weights of the title, the description and the comments for the ranking with bm25.
+"""
+SEARCH_WEIGHTS = (10.0, 4.0, 1.0)
+
+
+"""
+The `pending_search_updates` collects the ids of the changed and deleted tasks inside of `batched_search_updates`.
+"""
+pending_search_updates = ContextVar('pending_search_updates', default=None)
+
+
+"""
+    The function `is_search_available` checks if the database supports the full-text search. The search table is only created on SQLite.
+    """
+def is_search_available():
+    return connection.vendor == 'sqlite'
+
+
+"""
+    The function `create_search_table` creates the FTS5 table of the search. The diacritics are removed, so 'Müller' is found with 'muller'.
+    """
+def create_search_table(cursor):
+    cursor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+        "title, description, comments, board_id UNINDEXED, tokenize='unicode61 remove_diacritics 2')"
+    )
+
+
+"""
+    The function `get_index_sql` returns the statement which writes the rows of the tasks into the search table, each with the content of all its comments between the `COMMENT_SEPARATOR`. An existing row of a task is replaced.
+    :param where: the condition on the tasks `t`, f.e. 't.id IN (%s, %s)'
+    """
+def get_index_sql(where):
+    return (
+        f'INSERT OR REPLACE INTO {SEARCH_TABLE} (rowid, title, description, comments, board_id) '
+        f"SELECT t.id, t.title, COALESCE(t.description, ''), "
+        f"char(30) || COALESCE((SELECT group_concat(replace(c.content, char(30), ' ') || char(30), '') FROM {TaskComment._meta.db_table} c WHERE c.task_id = t.id), ''), t.board_id "
+        f'FROM {BoardTask._meta.db_table} t WHERE {where}'
+    )
+
+
+"""
+    The function `index_tasks` writes the current title, description and comments of the tasks into the search table with one statement. Inside of `batched_search_updates` the ids are only collected.
+    """
+def index_tasks(task_ids):
+    task_ids = [task_id for task_id in task_ids if task_id is not None]
+    pending = pending_search_updates.get()
+    if pending is not None:
+        pending['index'].update(task_ids)
+        return
+    if task_ids and is_search_available():
+        with connection.cursor() as cursor:
+            cursor.execute(get_index_sql(f't.id IN ({", ".join(["%s"] * len(task_ids))})'), task_ids)
+
+
+"""
+    The function `index_comment` appends a new comment to the row of its task in the search table, without reading the other comments of the task. A task without a row is indexed with `index_tasks`. Inside of `batched_search_updates` the task is indexed at the end.
+    """
+def index_comment(task_id, content):
+    if pending_search_updates.get() is not None or not is_search_available():
+        index_tasks([task_id])
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'UPDATE {SEARCH_TABLE} SET comments = comments || %s WHERE rowid = %s', [get_comment_text(content)[1:], task_id])
+        if cursor.rowcount == 0:
+            index_tasks([task_id])
+
+
+"""
+    The function `remove_comment` removes a deleted comment from the row of its task in the search table, without reading the other comments of the task. When the comment is not found in the row, the task is indexed again with `index_tasks`. Inside of `batched_search_updates` the task is indexed at the end.
+    """
+def remove_comment(task_id, content):
+    if pending_search_updates.get() is not None or not is_search_available():
+        index_tasks([task_id])
+        return
+    text = get_comment_text(content)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'UPDATE {SEARCH_TABLE} SET comments = substr(comments, 1, instr(comments, %s) - 1) || char(30) || substr(comments, instr(comments, %s) + %s) '
+            'WHERE rowid = %s AND instr(comments, %s) > 0',
+            [text, text, len(text), task_id, text],
+        )
+        if cursor.rowcount == 0:
+            index_tasks([task_id])
+
+
+"""
+    The function `get_comment_text` returns the content of a comment between two `COMMENT_SEPARATOR`, like it is stored in the comments column of the search table.
+    """
+def get_comment_text(content):
+    return COMMENT_SEPARATOR + content.replace(COMMENT_SEPARATOR, ' ') + COMMENT_SEPARATOR
+
+
+"""
+    The function `remove_tasks` removes deleted tasks from the search table with one statement. Inside of `batched_search_updates` the ids are only collected.
+    """
+def remove_tasks(task_ids):
+    task_ids = list(task_ids)
+    pending = pending_search_updates.get()
+    if pending is not None:
+        pending['remove'].update(task_ids)
+        return
+    if task_ids and is_search_available():
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({", ".join(["%s"] * len(task_ids))})', task_ids)
+
+
+"""
+    The function `batched_search_updates` is a context manager which collects the changed and deleted tasks inside of it and updates the search table at the end with one statement each, f.e. for the task batch endpoint.
+    """
+@contextmanager
+def batched_search_updates():
+    pending = {'index': set(), 'remove': set()}
+    token = pending_search_updates.set(pending)
+    try:
+        yield
+    finally:
+        pending_search_updates.reset(token)
+    remove_tasks(pending['remove'])
+    index_tasks(pending['index'] - pending['remove'])
+
+
+"""
+    The function `rebuild_search_index` fills the search table again with all tasks and returns the number of indexed tasks.
+    """
+def rebuild_search_index():
+    with connection.cursor() as cursor:
+        create_search_table(cursor)
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+        cursor.execute(get_index_sql('1 = 1'))
+        cursor.execute(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')")
+        cursor.execute(f'SELECT count(*) FROM {SEARCH_TABLE}')
+        return cursor.fetchone()[0]
+
+
+"""
+    The function `build_match_query` turns the text of a user into a query of FTS5: every word has to occur and the last word is also found as prefix, so a search while typing finds results. The words are quoted, so the text cannot contain the syntax of FTS5.
+    :return: the query or None if the text contains no word
+    """
+def build_match_query(text):
+    words = re.findall(r'\w+', text)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+"""
+    The function `search_tasks` returns one page of the tasks in the boards of the user which match the text, ranked by bm25, and the total number of matching tasks, which is only counted with a second query when the first page is full. Every result contains the id of the task, its board and a snippet of the best matching column with the found words in `[` and `]`, where the comments are separated by spaces.
+    :param board_id: only search in this board
+    """
+def search_tasks(user, text, offset=0, limit=20, board_id=None):
+    match = build_match_query(text)
+    if match is None:
+        return [], 0
+    where = (
+        f'{SEARCH_TABLE} MATCH %s AND board_id IN ('
+        f'SELECT id FROM {Board._meta.db_table} WHERE owner_id = %s '
+        f'UNION SELECT board_id FROM {Board.members.through._meta.db_table} WHERE user_id = %s)'
+    )
+    params = [match, user.id, user.id]
+    if board_id is not None:
+        where += ' AND board_id = %s'
+        params.append(board_id)
+    weights = ', '.join(str(weight) for weight in SEARCH_WEIGHTS)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, board_id, trim(replace(snippet({SEARCH_TABLE}, -1, '[', ']', '…', 12), char(30), ' ')) "
+            f'FROM {SEARCH_TABLE} WHERE {where} ORDER BY bm25({SEARCH_TABLE}, {weights}), rowid LIMIT %s OFFSET %s',
+            [*params, limit, offset],
+        )
+        rows = cursor.fetchall()
+        if offset == 0 and len(rows) < limit:
+            count = len(rows)
+        else:
+            cursor.execute(f'SELECT count(*) FROM {SEARCH_TABLE} WHERE {where}', params)
+            count = cursor.fetchone()[0]
+    return [{'task': task_id, 'board': board, 'snippet': snippet} for task_id, board, snippet in rows], count
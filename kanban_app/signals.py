@@ -0,0 +1,191 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+
+from kanban_app.counters import apply_task_counter_change, bump_board_version, update_member_counts
+from kanban_app.email_lookups import get_email_lookup_key
+from kanban_app.events import publish_board_event
+from kanban_app.history import get_loaded_tracked_values, record_task_transitions
+from kanban_app.models import Board, BoardTask
+from kanban_app.response_cache import invalidate_task_lists
+from kanban_app.search import index_tasks, remove_tasks
+from kanban_app.sync import record_tombstone
+
+
+"""
+The signal handler `update_counters_on_task_save` updates the counters and the version of the board when a task is created or changed. It runs inside the transaction of `BoardTask.save`.
+"""
+def update_counters_on_task_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = None if created else getattr(instance, '_loaded_counter_values', None)
+    if not created and previous is None:
+        bump_board_version(instance.board_id)
+        return
+    apply_task_counter_change(previous, instance.get_counter_values())
+
+
+"""
+The signal handler `record_transitions_on_task_save` records the changes of the status, the assignee and the priority of a created or changed task in the history of its board. It runs inside the transaction of `BoardTask.save`. Changes of a task which was loaded without these fields are not recorded.
+"""
+def record_transitions_on_task_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = None if created else get_loaded_tracked_values(instance)
+    if created or previous is not None:
+        record_task_transitions(instance, previous)
+
+
+"""
+The signal handler `update_counters_on_task_delete` removes a deleted task from the counters of its board. It runs inside the transaction of the deletion. When the whole board is deleted its counters are not updated anymore.
+"""
+def update_counters_on_task_delete(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, Board) or getattr(origin, 'model', None) is Board:
+        return
+    values = getattr(instance, '_loaded_counter_values', None) or instance.get_counter_values()
+    apply_task_counter_change(values, None)
+
+
+"""
+The signal handler `invalidate_task_lists_on_task_change` invalidates the cached task lists of the previous and the current assignee and reviewer of a created, changed or deleted task. When the whole board is deleted the users are collected on the board and invalidated together by `invalidate_task_lists_on_board_delete`.
+"""
+def invalidate_task_lists_on_task_change(sender, instance, raw=False, origin=None, **kwargs):
+    if raw:
+        return
+    user_ids = [*getattr(instance, '_loaded_user_ids', ()), *instance.get_user_ids()]
+    if isinstance(origin, Board):
+        origin.__dict__.setdefault('_deleted_task_user_ids', set()).update(user_ids)
+        return
+    invalidate_task_lists(user_ids)
+
+
+"""
+The signal handler `invalidate_task_lists_on_board_delete` invalidates the cached task lists of all assignees and reviewers of the tasks of a deleted board.
+"""
+def invalidate_task_lists_on_board_delete(sender, instance, **kwargs):
+    invalidate_task_lists(getattr(instance, '_deleted_task_user_ids', ()))
+
+
+"""
+The signal handler `index_task_on_save` writes a created or changed task into the search table. A save with `update_fields` which contain neither the title nor the description does not change the indexed text.
+"""
+def index_task_on_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if update_fields is not None and not {'title', 'description'} & set(update_fields):
+        return
+    index_tasks([instance.pk])
+
+
+"""
+The signal handler `remove_task_from_search` removes a deleted task from the search table. When the whole board is deleted the tasks are collected on the board and removed together by `remove_board_from_search`.
+"""
+def remove_task_from_search(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, Board):
+        origin.__dict__.setdefault('_deleted_task_ids', set()).add(instance.pk)
+        return
+    remove_tasks([instance.pk])
+
+
+def remove_board_from_search(sender, instance, **kwargs):
+    remove_tasks(getattr(instance, '_deleted_task_ids', ()))
+
+
+"""
+The signal handler `record_task_tombstone` records the deletion of a task for the delta sync of the board. The tasks of a deleted board do not need own tombstones. The deletion of a comment is recorded by `TaskCommentDeleteView`, because a signal handler for the comments would prevent the fast deletion of the comments of a deleted task.
+"""
+def record_task_tombstone(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, Board) or getattr(origin, 'model', None) is Board:
+        return
+    record_tombstone(instance.board_id, 'task', instance.pk)
+
+
+"""
+The signal handler `remember_boards_on_clear` stores the boards of a user before all of them are removed with `user.boards.clear()`, because the ids are not provided afterwards.
+"""
+def remember_boards_on_clear(sender, instance, action, reverse, **kwargs):
+    if action == 'pre_clear' and reverse:
+        instance._cleared_board_ids = list(Board.members.through.objects.filter(user_id=instance.pk).values_list('board_id', flat=True))
+
+
+"""
+The signal handler `update_counters_on_member_change` counts the members of all affected boards again after members were added, removed or cleared, including `members.set()`. It runs inside the transaction of the change.
+"""
+def update_counters_on_member_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        update_member_counts(get_changed_board_ids(instance, action, reverse, pk_set))
+
+
+"""
+    The function `get_changed_board_ids` returns the ids of the boards whose members were changed by a `m2m_changed` signal.
+    """
+def get_changed_board_ids(instance, action, reverse, pk_set):
+    if not reverse:
+        return [instance.pk]
+    if action == 'post_clear':
+        return getattr(instance, '_cleared_board_ids', [])
+    return list(pk_set or [])
+
+
+"""
+The signal handlers `publish_task_event`, `publish_task_delete_event`, `publish_board_delete_event` and `publish_member_event` send the changes of the tasks and members of a board to the subscribers of its event stream after the commit. The deleted tasks of a deleted board are not sent separately.
+"""
+def publish_task_event(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        publish_board_event(instance.board_id, 'task.created' if created else 'task.updated', task=instance.pk)
+
+
+def publish_task_delete_event(sender, instance, origin=None, **kwargs):
+    if not (isinstance(origin, Board) or getattr(origin, 'model', None) is Board):
+        publish_board_event(instance.board_id, 'task.deleted', task=instance.pk)
+
+
+def publish_board_delete_event(sender, instance, **kwargs):
+    publish_board_event(instance.pk, 'board.deleted')
+
+
+def publish_member_event(sender, instance, action, reverse, pk_set, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        for board_id in get_changed_board_ids(instance, action, reverse, pk_set):
+            publish_board_event(board_id, 'members.changed')
+
+
+"""
+The signal handler `remember_loaded_email` stores the email address of a user when it is loaded, so `invalidate_email_lookup` also finds the previous address of a changed user.
+"""
+def remember_loaded_email(sender, instance, **kwargs):
+    instance._loaded_email = instance.__dict__.get('email')
+
+
+"""
+The signal handler `invalidate_email_lookup` removes the cached lookups of the current and the previously loaded email address of a user when the user was created, changed or deleted, so a new user is found immediately and a changed address is not found anymore.
+"""
+def invalidate_email_lookup(sender, instance, **kwargs):
+    emails = {getattr(instance, '_loaded_email', None), instance.__dict__.get('email')}
+    cache.delete_many([get_email_lookup_key(email) for email in emails if email])
+    instance._loaded_email = instance.__dict__.get('email')
+
+
+"""
+The function `connect_signals` connects all signal handlers of the app: the board counters, the task history, the cached task lists, the tombstones of the delta sync, the search index, the board events and the email lookup cache. It is called when the app is ready.
+"""
+def connect_signals():
+    post_save.connect(update_counters_on_task_save, sender=BoardTask, dispatch_uid='board_counters_task_save')
+    post_delete.connect(update_counters_on_task_delete, sender=BoardTask, dispatch_uid='board_counters_task_delete')
+    post_save.connect(record_transitions_on_task_save, sender=BoardTask, dispatch_uid='history_task_save')
+    post_save.connect(invalidate_task_lists_on_task_change, sender=BoardTask, dispatch_uid='response_cache_task_save')
+    post_delete.connect(invalidate_task_lists_on_task_change, sender=BoardTask, dispatch_uid='response_cache_task_delete')
+    post_delete.connect(invalidate_task_lists_on_board_delete, sender=Board, dispatch_uid='response_cache_board_delete')
+    post_delete.connect(record_task_tombstone, sender=BoardTask, dispatch_uid='sync_task_tombstone')
+    post_save.connect(index_task_on_save, sender=BoardTask, dispatch_uid='search_task_save')
+    post_delete.connect(remove_task_from_search, sender=BoardTask, dispatch_uid='search_task_delete')
+    post_delete.connect(remove_board_from_search, sender=Board, dispatch_uid='search_board_delete')
+    post_save.connect(publish_task_event, sender=BoardTask, dispatch_uid='events_task_save')
+    post_delete.connect(publish_task_delete_event, sender=BoardTask, dispatch_uid='events_task_delete')
+    post_delete.connect(publish_board_delete_event, sender=Board, dispatch_uid='events_board_delete')
+    m2m_changed.connect(publish_member_event, sender=Board.members.through, dispatch_uid='events_member_change')
+    m2m_changed.connect(remember_boards_on_clear, sender=Board.members.through, dispatch_uid='board_counters_member_pre_clear')
+    m2m_changed.connect(update_counters_on_member_change, sender=Board.members.through, dispatch_uid='board_counters_member_change')
+    post_init.connect(remember_loaded_email, sender=User, dispatch_uid='email_lookup_user_init')
+    post_save.connect(invalidate_email_lookup, sender=User, dispatch_uid='email_lookup_user_save')
+    post_delete.connect(invalidate_email_lookup, sender=User, dispatch_uid='email_lookup_user_delete')
@@ -0,0 +1,49 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.utils import timezone
+
+from kanban_app.models import BoardTask, Tombstone
+
+
+"""
+The `pending_tombstones` collects the tombstones inside of `batched_tombstones`.
+"""
+pending_tombstones = ContextVar('pending_tombstones', default=None)
+
+
+"""
+    The function `record_tombstone` stores that a task or a comment of a board was deleted. Inside of `batched_tombstones` the tombstone is only collected.
+    :param board_id: the id of the board of the deleted object
+    :param kind: 'task' or 'comment'
+    :param object_id: the id of the deleted object
+    """
+def record_tombstone(board_id, kind, object_id):
+    tombstone = Tombstone(board_id=board_id, kind=kind, object_id=object_id)
+    pending = pending_tombstones.get()
+    if pending is not None:
+        pending.append(tombstone)
+        return
+    tombstone.save()
+
+
+"""
+    The function `batched_tombstones` is a context manager which collects all tombstones of the deletions inside of it and writes them with one bulk insert at the end, f.e. for the deletion of many tasks with one queryset.
+    """
+@contextmanager
+def batched_tombstones():
+    pending = []
+    token = pending_tombstones.set(pending)
+    try:
+        yield
+    finally:
+        pending_tombstones.reset(token)
+    if pending:
+        Tombstone.objects.bulk_create(pending)
+
+
+"""
+    The function `touch_task` sets the update timestamp of a task after a change which is not saved with the task, f.e. a new comment which changes its comment count.
+    """
+def touch_task(task_id):
+    BoardTask.objects.filter(pk=task_id).update(updated_at=timezone.now())
@@ -0,0 +1,91 @@
+from base64 import b64encode
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework.test import APIClient
+
+from kanban_app.api.services import encode_sync_cursor
+from kanban_app.models import Board, BoardTask, TaskComment
+
+
+"""
+The `BoardChangesTests` class checks the delta sync of a board: a cursor returns only the tasks and comments which changed since then and the tombstones of the deleted ones, an unchanged board returns the same cursor without loading anything, and a malformed cursor is rejected.
+"""
+class BoardChangesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner', email='owner@example.com')
+        cls.board = Board.objects.create(title='Board', owner=cls.user)
+        cls.board.members.add(cls.user)
+        cls.changed, cls.commented, cls.deleted, cls.unchanged = [
+            BoardTask.objects.create(board=cls.board, title=title, status='to-do', priority='low', creator=cls.user)
+            for title in ('Changed', 'Commented', 'Deleted', 'Unchanged')
+        ]
+        cls.old_comment = TaskComment.objects.create(task=cls.commented, author=cls.user, content='Old')
+        cls.deleted_comment = TaskComment.objects.create(task=cls.commented, author=cls.user, content='Deleted')
+        past = timezone.now() - timedelta(hours=1)
+        BoardTask.objects.update(updated_at=past)
+        TaskComment.objects.update(updated_at=past)
+        Board.objects.update(updated_at=past)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('board_changes', kwargs={'pk': self.board.pk})
+
+    def get_changes(self, cursor=None):
+        response = self.client.get(self.url, {'cursor': cursor} if cursor else {})
+        self.assertEqual(response.status_code, 200, response.content[:200])
+        return response.json()
+
+    def get_version(self):
+        self.board.refresh_from_db(fields=['version'])
+        return self.board.version
+
+    def test_without_cursor_returns_everything(self):
+        changes = self.get_changes()
+        self.assertTrue(changes['reset'])
+        self.assertEqual(changes['board']['id'], self.board.pk)
+        self.assertEqual([task['id'] for task in changes['tasks']], [self.changed.pk, self.commented.pk, self.deleted.pk, self.unchanged.pk])
+        self.assertEqual([comment['id'] for comment in changes['comments']], [self.old_comment.pk, self.deleted_comment.pk])
+
+    def test_cursor_returns_only_the_changes_and_tombstones(self):
+        cursor = encode_sync_cursor(timezone.now() - timedelta(minutes=10), self.get_version())
+        self.assertLess(self.client.patch(reverse('task_detail', kwargs={'pk': self.changed.pk}), {'status': 'done'}, format='json').status_code, 400)
+        self.assertLess(self.client.delete(reverse('task_detail', kwargs={'pk': self.deleted.pk})).status_code, 400)
+        new_comment = self.client.post(reverse('task_comment_list', kwargs={'task_id': self.commented.pk}), {'content': 'New'}, format='json').json()
+        self.assertLess(self.client.delete(reverse('task_comment_delete', kwargs={'task_id': self.commented.pk, 'comment_id': self.deleted_comment.pk})).status_code, 400)
+        changes = self.get_changes(cursor)
+        self.assertFalse(changes['reset'])
+        self.assertIsNone(changes['board'])
+        self.assertEqual(changes['version'], self.get_version())
+        self.assertEqual([(task['id'], task['status']) for task in changes['tasks']], [(self.changed.pk, 'done'), (self.commented.pk, 'to-do')])
+        self.assertEqual([comment['id'] for comment in changes['comments']], [new_comment['id']])
+        self.assertEqual(changes['deleted_tasks'], [self.deleted.pk])
+        self.assertEqual(changes['deleted_comments'], [self.deleted_comment.pk])
+        self.assertNotEqual(changes['cursor'], cursor)
+
+    def test_member_change_sends_the_board(self):
+        cursor = encode_sync_cursor(timezone.now() - timedelta(minutes=10), self.get_version())
+        member = User.objects.create(username='member', email='member@example.com')
+        self.assertLess(self.client.patch(reverse('board_detail', kwargs={'pk': self.board.pk}), {'members': [self.user.pk, member.pk]}, format='json').status_code, 400)
+        changes = self.get_changes(cursor)
+        self.assertEqual([user['id'] for user in changes['board']['members']], [self.user.pk, member.pk])
+        self.assertEqual(changes['tasks'], [])
+
+    def test_unchanged_version_returns_the_same_cursor(self):
+        cursor = encode_sync_cursor(timezone.now() - timedelta(minutes=10), self.get_version())
+        with self.assertNumQueries(1):
+            changes = self.get_changes(cursor)
+        self.assertEqual(changes, {'cursor': cursor, 'version': self.board.version, 'reset': False, 'board': None, 'tasks': [], 'comments': [], 'deleted_tasks': [], 'deleted_comments': []})
+
+    def test_malformed_cursor_is_rejected(self):
+        for cursor in ['not base64!', b64encode(b'no separator').decode(), b64encode(b'not a date|1').decode(), b64encode(f'{timezone.now().isoformat()}|x'.encode()).decode()]:
+            with self.subTest(cursor):
+                response = self.client.get(self.url, {'cursor': cursor})
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), {'detail': 'Invalid cursor'})
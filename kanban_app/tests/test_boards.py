@@ -0,0 +1,102 @@
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from kanban_app.models import Board, BoardTask, TaskComment
+
+
+"""
+The `BoardListQueryTests` class checks that the board list needs the same number of queries for a few and for many boards, and that the statistics of every board are still right.
+"""
+class BoardListQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner', email='owner@example.com')
+        cls.member = User.objects.create(username='member', email='member@example.com')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    """
+    The function `create_boards` creates the given number of boards of the user, each with another member, a task to do with high priority and a finished task.
+    """
+    def create_boards(self, count):
+        for i in range(count):
+            board = Board.objects.create(title=f'Board {i}', owner=self.user)
+            board.members.add(self.user, self.member)
+            BoardTask.objects.create(board=board, title='Open', status='to-do', priority='high', creator=self.user)
+            BoardTask.objects.create(board=board, title='Finished', status='done', priority='low', creator=self.user)
+
+    """
+    The function `get_boards` requests the board list with the expected number of queries and returns the boards of the response.
+    """
+    def get_boards(self, queries):
+        with self.assertNumQueries(queries):
+            response = self.client.get(reverse('boards_list'))
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_query_count_does_not_grow_with_the_boards(self):
+        self.create_boards(3)
+        self.assertEqual(len(self.get_boards(1)), 3)
+        self.create_boards(30)
+        boards = self.get_boards(1)
+        self.assertEqual(len(boards), 33)
+        for board in boards:
+            self.assertEqual(board['member_count'], 2)
+            self.assertEqual(board['ticket_count'], 2)
+            self.assertEqual(board['tasks_to_do_count'], 1)
+            self.assertEqual(board['tasks_high_prio_count'], 1)
+
+
+"""
+The `BoardDetailETagTests` class checks that the board details answer a matching `If-None-Match` with a 304 and get a new ETag after every write of a task, a comment or the members of the board.
+"""
+class BoardDetailETagTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner', email='owner@example.com')
+        cls.member = User.objects.create(username='member', email='member@example.com')
+        cls.board = Board.objects.create(title='Board', owner=cls.user)
+        cls.board.members.add(cls.user)
+        cls.task = BoardTask.objects.create(board=cls.board, title='Task', status='to-do', priority='high', creator=cls.user)
+
+    def setUp(self):
+        caches['responses'].clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('board_detail', kwargs={'pk': self.board.pk})
+
+    def get_etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.get_etag()
+        response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_writes_change_the_etag(self):
+        writes = {
+            'task create': lambda: self.client.post(reverse('task_list'), {'board': self.board.pk, 'title': 'New', 'status': 'to-do', 'priority': 'low'}, format='json'),
+            'task update': lambda: self.client.patch(reverse('task_detail', kwargs={'pk': self.task.pk}), {'status': 'done'}, format='json'),
+            'comment create': lambda: self.client.post(reverse('task_comment_list', kwargs={'task_id': self.task.pk}), {'content': 'Comment'}, format='json'),
+            'comment delete': lambda: self.client.delete(reverse('task_comment_delete', kwargs={'task_id': self.task.pk, 'comment_id': TaskComment.objects.filter(task=self.task).latest('id').pk})),
+            'member change': lambda: self.client.patch(self.url, {'members': [self.user.pk, self.member.pk]}, format='json'),
+            'task delete': lambda: self.client.delete(reverse('task_detail', kwargs={'pk': self.task.pk})),
+        }
+        for name, write in writes.items():
+            with self.subTest(name):
+                etag = self.get_etag()
+                response = write()
+                self.assertLess(response.status_code, 400, response.content[:200])
+                response = self.client.get(self.url, headers={'If-None-Match': etag})
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response['ETag'], etag)
@@ -0,0 +1,97 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from kanban_app.models import Board, BoardTask, TaskComment
+
+
+"""
+The `TaskCommentQueryTests` class checks that listing and creating the comments of a task needs the same number of queries on a board with one member and one comment as on a board with many members and comments, because the task, its board and the members are loaded once per request.
+"""
+class TaskCommentQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='author', email='author@example.com')
+        members = [User.objects.create(username=f'member-{i}', email=f'member-{i}@example.com') for i in range(20)]
+        cls.small_task = cls.create_task('Small Board', [], 1)
+        cls.large_task = cls.create_task('Large Board', members, 20)
+
+    """
+    The function `create_task` creates a board of the user with the given other members and a task with the given number of comments, which are written by the members in turn.
+    """
+    @classmethod
+    def create_task(cls, title, members, comments):
+        board = Board.objects.create(title=title, owner=cls.user)
+        board.members.add(cls.user, *members)
+        task = BoardTask.objects.create(board=board, title='Task', status='to-do', priority='high', assignee=cls.user, creator=cls.user)
+        authors = [cls.user, *members]
+        for i in range(comments):
+            TaskComment.objects.create(task=task, author=authors[i % len(authors)], content=f'Comment {i}')
+        return task
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_query_count_does_not_grow_with_members_and_comments(self):
+        for task, comments in [(self.small_task, 1), (self.large_task, 20)]:
+            with self.subTest(task.board.title):
+                with self.assertNumQueries(3):
+                    response = self.client.get(reverse('task_comment_list', kwargs={'task_id': task.pk}))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.json()['results']), comments)
+
+    def test_create_query_count_does_not_grow_with_members_and_comments(self):
+        for task in [self.small_task, self.large_task]:
+            with self.subTest(task.board.title):
+                with self.assertNumQueries(9):
+                    response = self.client.post(reverse('task_comment_list', kwargs={'task_id': task.pk}), {'content': 'New Comment'}, format='json')
+                self.assertEqual(response.status_code, 201)
+                self.assertTrue(TaskComment.objects.filter(pk=response.json()['id'], task=task).exists())
+
+
+"""
+The `TaskCommentETagTests` class checks that the comment list of a task answers a matching `If-None-Match` with a 304 and gets a new ETag after a comment or the task was written.
+"""
+class TaskCommentETagTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='author', email='author@example.com')
+        board = Board.objects.create(title='Board', owner=cls.user)
+        board.members.add(cls.user)
+        cls.task = BoardTask.objects.create(board=board, title='Task', status='to-do', priority='high', creator=cls.user)
+        cls.comment = TaskComment.objects.create(task=cls.task, author=cls.user, content='Comment')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('task_comment_list', kwargs={'task_id': self.task.pk})
+
+    def get_etag(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.get_etag()
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_writes_change_the_etag(self):
+        writes = {
+            'comment create': lambda: self.client.post(self.url, {'content': 'New Comment'}, format='json'),
+            'comment delete': lambda: self.client.delete(reverse('task_comment_delete', kwargs={'task_id': self.task.pk, 'comment_id': self.comment.pk})),
+            'task update': lambda: self.client.patch(reverse('task_detail', kwargs={'pk': self.task.pk}), {'priority': 'low'}, format='json'),
+        }
+        for name, write in writes.items():
+            with self.subTest(name):
+                etag = self.get_etag()
+                response = write()
+                self.assertLess(response.status_code, 400, response.content[:200])
+                response = self.client.get(self.url, headers={'If-None-Match': etag})
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response['ETag'], etag)
@@ -0,0 +1,77 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+
+"""
+The `EmailLookupTests` class checks that the email check and the bulk email check find the same user from the same cache, answer repeated lookups without a query and see created, changed and deleted users immediately.
+"""
+class EmailLookupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner', email='owner@example.com')
+        cls.member = User.objects.create(username='member', email='member@example.com')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    """
+    The function `check_email` sends the email check and returns the found user or None for an unknown email address.
+    """
+    def check_email(self, email):
+        response = self.client.get(reverse('email-check'), {'email': email})
+        if response.status_code == 404:
+            self.assertEqual(response.json(), {'error': 'Email not found'})
+            return None
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    """
+    The function `check_emails` sends the bulk email check and returns the found users and the unknown email addresses.
+    """
+    def check_emails(self, *emails):
+        response = self.client.post(reverse('email-check-bulk'), {'emails': list(emails)}, format='json')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        return data['users'], data['unknown_emails']
+
+    def test_both_endpoints_find_the_newest_of_duplicate_users(self):
+        newest = User.objects.create(username='duplicate', email=self.member.email)
+        expected = {'id': newest.pk, 'email': newest.email, 'fullname': 'duplicate'}
+        self.assertEqual(self.check_email(self.member.email), expected)
+        cache.clear()
+        self.assertEqual(self.check_emails(self.member.email), ([expected], []))
+
+    def test_repeated_lookups_are_answered_from_the_cache(self):
+        with self.assertNumQueries(1):
+            self.check_emails(self.member.email, 'unknown@example.com')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.check_email(self.member.email), {'id': self.member.pk, 'email': self.member.email, 'fullname': 'member'})
+            self.assertIsNone(self.check_email('unknown@example.com'))
+            self.assertEqual(self.check_emails('unknown@example.com', self.member.email), ([{'id': self.member.pk, 'email': self.member.email, 'fullname': 'member'}], ['unknown@example.com']))
+
+    def test_created_user_is_found_immediately(self):
+        self.assertIsNone(self.check_email('new@example.com'))
+        user = User.objects.create(username='new', email='new@example.com')
+        self.assertEqual(self.check_email('new@example.com')['id'], user.pk)
+        self.assertEqual(self.check_emails('new@example.com'), ([{'id': user.pk, 'email': 'new@example.com', 'fullname': 'new'}], []))
+
+    def test_changed_email_is_invalidated_for_the_old_and_the_new_address(self):
+        self.assertEqual(self.check_email(self.member.email)['id'], self.member.pk)
+        self.assertIsNone(self.check_email('changed@example.com'))
+        member = User.objects.get(pk=self.member.pk)
+        member.email = 'changed@example.com'
+        member.save()
+        self.assertIsNone(self.check_email('member@example.com'))
+        self.assertEqual(self.check_emails('member@example.com', 'changed@example.com'), ([{'id': self.member.pk, 'email': 'changed@example.com', 'fullname': 'member'}], ['member@example.com']))
+
+    def test_deleted_user_is_not_found(self):
+        self.assertEqual(self.check_emails(self.member.email)[1], [])
+        User.objects.get(pk=self.member.pk).delete()
+        self.assertIsNone(self.check_email(self.member.email))
+        self.assertEqual(self.check_emails(self.member.email), ([], [self.member.email]))
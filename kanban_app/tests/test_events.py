@@ -0,0 +1,164 @@
+import asyncio
+import threading
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.api.authentication import token_cache
+from kanban_app.api.streams import create_stream_ticket, stream_board_events
+from kanban_app.events import InProcessEventBroker, get_event_broker
+from kanban_app.models import Board
+
+
+"""
+    The function `publish_from_thread` publishes the events in another thread, like a sync view of a worker thread does, and waits for it.
+    """
+def publish_from_thread(broker, board_id, *events):
+    thread = threading.Thread(target=lambda: [broker.publish(board_id, event) for event in events])
+    thread.start()
+    thread.join()
+
+
+"""
+The `InProcessEventBrokerTests` class checks the fan-out of the events from other threads to the queues of the subscribers in the event loop, and that the broker forgets the subscribers again.
+"""
+class InProcessEventBrokerTests(SimpleTestCase):
+    async def test_publish_from_thread_reaches_all_subscribers_of_the_board(self):
+        broker = InProcessEventBroker()
+        first, second, other = broker.subscribe(1), broker.subscribe(1), broker.subscribe(2)
+        event = {'type': 'task.created', 'board': 1, 'task': 7}
+        publish_from_thread(broker, 1, event)
+        self.assertEqual(await asyncio.wait_for(first.get(), 1), event)
+        self.assertEqual(await asyncio.wait_for(second.get(), 1), event)
+        self.assertTrue(other.queue.empty())
+        self.assertEqual(broker.stats(), {'boards': 2, 'subscribers': 3, 'published': 1})
+        for subscription in (first, second, other):
+            broker.unsubscribe(subscription)
+        self.assertEqual(broker.subscriptions, {})
+        self.assertEqual(broker.stats(), {'boards': 0, 'subscribers': 0, 'published': 1})
+
+    @override_settings(KANBAN_EVENT_QUEUE_SIZE=2)
+    async def test_full_queue_is_replaced_by_resync(self):
+        broker = InProcessEventBroker()
+        subscription = broker.subscribe(1)
+        publish_from_thread(broker, 1, *[{'type': 'task.updated', 'board': 1, 'task': i} for i in range(3)])
+        await asyncio.sleep(0)
+        self.assertEqual(await asyncio.wait_for(subscription.get(), 1), {'type': 'resync', 'board': 1})
+        self.assertTrue(subscription.queue.empty())
+
+    def test_subscriber_of_a_closed_loop_is_removed(self):
+        broker = InProcessEventBroker()
+
+        async def subscribe():
+            return broker.subscribe(1)
+
+        subscription = asyncio.run(subscribe())
+        broker.publish(1, {'type': 'task.created', 'board': 1, 'task': 7})
+        self.assertNotIn(subscription, broker.subscriptions.get(1, set()))
+        self.assertEqual(broker.stats()['subscribers'], 0)
+
+
+"""
+The `StreamBoardEventsTests` class checks that the stream of a board sends the published events and unsubscribes when it ends or the client goes away.
+"""
+class StreamBoardEventsTests(SimpleTestCase):
+    def setUp(self):
+        get_event_broker.cache_clear()
+
+    async def test_stream_sends_events_until_the_board_is_deleted(self):
+        stream = stream_board_events(1, user=None)
+        self.assertEqual(await anext(stream), 'event: ready\ndata: {"type": "ready", "board": 1}\n\n')
+        publish_from_thread(get_event_broker(), 1, {'type': 'task.created', 'board': 1, 'task': 7}, {'type': 'board.deleted', 'board': 1})
+        self.assertEqual(await asyncio.wait_for(anext(stream), 1), 'event: task.created\ndata: {"type": "task.created", "board": 1, "task": 7}\n\n')
+        self.assertEqual(await asyncio.wait_for(anext(stream), 1), 'event: board.deleted\ndata: {"type": "board.deleted", "board": 1}\n\n')
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+        self.assertEqual(get_event_broker().stats()['subscribers'], 0)
+
+    async def test_closed_stream_unsubscribes(self):
+        stream = stream_board_events(1, user=None)
+        await anext(stream)
+        self.assertEqual(get_event_broker().stats()['subscribers'], 1)
+        await stream.aclose()
+        self.assertEqual(get_event_broker().stats(), {'boards': 0, 'subscribers': 0, 'published': 0})
+
+
+"""
+The `BoardEventStreamTests` class checks the authentication and the board access of the event stream and the tickets for the stream.
+"""
+class BoardEventStreamTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create(username='owner', email='owner@example.com')
+        cls.member = User.objects.create(username='member', email='member@example.com')
+        cls.stranger = User.objects.create(username='stranger', email='stranger@example.com')
+        cls.board = Board.objects.create(title='Board', owner=cls.owner)
+        cls.board.members.add(cls.owner, cls.member)
+        cls.other_board = Board.objects.create(title='Other Board', owner=cls.owner)
+        cls.tokens = {user.username: Token.objects.create(user=user).key for user in (cls.owner, cls.member, cls.stranger)}
+
+    def setUp(self):
+        token_cache.clear()
+        get_event_broker.cache_clear()
+
+    def get_stream(self, board_id, token=None, **query):
+        headers = {'Authorization': f'Token {token}'} if token else {}
+        return self.async_client.get(reverse('board_events', kwargs={'pk': board_id}), query, headers=headers)
+
+    async def read_ready_event(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = response.streaming_content
+        try:
+            self.assertEqual(await anext(stream), f'event: ready\ndata: {{"type": "ready", "board": {self.board.pk}}}\n\n'.encode())
+            self.assertEqual(get_event_broker().stats()['subscribers'], 1)
+        finally:
+            await stream.aclose()
+
+    async def test_member_with_token_header_gets_the_stream(self):
+        await self.read_ready_event(await self.get_stream(self.board.pk, self.tokens['member']))
+
+    async def test_without_credentials_is_unauthorized(self):
+        response = await self.get_stream(self.board.pk)
+        self.assertEqual(response.status_code, 401)
+
+    async def test_token_in_the_url_is_not_accepted(self):
+        response = await self.async_client.get(reverse('board_events', kwargs={'pk': self.board.pk}), {'token': self.tokens['member']})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_unknown_board_is_not_found(self):
+        response = await self.get_stream(0, self.tokens['owner'])
+        self.assertEqual(response.status_code, 404)
+
+    async def test_stranger_is_forbidden(self):
+        response = await self.get_stream(self.board.pk, self.tokens['stranger'])
+        self.assertEqual(response.status_code, 403)
+
+    async def test_ticket_opens_the_stream_of_its_board(self):
+        ticket = create_stream_ticket(self.board.pk, self.member.pk)
+        await self.read_ready_event(await self.get_stream(self.board.pk, ticket=ticket))
+
+    async def test_ticket_of_another_board_is_unauthorized(self):
+        ticket = create_stream_ticket(self.other_board.pk, self.owner.pk)
+        response = await self.get_stream(self.board.pk, ticket=ticket)
+        self.assertEqual(response.status_code, 401)
+
+    async def test_tampered_ticket_is_unauthorized(self):
+        ticket = create_stream_ticket(self.board.pk, self.member.pk)
+        response = await self.get_stream(self.board.pk, ticket=ticket[:-1] + ('A' if ticket[-1] != 'A' else 'B'))
+        self.assertEqual(response.status_code, 401)
+
+    def test_ticket_endpoint_checks_the_board_access(self):
+        client = APIClient()
+        client.force_authenticate(user=self.member)
+        response = client.get(reverse('board_event_ticket', kwargs={'pk': self.board.pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Cache-Control'], 'no-store')
+        self.assertEqual(response.data['expires_in'], 60)
+        client.force_authenticate(user=self.stranger)
+        response = client.get(reverse('board_event_ticket', kwargs={'pk': self.board.pk}))
+        self.assertEqual(response.status_code, 403)
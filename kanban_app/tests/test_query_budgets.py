@@ -0,0 +1,159 @@
+from io import StringIO
+
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.api.authentication import CachedTokenAuthentication, token_cache
+from kanban_app.api import urls as kanban_urls
+from kanban_app.benchmarks import QUERY_BUDGETS, seed_dataset
+from kanban_app.search import is_search_available, rebuild_search_index
+
+
+"""
+The `DATASET_SIZES` are the sizes of the datasets which every endpoint is requested with: the number of boards, members per board, tasks per board and comments per task. The number of queries may not depend on it.
+"""
+DATASET_SIZES = [2, 20]
+
+"""
+The `SKIPPED_ENDPOINTS` are the url names without a query budget, with the reason.
+"""
+SKIPPED_ENDPOINTS = {
+    'board_events': 'the event stream does not end, it is tested in test_events.py',
+}
+
+
+"""
+    The function `send_request` sends a request with the test client and reads the whole response, including the content of a streamed response.
+    :return: the response and its content
+    """
+def send_request(client, method, url, body=None):
+    if method == 'get':
+        response = client.get(url, body)
+    else:
+        response = getattr(client, method)(url, body, format='json')
+    content = b''.join(response.streaming_content) if response.streaming else response.content
+    return response, content
+
+
+"""
+The `QueryBudgetTests` class requests every endpoint with datasets of the sizes in `DATASET_SIZES` and asserts that it needs exactly the queries of its budget in `QUERY_BUDGETS`, so the number of queries cannot grow with the data. The requests run in the strict mode of the `RequestTimingMiddleware`, so a query which runs once per row raises `RepeatedQueryError` with the code which ran it.
+"""
+@override_settings(KANBAN_QUERY_REPEAT_STRICT=True)
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.datasets = {}
+        for size in DATASET_SIZES:
+            data = seed_dataset(size, prefix=f'size-{size}')
+            data['user'].is_staff = True
+            data['user'].save(update_fields=['is_staff'])
+            data['token'] = Token.objects.create(user=data['user']).key
+            cls.datasets[size] = data
+        call_command('reconcile_board_counters', stdout=StringIO())
+        if is_search_available():
+            rebuild_search_index()
+
+    def setUp(self):
+        cache.clear()
+        caches['responses'].clear()
+        token_cache.clear()
+
+    """
+    The function `assert_query_budgets` sends the requests of `QUERY_BUDGETS` with the given url name for every dataset and compares their number of queries with the budget.
+    """
+    def assert_query_budgets(self, url_name):
+        entries = [entry for entry in QUERY_BUDGETS if entry[2] == url_name]
+        self.assertTrue(entries, f'{url_name} has no query budget')
+        for size, data in self.datasets.items():
+            client = APIClient()
+            client.force_authenticate(user=data['user'])
+            client.credentials(HTTP_AUTHORIZATION=f'Token {data["token"]}')
+            CachedTokenAuthentication().authenticate_credentials(data['token'])
+            for name, method, entry_url_name, get_request, budget in entries:
+                kwargs, body = get_request(data)
+                url = reverse(url_name, kwargs=kwargs)
+                with self.subTest(name, size=size):
+                    with self.assertNumQueries(budget):
+                        response, content = send_request(client, method, url, body)
+                    self.assertLess(response.status_code, 400, content[:200])
+
+    def test_every_endpoint_has_a_budget(self):
+        url_names = {pattern.name for pattern in kanban_urls.urlpatterns}
+        self.assertEqual(url_names - set(SKIPPED_ENDPOINTS), {entry[2] for entry in QUERY_BUDGETS})
+
+    def test_boards_list(self):
+        self.assert_query_budgets('boards_list')
+
+    def test_board_detail(self):
+        self.assert_query_budgets('board_detail')
+
+    def test_board_changes(self):
+        self.assert_query_budgets('board_changes')
+
+    def test_board_analytics(self):
+        self.assert_query_budgets('board_analytics')
+
+    def test_board_event_ticket(self):
+        self.assert_query_budgets('board_event_ticket')
+
+    def test_board_history(self):
+        self.assert_query_budgets('board_history')
+
+    def test_board_export(self):
+        self.assert_query_budgets('board_export')
+
+    def test_task_list(self):
+        self.assert_query_budgets('task_list')
+
+    def test_task_batch(self):
+        self.assert_query_budgets('task_batch')
+
+    def test_task_search(self):
+        self.assert_query_budgets('task_search')
+
+    def test_my_assigned_tasks(self):
+        self.assert_query_budgets('my_assigned_tasks')
+
+    def test_reviewing_tasks(self):
+        self.assert_query_budgets('reviewing_tasks')
+
+    def test_task_detail(self):
+        self.assert_query_budgets('task_detail')
+
+    def test_task_comment_list(self):
+        self.assert_query_budgets('task_comment_list')
+
+    def test_task_comment_delete(self):
+        self.assert_query_budgets('task_comment_delete')
+
+    def test_email_check(self):
+        self.assert_query_budgets('email-check')
+
+    def test_email_check_bulk(self):
+        self.assert_query_budgets('email-check-bulk')
+
+    def test_response_cache_stats(self):
+        self.assert_query_budgets('response_cache_stats')
+
+    def test_event_broker_stats(self):
+        self.assert_query_budgets('event_broker_stats')
+
+    def test_async_boards_list(self):
+        self.assert_query_budgets('async_boards_list')
+
+    def test_async_board_detail(self):
+        self.assert_query_budgets('async_board_detail')
+
+    def test_async_my_assigned_tasks(self):
+        self.assert_query_budgets('async_my_assigned_tasks')
+
+    def test_async_reviewing_tasks(self):
+        self.assert_query_budgets('async_reviewing_tasks')
+
+    def test_async_task_comment_list(self):
+        self.assert_query_budgets('async_task_comment_list')
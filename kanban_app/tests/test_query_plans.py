@@ -0,0 +1,116 @@
+import re
+from io import StringIO
+from unittest import skipUnless
+
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from auth_app.api.authentication import CachedTokenAuthentication, token_cache
+from kanban_app.benchmarks import QUERY_BUDGETS, seed_dataset
+from kanban_app.search import is_search_available, rebuild_search_index
+
+from .test_query_budgets import send_request
+
+
+"""
+The `FULL_SCAN` pattern matches a step of a SQLite query plan which reads a whole table without an index.
+"""
+FULL_SCAN = re.compile(r'^SCAN (?!CONSTANT ROW)(\S+)$')
+
+SKIPPED_STATEMENTS = ('BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE', 'INSERT')
+
+
+"""
+    The function `explain` returns the steps of the SQLite query plan of a statement.
+    """
+def explain(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        return [row[-1] for row in cursor.fetchall()]
+
+
+"""
+    The function `find_full_scans` returns the statements of the captured queries whose query plan reads a whole table without an index, with the step of the plan.
+    """
+def find_full_scans(captured_queries):
+    full_scans = []
+    for query in captured_queries:
+        sql = query['sql']
+        if sql.lstrip().upper().startswith(SKIPPED_STATEMENTS):
+            continue
+        full_scans += [(sql, step) for step in explain(sql) if FULL_SCAN.match(step)]
+    return full_scans
+
+
+"""
+The `QueryPlanTests` class requests every endpoint of `QUERY_BUDGETS` with a seeded dataset, runs EXPLAIN QUERY PLAN on every query the ORM executed for it and fails when any of them reads a whole table without an index. The requests of every url name run in a savepoint which is rolled back, so they find the seeded data.
+"""
+@skipUnless(connection.vendor == 'sqlite', 'The query plans are only checked on SQLite.')
+class QueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.data = seed_dataset(5, prefix='plans')
+        cls.data['user'].is_staff = True
+        cls.data['user'].save(update_fields=['is_staff'])
+        cls.token = Token.objects.create(user=cls.data['user']).key
+        call_command('reconcile_board_counters', stdout=StringIO())
+        if is_search_available():
+            rebuild_search_index()
+
+    def setUp(self):
+        cache.clear()
+        caches['responses'].clear()
+        token_cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.data['user'])
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token}')
+        CachedTokenAuthentication().authenticate_credentials(self.token)
+
+    def test_no_full_table_scans(self):
+        url_names = list(dict.fromkeys(entry[2] for entry in QUERY_BUDGETS))
+        for url_name in url_names:
+            with transaction.atomic():
+                for name, method, entry_url_name, get_request, budget in QUERY_BUDGETS:
+                    if entry_url_name != url_name:
+                        continue
+                    kwargs, body = get_request(self.data)
+                    with self.subTest(name):
+                        with CaptureQueriesContext(connection) as context:
+                            response, content = send_request(self.client, method, reverse(url_name, kwargs=kwargs), body)
+                        self.assertLess(response.status_code, 400, content[:200])
+                        self.assertEqual(find_full_scans(context.captured_queries), [])
+                transaction.set_rollback(True)
+
+    """
+    The function `get_task_list_plan` requests the task list and returns the steps of the query plan of the query which finds the tasks of the page.
+    """
+    def get_task_list_plan(self, query):
+        with CaptureQueriesContext(connection) as context:
+            response, content = send_request(self.client, 'get', reverse('task_list'), query)
+        self.assertEqual(response.status_code, 200, content[:200])
+        statements = [item['sql'] for item in context.captured_queries if 'kanban_app_boardtask' in item['sql'] and 'LIMIT' in item['sql']]
+        self.assertEqual(len(statements), 1)
+        return explain(statements[0])
+
+    def test_task_list_of_few_tasks_reads_the_index_of_the_boards(self):
+        for ordering, index in [('created_at', 'task_board_created_idx'), ('-due_date', 'task_board_due_idx')]:
+            with self.subTest(ordering):
+                plan = self.get_task_list_plan({'ordering': ordering})
+                self.assertTrue(any(re.match(rf'^SEARCH \S+ USING (COVERING )?INDEX {index} \(board_id=\?\)$', step) for step in plan), plan)
+
+    """
+    Above `KANBAN_TASK_LIST_SORT_LIMIT` the board is compared as `board_id + 0`, so the tasks are read in the order of the index of the ordering instead of being sorted.
+    """
+    @override_settings(KANBAN_TASK_LIST_SORT_LIMIT=1)
+    def test_task_list_of_many_tasks_reads_the_index_of_the_ordering(self):
+        for ordering, index in [('created_at', 'task_created_idx'), ('-due_date', 'task_due_idx')]:
+            with self.subTest(ordering):
+                plan = self.get_task_list_plan({'ordering': ordering})
+                self.assertTrue(any(re.match(rf'^SCAN \S+ USING INDEX {index}$', step) for step in plan), plan)
@@ -0,0 +1,58 @@
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.db.models import Prefetch
+from django.test import TestCase
+
+from rest_framework.renderers import JSONRenderer
+
+from kanban_app.models import Board, BoardTask, TaskComment
+from kanban_app.api.read_serializers import BoardListRowSerializer, TaskListRowSerializer, serialize_board_detail
+from kanban_app.api.serializers import BoardDetailSerializer, BoardListSerializer, TaskListSerializer
+from kanban_app.api.services import board_list_values, get_boards_of_user, task_list_values, with_task_list_relations
+
+
+"""
+The `ReadSerializerContractTests` class checks that the read serializers in `kanban_app/api/read_serializers.py` render byte for byte the same JSON as the serializers of the REST framework. The boards contain the edge cases of the payloads: tasks without assignee or reviewer, with and without due date, empty and missing descriptions, unicode and emoji in titles and usernames, a user without name and email, tasks with and without comments and an empty board.
+"""
+class ReadSerializerContractTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='contract-owner', email='contract-owner@example.com')
+        member = User.objects.create(username='Zoë Müller', email='zoe@example.com')
+        nameless = User.objects.create(username='', email='')
+        board = Board.objects.create(title='Board „Ümlaut“ 🚀', owner=cls.user)
+        board.members.add(member, nameless, cls.user)
+        Board.objects.create(title='Empty Board', owner=cls.user)
+        tasks = [
+            BoardTask.objects.create(board=board, title='Täsk "quoted" \\ <b>', description='', status='to-do', priority='high', assignee=member, reviewer=cls.user, creator=cls.user, due_date=date(2025, 1, 31)),
+            BoardTask.objects.create(board=board, title='No assignee', description='Line 1\nLine 2\t✓', status='in-progress', priority='low', reviewer=nameless, creator=cls.user),
+            BoardTask.objects.create(board=board, title='No reviewer', description='', status='review', priority='medium', assignee=nameless, creator=cls.user, due_date=date(1999, 12, 1)),
+            BoardTask.objects.create(board=board, title='Nobody', description=None, status='done', priority='high', creator=cls.user),
+        ]
+        TaskComment.objects.create(task=tasks[0], author=member, content='First')
+        TaskComment.objects.create(task=tasks[0], author=cls.user, content='Second')
+        TaskComment.objects.create(task=tasks[2], author=nameless, content='Third')
+
+    """
+    The function `assertSameJSON` renders both payloads with the `JSONRenderer` of the responses and compares the bytes.
+    """
+    def assertSameJSON(self, expected, actual):
+        renderer = JSONRenderer()
+        self.assertEqual(renderer.render(actual), renderer.render(expected))
+
+    def test_task_list(self):
+        tasks = BoardTask.objects.filter(board__owner=self.user).order_by('id')
+        self.assertSameJSON(TaskListSerializer(with_task_list_relations(tasks), many=True).data, TaskListRowSerializer(task_list_values(tasks), many=True).data)
+
+    def test_board_list(self):
+        boards = get_boards_of_user(self.user).order_by('id')
+        self.assertSameJSON(BoardListSerializer(boards, many=True).data, BoardListRowSerializer(board_list_values(boards), many=True).data)
+
+    def test_board_detail(self):
+        tasks = with_task_list_relations(BoardTask.objects.order_by('id'))
+        for board in Board.objects.filter(owner=self.user).order_by('id').prefetch_related('members', Prefetch('tasks', queryset=tasks)):
+            with self.subTest(board.title):
+                members = User.objects.filter(boards__id=board.pk).only('id', 'username', 'email')
+                rows = task_list_values(BoardTask.objects.filter(board=board).order_by('id'))
+                self.assertSameJSON(BoardDetailSerializer(board).data, serialize_board_detail(board, members, rows))
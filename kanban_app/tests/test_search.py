@@ -0,0 +1,87 @@
+from collections import Counter
+from unittest import skipUnless
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from kanban_app.models import Board, BoardTask, TaskComment
+from kanban_app.search import COMMENT_SEPARATOR, SEARCH_TABLE, is_search_available, rebuild_search_index
+
+
+"""
+The `TaskSearchTests` class checks the ranking and the board scope of the full-text search and that the comments in the search table follow the created and deleted comments like a rebuild of the index.
+"""
+@skipUnless(is_search_available(), 'The full-text search needs SQLite.')
+class TaskSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner', email='owner@example.com')
+        cls.stranger = User.objects.create(username='stranger', email='stranger@example.com')
+        cls.board = Board.objects.create(title='Board', owner=cls.user)
+        cls.board.members.add(cls.user)
+        cls.member_board = Board.objects.create(title='Member Board', owner=cls.stranger)
+        cls.member_board.members.add(cls.stranger, cls.user)
+        cls.foreign_board = Board.objects.create(title='Foreign Board', owner=cls.stranger)
+        cls.foreign_board.members.add(cls.stranger)
+        cls.in_comment = cls.create_task(cls.board, 'Plain', 'Nothing here')
+        cls.in_description = cls.create_task(cls.board, 'Other', 'Fix the deployment script')
+        cls.in_title = cls.create_task(cls.board, 'Deployment pipeline', '')
+        cls.in_member_board = cls.create_task(cls.member_board, 'Deployment of the member board', '')
+        cls.in_foreign_board = cls.create_task(cls.foreign_board, 'Deployment of the foreign board', '')
+        TaskComment.objects.create(task=cls.in_comment, author=cls.user, content='Waiting for the deployment')
+        rebuild_search_index()
+
+    @classmethod
+    def create_task(cls, board, title, description):
+        return BoardTask.objects.create(board=board, title=title, description=description, status='to-do', priority='low', creator=board.owner)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def search(self, **query):
+        response = self.client.get(reverse('task_search'), query)
+        self.assertEqual(response.status_code, 200, response.content[:200])
+        return response.json()['results']
+
+    def get_indexed_comments(self, task):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT comments FROM {SEARCH_TABLE} WHERE rowid = %s', [task.pk])
+            return cursor.fetchone()[0]
+
+    def test_title_ranks_before_description_before_comments(self):
+        results = self.search(q='deployment', board=self.board.pk)
+        self.assertEqual([result['id'] for result in results], [self.in_title.pk, self.in_description.pk, self.in_comment.pk])
+        self.assertEqual(results[2]['snippet'], 'Waiting for the [deployment]')
+
+    def test_only_boards_of_the_user_are_searched(self):
+        self.assertEqual({result['id'] for result in self.search(q='deployment')}, {self.in_title.pk, self.in_description.pk, self.in_comment.pk, self.in_member_board.pk})
+        self.assertEqual([result['id'] for result in self.search(q='deployment', board=self.member_board.pk)], [self.in_member_board.pk])
+        self.assertEqual(self.search(q='deployment', board=self.foreign_board.pk), [])
+
+    def test_comments_are_added_and_removed_like_a_rebuild(self):
+        url = reverse('task_comment_list', kwargs={'task_id': self.in_title.pk})
+        ids = [self.client.post(url, {'content': content}, format='json').json()['id'] for content in ['ok', 'book keeping', 'ok', f'odd{COMMENT_SEPARATOR}separator']]
+        self.assertEqual([result['id'] for result in self.search(q='keeping')], [self.in_title.pk])
+        for comment_id in ids[:2]:
+            response = self.client.delete(reverse('task_comment_delete', kwargs={'task_id': self.in_title.pk, 'comment_id': comment_id}))
+            self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.search(q='keeping'), [])
+        self.assertEqual([result['id'] for result in self.search(q='ok', board=self.board.pk)], [self.in_title.pk])
+        self.assertEqual([result['id'] for result in self.search(q='separator')], [self.in_title.pk])
+        incremental = self.get_indexed_comments(self.in_title)
+        rebuild_search_index()
+        self.assertEqual(Counter(incremental.split(COMMENT_SEPARATOR)), Counter(self.get_indexed_comments(self.in_title).split(COMMENT_SEPARATOR)))
+        self.assertEqual(incremental, f'{COMMENT_SEPARATOR}ok{COMMENT_SEPARATOR}odd separator{COMMENT_SEPARATOR}')
+
+    def test_comment_of_a_task_without_row_indexes_the_task(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [self.in_description.pk])
+        response = self.client.post(reverse('task_comment_list', kwargs={'task_id': self.in_description.pk}), {'content': 'Rollback plan'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([result['id'] for result in self.search(q='rollback')], [self.in_description.pk])
+        self.assertEqual([result['id'] for result in self.search(q='script')], [self.in_description.pk])
@@ -0,0 +1,148 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from kanban_app.history import TRANSITION_FIELD_CODES, TRANSITION_VALUE_CODES
+from kanban_app.models import BOARD_COUNTER_FIELDS, Board, BoardTask, TaskTransition, Tombstone
+
+
+"""
+The `TaskBatchTests` class checks the task batch endpoint: the results of the items in the order of the batch, that an invalid item or a failed write leaves the whole batch unwritten, that the assignee and reviewer have to be members of the board, and that the counters, tombstones and history of the board follow the written tasks.
+"""
+class TaskBatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create(username='owner', email='owner@example.com')
+        cls.member = User.objects.create(username='member', email='member@example.com')
+        cls.stranger = User.objects.create(username='stranger', email='stranger@example.com')
+        cls.board = Board.objects.create(title='Board', owner=cls.owner)
+        cls.board.members.add(cls.owner, cls.member)
+        cls.other_board = Board.objects.create(title='Other Board', owner=cls.owner)
+        cls.todo = BoardTask.objects.create(board=cls.board, title='To Do', status='to-do', priority='high', creator=cls.owner)
+        cls.progress = BoardTask.objects.create(board=cls.board, title='In Progress', status='in-progress', priority='low', assignee=cls.member, creator=cls.member)
+        cls.done = BoardTask.objects.create(board=cls.board, title='Done', status='done', priority='medium', creator=cls.owner)
+        cls.other_task = BoardTask.objects.create(board=cls.other_board, title='Other', status='to-do', priority='low', creator=cls.owner)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.owner)
+
+    def send_batch(self, **items):
+        return self.client.post(reverse('task_batch'), {'board': self.board.pk, **items}, format='json')
+
+    def get_counters(self):
+        self.board.refresh_from_db(fields=BOARD_COUNTER_FIELDS)
+        return {field: getattr(self.board, field) for field in BOARD_COUNTER_FIELDS}
+
+    """
+    The function `get_board_state` returns everything a batch can write, to check that a failed batch wrote nothing.
+    """
+    def get_board_state(self):
+        return (
+            list(BoardTask.objects.filter(board=self.board).order_by('id').values_list('id', 'status', 'priority', 'assignee_id')),
+            self.get_counters(),
+            TaskTransition.objects.count(),
+            Tombstone.objects.count(),
+        )
+
+    def test_results_are_returned_per_item_in_the_order_of_the_batch(self):
+        response = self.send_batch(
+            create=[{'title': 'First', 'status': 'to-do', 'priority': 'low'}, {'title': 'Second', 'status': 'review', 'priority': 'high', 'assignee_id': self.member.pk}],
+            update=[{'id': self.progress.pk, 'status': 'review'}, {'id': self.todo.pk, 'priority': 'low'}],
+            delete=[self.done.pk],
+        )
+        self.assertEqual(response.status_code, 200, response.content[:200])
+        data = response.json()
+        self.assertEqual([task['title'] for task in data['created']], ['First', 'Second'])
+        self.assertEqual(data['created'][1]['assignee']['id'], self.member.pk)
+        self.assertEqual([(task['id'], task['status'], task['priority']) for task in data['updated']], [(self.progress.pk, 'review', 'low'), (self.todo.pk, 'to-do', 'low')])
+        self.assertEqual(data['deleted'], [self.done.pk])
+        self.assertEqual(set(BoardTask.objects.filter(board=self.board).values_list('id', flat=True)), {self.todo.pk, self.progress.pk, *[task['id'] for task in data['created']]})
+
+    def test_invalid_item_rejects_the_whole_batch(self):
+        state = self.get_board_state()
+        response = self.send_batch(
+            create=[{'title': 'Valid', 'status': 'to-do', 'priority': 'low'}],
+            update=[{'id': self.todo.pk, 'status': 'done'}, {'id': self.other_task.pk, 'status': 'done'}],
+            delete=[self.done.pk],
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'update': [{}, {'id': ['Task not found on this board.']}]})
+        self.assertEqual(self.get_board_state(), state)
+
+    def test_invalid_create_rejects_the_whole_batch(self):
+        state = self.get_board_state()
+        response = self.send_batch(
+            create=[{'title': 'Valid', 'status': 'to-do', 'priority': 'low'}, {'status': 'to-do', 'priority': 'low'}],
+            delete=[self.done.pk],
+        )
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()['create']
+        self.assertEqual(errors[0], {})
+        self.assertIn('title', errors[1])
+        self.assertEqual(self.get_board_state(), state)
+
+    def test_failed_write_rolls_back_the_whole_batch(self):
+        state = self.get_board_state()
+        with mock.patch('kanban_app.api.services.index_tasks', side_effect=RuntimeError('index failed')):
+            with self.assertRaises(RuntimeError):
+                self.send_batch(
+                    create=[{'title': 'New', 'status': 'to-do', 'priority': 'high'}],
+                    update=[{'id': self.todo.pk, 'status': 'done'}],
+                    delete=[self.done.pk],
+                )
+        self.assertEqual(self.get_board_state(), state)
+
+    def test_non_member_assignee_is_rejected(self):
+        state = self.get_board_state()
+        for items in [
+            {'update': [{'id': self.todo.pk, 'assignee_id': self.stranger.pk}]},
+            {'update': [{'id': self.todo.pk, 'reviewer_id': self.stranger.pk}]},
+            {'create': [{'title': 'New', 'status': 'to-do', 'priority': 'low', 'assignee_id': self.stranger.pk}]},
+        ]:
+            with self.subTest(items):
+                response = self.send_batch(**items)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(next(iter(items)), response.json())
+        self.assertEqual(self.get_board_state(), state)
+
+    def test_status_change_updates_the_counters_and_the_history(self):
+        response = self.send_batch(update=[{'id': self.todo.pk, 'status': 'review', 'priority': 'low'}])
+        self.assertEqual(response.status_code, 200, response.content[:200])
+        self.assertEqual(self.get_counters(), {'member_count': 2, 'ticket_count': 3, 'tasks_to_do_count': 0, 'tasks_high_prio_count': 0})
+        transitions = TaskTransition.objects.filter(task_id=self.todo.pk, old_value__isnull=False).order_by('field')
+        self.assertEqual(
+            [(row.field, row.old_value, row.new_value) for row in transitions],
+            [
+                (TRANSITION_FIELD_CODES['status'], TRANSITION_VALUE_CODES['status']['to-do'], TRANSITION_VALUE_CODES['status']['review']),
+                (TRANSITION_FIELD_CODES['priority'], TRANSITION_VALUE_CODES['priority']['high'], TRANSITION_VALUE_CODES['priority']['low']),
+            ],
+        )
+        self.assertFalse(Tombstone.objects.exists())
+
+    def test_delete_updates_the_counters_and_writes_tombstones(self):
+        transitions = TaskTransition.objects.count()
+        response = self.send_batch(delete=[self.todo.pk, self.done.pk])
+        self.assertEqual(response.status_code, 200, response.content[:200])
+        self.assertEqual(self.get_counters(), {'member_count': 2, 'ticket_count': 1, 'tasks_to_do_count': 0, 'tasks_high_prio_count': 0})
+        self.assertEqual(sorted(Tombstone.objects.filter(board=self.board, kind='task').values_list('object_id', flat=True)), [self.todo.pk, self.done.pk])
+        self.assertEqual(TaskTransition.objects.count(), transitions)
+        self.assertFalse(BoardTask.objects.filter(pk__in=[self.todo.pk, self.done.pk]).exists())
+
+    def test_create_updates_the_counters_and_the_history(self):
+        response = self.send_batch(create=[{'title': 'New', 'status': 'to-do', 'priority': 'high', 'assignee_id': self.member.pk}])
+        self.assertEqual(response.status_code, 200, response.content[:200])
+        task_id = response.json()['created'][0]['id']
+        self.assertEqual(self.get_counters(), {'member_count': 2, 'ticket_count': 4, 'tasks_to_do_count': 2, 'tasks_high_prio_count': 2})
+        self.assertEqual(
+            sorted(TaskTransition.objects.filter(task_id=task_id).values_list('field', 'old_value', 'new_value')),
+            sorted([
+                (TRANSITION_FIELD_CODES['status'], None, TRANSITION_VALUE_CODES['status']['to-do']),
+                (TRANSITION_FIELD_CODES['assignee'], None, self.member.pk),
+                (TRANSITION_FIELD_CODES['priority'], None, TRANSITION_VALUE_CODES['priority']['high']),
+            ]),
+        )
@@ -0,0 +1,100 @@
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from kanban_app.models import Board, BoardTask, TaskComment, TaskListVersion
+from kanban_app.response_cache import get_task_list_version, response_cache
+
+
+"""
+The `TaskListCacheTests` class checks that every write to a task or its comments changes the versions of the cached assigned and reviewing task lists of the assignee and the reviewer of the task in the database, so the next request of their lists is not answered from the cache of any process.
+"""
+class TaskListCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create(username='owner', email='owner@example.com')
+        cls.assignee = User.objects.create(username='assignee', email='assignee@example.com')
+        cls.reviewer = User.objects.create(username='reviewer', email='reviewer@example.com')
+        cls.board = Board.objects.create(title='Board', owner=cls.owner)
+        cls.board.members.add(cls.owner, cls.assignee, cls.reviewer)
+        cls.task = BoardTask.objects.create(board=cls.board, title='Task', status='to-do', priority='high', assignee=cls.assignee, reviewer=cls.reviewer, creator=cls.owner)
+
+    def setUp(self):
+        caches['responses'].clear()
+        self.client = APIClient()
+
+    """
+    The function `get_task_list` requests the assigned or the reviewing task list of a user and returns the tasks.
+    """
+    def get_task_list(self, user, url_name):
+        self.client.force_authenticate(user=user)
+        response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    """
+    The function `assert_task_lists_invalidated` caches the task lists of the assignee and the reviewer, runs the write as the owner and checks that both versions changed and both lists show the change.
+    :param write: a function which sends the write request with the client
+    :param check: a function which gets the tasks of a list after the write and checks them
+    """
+    def assert_task_lists_invalidated(self, write, check):
+        lists = [(self.assignee, 'my_assigned_tasks'), (self.reviewer, 'reviewing_tasks')]
+        versions = {}
+        for user, url_name in lists:
+            self.assertEqual([task['id'] for task in self.get_task_list(user, url_name)], [self.task.pk])
+            self.get_task_list(user, url_name)
+            versions[user.pk] = get_task_list_version(user.pk)
+        self.client.force_authenticate(user=self.owner)
+        response = write()
+        self.assertLess(response.status_code, 400, response.content[:200])
+        for user, url_name in lists:
+            with self.subTest(url_name):
+                self.assertNotEqual(get_task_list_version(user.pk), versions[user.pk])
+                check(self.get_task_list(user, url_name))
+
+    def test_task_patch(self):
+        self.assert_task_lists_invalidated(
+            lambda: self.client.patch(reverse('task_detail', kwargs={'pk': self.task.pk}), {'status': 'done'}, format='json'),
+            lambda tasks: self.assertEqual(tasks[0]['status'], 'done'),
+        )
+
+    def test_task_delete(self):
+        self.assert_task_lists_invalidated(
+            lambda: self.client.delete(reverse('task_detail', kwargs={'pk': self.task.pk})),
+            lambda tasks: self.assertEqual(tasks, []),
+        )
+
+    def test_comment_create(self):
+        self.assert_task_lists_invalidated(
+            lambda: self.client.post(reverse('task_comment_list', kwargs={'task_id': self.task.pk}), {'content': 'New Comment'}, format='json'),
+            lambda tasks: self.assertEqual(tasks[0]['comments_count'], 1),
+        )
+
+    def test_comment_delete(self):
+        comment = TaskComment.objects.create(task=self.task, author=self.owner, content='Comment')
+        self.assert_task_lists_invalidated(
+            lambda: self.client.delete(reverse('task_comment_delete', kwargs={'task_id': self.task.pk, 'comment_id': comment.pk})),
+            lambda tasks: self.assertEqual(tasks[0]['comments_count'], 0),
+        )
+
+    def test_batch_update(self):
+        self.assert_task_lists_invalidated(
+            lambda: self.client.post(reverse('task_batch'), {'board': self.board.pk, 'update': [{'id': self.task.pk, 'priority': 'low'}]}, format='json'),
+            lambda tasks: self.assertEqual(tasks[0]['priority'], 'low'),
+        )
+
+    def test_batch_delete(self):
+        self.assert_task_lists_invalidated(
+            lambda: self.client.post(reverse('task_batch'), {'board': self.board.pk, 'delete': [self.task.pk]}, format='json'),
+            lambda tasks: self.assertEqual(tasks, []),
+        )
+
+    def test_version_changed_by_another_process_is_not_served_from_the_cache(self):
+        self.get_task_list(self.assignee, 'my_assigned_tasks')
+        TaskListVersion.objects.update_or_create(user_id=self.assignee.pk, defaults={'version': 1})
+        misses = response_cache.misses
+        self.get_task_list(self.assignee, 'my_assigned_tasks')
+        self.assertEqual(response_cache.misses, misses + 1)
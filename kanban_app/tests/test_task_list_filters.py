@@ -0,0 +1,101 @@
+from datetime import date
+from itertools import cycle
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from kanban_app.api.services import TASK_LIST_ORDERINGS
+from kanban_app.models import Board, BoardTask
+
+
+"""
+The `TaskListFilterTests` class checks that every filter and every ordering of the task list returns exactly the tasks and the order which the same filter returns in Python, and that the tasks of boards where the user is no member are never returned, also when such a board is asked for.
+"""
+class TaskListFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username='owner', email='owner@example.com')
+        cls.member = User.objects.create(username='member', email='member@example.com')
+        cls.stranger = User.objects.create(username='stranger', email='stranger@example.com')
+        cls.board = Board.objects.create(title='Board', owner=cls.user)
+        cls.board.members.add(cls.user, cls.member)
+        cls.member_board = Board.objects.create(title='Member Board', owner=cls.member)
+        cls.member_board.members.add(cls.member, cls.user)
+        cls.foreign_board = Board.objects.create(title='Foreign Board', owner=cls.stranger)
+        cls.foreign_board.members.add(cls.stranger)
+        statuses = cycle(['to-do', 'in-progress', 'review', 'done'])
+        priorities = cycle(['low', 'medium', 'high'])
+        users = cycle([cls.user, cls.member, None])
+        due_dates = cycle([date(2025, 1, 10), None, date(2025, 3, 1), date(2024, 12, 24), date(2025, 1, 10)])
+        for board in (cls.board, cls.member_board, cls.foreign_board):
+            for i in range(8):
+                BoardTask.objects.create(
+                    board=board, title=f'{board.title} {i}', status=next(statuses), priority=next(priorities),
+                    assignee=next(users) if board != cls.foreign_board else cls.stranger, reviewer=next(users) if board != cls.foreign_board else None,
+                    due_date=next(due_dates), creator=board.owner,
+                )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def get_task_ids(self, query):
+        response = self.client.get(reverse('task_list'), {**query, 'paginate': 'false'})
+        self.assertEqual(response.status_code, 200, response.content[:200])
+        return [task['id'] for task in response.json()]
+
+    """
+    The function `get_expected_ids` filters and orders the tasks of the boards of the user in Python, with the null due dates first in ascending order like SQLite.
+    """
+    def get_expected_ids(self, predicate=lambda task: True, ordering='created_at'):
+        tasks = [task for task in BoardTask.objects.filter(board__in=[self.board, self.member_board]) if predicate(task)]
+        field = ordering.lstrip('-')
+        key = (lambda task: (task.due_date is not None, task.due_date or date.min, task.pk)) if field == 'due_date' else (lambda task: (task.created_at, task.pk))
+        return [task.pk for task in sorted(tasks, key=key, reverse=ordering.startswith('-'))]
+
+    def test_filters(self):
+        cases = [
+            ({'status': 'to-do,review'}, lambda task: task.status in ('to-do', 'review')),
+            ({'priority': 'high'}, lambda task: task.priority == 'high'),
+            ({'assignee': self.member.pk}, lambda task: task.assignee_id == self.member.pk),
+            ({'reviewer': f'{self.user.pk},{self.member.pk}'}, lambda task: task.reviewer_id in (self.user.pk, self.member.pk)),
+            ({'due_date_after': '2025-01-10'}, lambda task: task.due_date is not None and task.due_date >= date(2025, 1, 10)),
+            ({'due_date_before': '2025-01-10'}, lambda task: task.due_date is not None and task.due_date <= date(2025, 1, 10)),
+            ({'due_date_after': '2025-01-01', 'due_date_before': '2025-02-01'}, lambda task: task.due_date == date(2025, 1, 10)),
+            ({'board': self.member_board.pk}, lambda task: task.board_id == self.member_board.pk),
+            ({'board': self.board.pk, 'status': 'done', 'priority': 'low,medium'}, lambda task: task.board_id == self.board.pk and task.status == 'done' and task.priority in ('low', 'medium')),
+        ]
+        for query, predicate in cases:
+            with self.subTest(query):
+                expected = self.get_expected_ids(predicate)
+                self.assertTrue(expected)
+                self.assertEqual(self.get_task_ids(query), expected)
+
+    def test_orderings(self):
+        for ordering in TASK_LIST_ORDERINGS:
+            with self.subTest(ordering):
+                self.assertEqual(self.get_task_ids({'ordering': ordering}), self.get_expected_ids(ordering=ordering))
+
+    """
+    Above `KANBAN_TASK_LIST_SORT_LIMIT` the tasks are found with another query, which has to return the same rows in the same order.
+    """
+    @override_settings(KANBAN_TASK_LIST_SORT_LIMIT=1)
+    def test_orderings_of_many_tasks(self):
+        for ordering in TASK_LIST_ORDERINGS:
+            for query, predicate in [({}, lambda task: True), ({'due_date_after': '2025-01-01'}, lambda task: task.due_date is not None and task.due_date >= date(2025, 1, 1))]:
+                with self.subTest(ordering, **query):
+                    self.assertEqual(self.get_task_ids({**query, 'ordering': ordering}), self.get_expected_ids(predicate, ordering))
+
+    def test_boards_of_other_users_are_excluded(self):
+        self.assertEqual(self.get_task_ids({'board': self.foreign_board.pk}), [])
+        self.assertEqual(self.get_task_ids({'board': f'{self.foreign_board.pk},{self.board.pk}'}), self.get_expected_ids(lambda task: task.board_id == self.board.pk))
+        self.assertEqual(self.get_task_ids({'assignee': self.stranger.pk}), [])
+
+    def test_invalid_filters_are_rejected(self):
+        for query in [{'status': 'unknown'}, {'ordering': 'title'}, {'board': 'abc'}, {'due_date_after': '2025-02-01', 'due_date_before': '2025-01-01'}]:
+            with self.subTest(query):
+                response = self.client.get(reverse('task_list'), query)
+                self.assertEqual(response.status_code, 400)
@@ -0,0 +1,74 @@
+import inspect
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import path
+
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer
+from rest_framework.views import APIView
+
+from auth_app.api import serializers as auth_serializers, urls as auth_urls
+from kanban_app.api import serializers as kanban_serializers, urls as kanban_urls
+from kanban_app.models import Board
+from kanban_app.timing import RepeatedQueryError, TimedSerializerMixin, TimedViewMixin
+
+
+"""
+The `BoardOwnersView` class loads the owner of every board with its own query (N+1), so the `RequestTimingMiddleware` has something to find.
+"""
+class BoardOwnersView(TimedViewMixin, APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        return Response([board.owner.username for board in Board.objects.order_by('id')])
+
+
+urlpatterns = [
+    path('board-owners/', BoardOwnersView.as_view()),
+]
+
+
+"""
+The `RequestTimingTests` class checks that the `RequestTimingMiddleware` counts the queries of a request and reports a query which runs once per row.
+"""
+@override_settings(ROOT_URLCONF='kanban_app.tests.test_timing', KANBAN_QUERY_REPEAT_LIMIT=10)
+class RequestTimingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owners = User.objects.bulk_create([User(username=f'owner-{i}', email=f'owner-{i}@example.com') for i in range(12)])
+        Board.objects.bulk_create([Board(title=f'Board {i}', owner=owner) for i, owner in enumerate(owners)])
+
+    @override_settings(KANBAN_QUERY_REPEAT_STRICT=True)
+    def test_query_per_row_raises_in_strict_mode(self):
+        with self.assertRaises(RepeatedQueryError):
+            self.client.get('/board-owners/')
+
+    def test_query_per_row_is_logged(self):
+        with self.assertLogs('kanban_app.requests', 'WARNING') as logs:
+            response = self.client.get('/board-owners/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('The query ran more than 10 times in GET /board-owners/', logs.output[0])
+        self.assertIn('desc="13 queries"', response['Server-Timing'])
+        for name in ('db', 'permissions', 'serialize', 'total'):
+            self.assertIn(f'{name};dur=', response['Server-Timing'])
+
+
+"""
+The `TimedClassesTests` class checks that every view of the REST framework in the urls of the API and every serializer of the API is measured, so a new one cannot forget the mixins of `kanban_app/timing.py`.
+"""
+class TimedClassesTests(SimpleTestCase):
+    def test_every_api_view_is_timed(self):
+        for pattern in [*auth_urls.urlpatterns, *kanban_urls.urlpatterns]:
+            view_class = getattr(pattern.callback, 'cls', None)
+            if view_class is not None and issubclass(view_class, APIView):
+                with self.subTest(pattern.name):
+                    self.assertTrue(issubclass(view_class, TimedViewMixin))
+
+    def test_every_api_serializer_is_timed(self):
+        for module in (auth_serializers, kanban_serializers):
+            for name, serializer_class in inspect.getmembers(module, inspect.isclass):
+                if serializer_class.__module__ == module.__name__ and issubclass(serializer_class, BaseSerializer):
+                    with self.subTest(name):
+                        self.assertTrue(issubclass(serializer_class, TimedSerializerMixin))
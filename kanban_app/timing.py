@@ -0,0 +1,217 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from rest_framework.fields import empty
+
+
+logger = logging.getLogger('kanban_app.requests')
+
+"""
+The `TIMING_NAMES` are the measured parts of a request in the order of the `Server-Timing` header. The time of the queries also counts for the part in which they run, f.e. the queries of a permission class.
+"""
+TIMING_NAMES = ['db', 'permissions', 'serialize']
+
+"""
+The `IN_LIST` pattern matches a list of placeholders, so `IN (%s, %s)` and `IN (%s, %s, %s)` have the same query shape.
+"""
+IN_LIST = re.compile(r'\(\s*%s(?:\s*,\s*%s)*\s*\)')
+
+SKIPPED_STATEMENTS = ('SAVEPOINT', 'RELEASE', 'ROLLBACK')
+
+
+"""
+The `request_timings` contains the `RequestTimings` of the current request. It is also visible in the threads of `sync_to_async`, so the queries of the async views are counted as well.
+"""
+request_timings = ContextVar('request_timings', default=None)
+
+
+"""
+The `RepeatedQueryError` exception is raised in the strict mode when the same query shape runs more often in one request than `KANBAN_QUERY_REPEAT_LIMIT`, which is usually a query per row (N+1).
+"""
+class RepeatedQueryError(Exception):
+    pass
+
+
+"""
+The `RequestTimings` class collects the number of queries, the times of the measured parts and the number of runs of every query shape of one request.
+"""
+class RequestTimings:
+    def __init__(self, repeat_limit, strict):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.durations = dict.fromkeys(TIMING_NAMES, 0.0)
+        self.running = set()
+        self.shapes = Counter()
+        self.repeated = []
+        self.repeat_limit = repeat_limit
+        self.strict = strict
+
+    """
+    The function `count_query` counts a query by its shape, which is the SQL without the number of placeholders in lists. When the shape runs once more than the limit, it is remembered, or raised in the strict mode before the query runs.
+    """
+    def count_query(self, sql):
+        self.queries += 1
+        if self.repeat_limit is None or sql.lstrip().upper().startswith(SKIPPED_STATEMENTS):
+            return
+        shape = IN_LIST.sub('(%s)', sql)
+        self.shapes[shape] += 1
+        if self.shapes[shape] == self.repeat_limit + 1:
+            if self.strict:
+                raise RepeatedQueryError(f'The query ran more than {self.repeat_limit} times in one request: {shape}')
+            self.repeated.append(shape)
+
+    def total(self):
+        return time.perf_counter() - self.start
+
+    def get_server_timing(self):
+        parts = [f'db;dur={self.durations["db"] * 1000:.1f};desc="{self.queries} queries"']
+        parts += [f'{name};dur={self.durations[name] * 1000:.1f}' for name in TIMING_NAMES[1:]]
+        parts.append(f'total;dur={self.total() * 1000:.1f}')
+        return ', '.join(parts)
+
+    def get_log_data(self, request, response):
+        match = getattr(request, 'resolver_match', None)
+        return {
+            'method': request.method,
+            'path': request.path,
+            'route': match.route if match else None,
+            'status': response.status_code,
+            'queries': self.queries,
+            **{f'{name}_ms': round(self.durations[name] * 1000, 2) for name in TIMING_NAMES},
+            'total_ms': round(self.total() * 1000, 2),
+            'repeated_queries': self.repeated,
+        }
+
+
+"""
+    The function `timed` measures the time of a part of the current request, as context manager or as decorator. A nested measurement of the same part is not counted twice, f.e. a serializer inside of another serializer. Outside of a request it does nothing.
+    :param name: one of `TIMING_NAMES`
+    """
+@contextmanager
+def timed(name):
+    timings = request_timings.get()
+    if timings is None or name in timings.running:
+        yield
+        return
+    timings.running.add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.durations[name] += time.perf_counter() - start
+        timings.running.discard(name)
+
+
+"""
+    The function `record_query` is the execute wrapper of every database connection. It counts the query and its time for the current request.
+    """
+def record_query(execute, sql, params, many, context):
+    timings = request_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    timings.count_query(sql)
+    with timed('db'):
+        return execute(sql, params, many, context)
+
+
+def add_query_recorder(sender=None, connection=None, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+"""
+    The function `install_query_recorder` adds `record_query` to the open and all future database connections. It runs once per process.
+    """
+def install_query_recorder():
+    connection_created.connect(add_query_recorder, dispatch_uid='timing_query_recorder')
+    for connection in connections.all(initialized_only=True):
+        add_query_recorder(connection=connection)
+
+
+"""
+The `TimedViewMixin` class measures the authentication and the permission checks of a view of the REST framework as `permissions`. The rendering of its response is measured by the `RequestTimingMiddleware`.
+"""
+class TimedViewMixin:
+    def initial(self, request, *args, **kwargs):
+        with timed('permissions'):
+            super().initial(request, *args, **kwargs)
+
+    def check_object_permissions(self, request, obj):
+        with timed('permissions'):
+            super().check_object_permissions(request, obj)
+
+
+"""
+The `TimedSerializerMixin` class measures the validation and the representation of a serializer as `serialize`. It also measures the serializer in a list with `many=True`, and a nested serializer only once.
+"""
+class TimedSerializerMixin:
+    def run_validation(self, data=empty):
+        with timed('serialize'):
+            return super().run_validation(data)
+
+    def to_representation(self, instance):
+        with timed('serialize'):
+            return super().to_representation(instance)
+
+
+"""
+The `RequestTimingMiddleware` class measures every request: the number and the time of the queries, the time of the permission checks and of the serializers (see `TimedViewMixin` and `TimedSerializerMixin`), the rendering of the responses of the REST framework and of templates in `process_template_response`, and the total time. They are sent in the `Server-Timing` header and logged as one JSON line on the logger `kanban_app.requests`. A query shape which runs more often than `KANBAN_QUERY_REPEAT_LIMIT` in one request is logged as warning, or raises `RepeatedQueryError` with `KANBAN_QUERY_REPEAT_STRICT` (for tests). Streamed responses are measured until the view returns them, without the streamed content.
+"""
+class RequestTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        install_query_recorder()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings, token = self.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            request_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        timings, token = self.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    """
+    The function `process_template_response` renders the response of the view before Django does, so the rendering is measured as `serialize`. Django does not render it again.
+    """
+    def process_template_response(self, request, response):
+        if not response.is_rendered:
+            with timed('serialize'):
+                response.render()
+        return response
+
+    def start(self):
+        timings = RequestTimings(getattr(settings, 'KANBAN_QUERY_REPEAT_LIMIT', None), getattr(settings, 'KANBAN_QUERY_REPEAT_STRICT', False))
+        return timings, request_timings.set(timings)
+
+    def finish(self, request, response, timings):
+        response['Server-Timing'] = timings.get_server_timing()
+        for shape in timings.repeated:
+            logger.warning('The query ran more than %s times in %s %s: %s', timings.repeat_limit, request.method, request.path, shape)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps(timings.get_log_data(request, response)))
+        return response